@@ -0,0 +1,7 @@
+# mypy: ignore-errors
+DEBUG = True
+SECRET_KEY = 'unittests'
+DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}}
+FASTER_UNITTESTS = True
+NODE_SIGNING_KEY = '0000000000000000000000000000000000000000000000000000000000000000'
+IS_LOCAL_SETTINGS_FILE_APPLIED = True
@@ -1,4 +1,5 @@
 import random
+from unittest.mock import patch
 from urllib.parse import urlencode
 
 from thenewboston_node.business_logic.models import Block
@@ -74,3 +75,37 @@ def test_can_list_transactions(
             'amount': 1,
             'is_fee': True,
         }.items()
+
+
+def test_list_transactions_reads_only_requested_page(
+    api_client, file_blockchain, treasury_account_key_pair, user_account_key_pair, preferred_node
+):
+    blockchain = file_blockchain
+    user_account_number = user_account_key_pair.public
+    pv_signing_key = blockchain._test_primary_validator_key_pair.private
+
+    amounts = list(range(100, 110))
+    for amount in amounts:
+        block = Block.create_from_main_transaction(
+            blockchain=blockchain,
+            recipient=user_account_number,
+            amount=amount,
+            request_signing_key=treasury_account_key_pair.private,
+            pv_signing_key=pv_signing_key,
+            preferred_node=preferred_node,
+        )
+        blockchain.add_block(block)
+
+    assert blockchain.get_up_to_date_transaction_index() is not None
+    url = API_V1_LIST_TRANSACTIONS_URL_PATTERN.format(id=user_account_number)
+    with force_blockchain(blockchain), as_primary_validator():
+        with patch.object(blockchain, 'get_block_by_number', wraps=blockchain.get_block_by_number) as mock:
+            response = api_client.get(url + '?' + urlencode({'limit': 3, 'offset': 2}))
+
+        assert response.status_code == 200
+        assert [item['amount'] for item in response.json()['results']] == amounts[2:5]
+        assert mock.call_count == 3
+
+        response = api_client.get(url + '?' + urlencode({'limit': 3, 'offset': 2, 'ordering': '-block_number'}))
+        assert response.status_code == 200
+        assert [item['amount'] for item in response.json()['results']] == amounts[::-1][2:5]
@@ -39,4 +39,4 @@ class NodeViewSet(ReadOnlyModelViewSet):
 
     def get_queryset(self):
         blockchain = BlockchainBase.get_instance()
-        return AdvancedIterator(blockchain.yield_nodes(), count=blockchain.get_nodes_count)
+        return AdvancedIterator(blockchain.yield_nodes_slice, count=blockchain.get_nodes_count)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from rest_framework.mixins import ListModelMixin
 from rest_framework.viewsets import GenericViewSet
 
@@ -18,7 +20,8 @@ class TransactionViewSet(ListModelMixin, GenericViewSet):
         account_id = self.kwargs.get('id')
         blockchain = BlockchainBase.get_instance()
 
+        # Slices are propagated to the blockchain, so only transactions of the requested page are read
         return AdvancedIterator(
-            source=blockchain.yield_transactions(account_id=account_id),
-            reversed_source=blockchain.yield_transactions(account_id=account_id, is_reversed=True)
+            source=partial(blockchain.yield_transactions_slice, account_id),
+            reversed_source=partial(blockchain.yield_transactions_slice, account_id, is_reversed=True)
         )
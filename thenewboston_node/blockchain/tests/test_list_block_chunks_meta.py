@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from urllib.parse import urlencode
 
 import pytest
@@ -349,3 +350,22 @@ def test_filter_by_block_number_range(
     assert len(filtered_block_chunks) == len(block_chunk_map)
     for filtered_index, original_index in block_chunk_map.items():
         assert block_chunks[original_index] == filtered_block_chunks[filtered_index]
+
+
+def test_block_chunk_meta_is_built_for_requested_page_only(api_client, file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    get_meta = blockchain._get_block_chunk_file_path_meta_enhanced
+    with force_blockchain(blockchain), as_primary_validator():
+        with patch.object(blockchain, '_get_block_chunk_file_path_meta_enhanced', side_effect=get_meta) as mock:
+            response = api_client.get(
+                API_V1_LIST_BLOCKCHAIN_STATE_URL + '?' + urlencode({
+                    'from_block_number': 4,
+                    'limit': 1,
+                    'offset': 1,
+                    'ordering': '-start_block_number'
+                })
+            )
+
+    assert response.status_code == 200
+    assert [item['start_block_number'] for item in response.json()['results']] == [3]
+    mock.assert_called_once()
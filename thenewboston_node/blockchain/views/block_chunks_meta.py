@@ -1,3 +1,5 @@
+from functools import partial
+
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.mixins import ListModelMixin
 from rest_framework.viewsets import GenericViewSet
@@ -34,7 +36,10 @@ class BlockChunksMetaViewSet(ListModelMixin, GenericViewSet):
         if not isinstance(blockchain, FileBlockchain):
             raise NotImplementAPIError(f'End-point is not available for {blockchain.__class__.__name__}')
 
+        # Slices and block number filters are propagated to the blockchain, so only meta of the requested page
+        # is built
         return AdvancedIterator(
-            source=blockchain.yield_block_chunks_meta(),
-            reversed_source=blockchain.yield_block_chunks_meta(direction=-1),
+            source=blockchain.yield_block_chunks_meta_slice,
+            reversed_source=partial(blockchain.yield_block_chunks_meta_slice, direction=-1),
+            query_filters=('from_block_number', 'to_block_number'),
         )
@@ -1,3 +1,5 @@
+from functools import partial
+
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.exceptions import NotFound
 from rest_framework.viewsets import ReadOnlyModelViewSet
@@ -27,10 +29,11 @@ class BlockchainStatesMetaViewSet(ReadOnlyModelViewSet):
 
     def get_queryset(self):
         blockchain = BlockchainBase.get_instance()
+        # Blockchain states stored as deltas are not advertised, since they can not be used by other nodes
         return AdvancedIterator(
-            source=blockchain.yield_blockchain_states(lazy=True),
-            reversed_source=blockchain.yield_blockchain_states_reversed(lazy=True),
-            count=blockchain.get_blockchain_state_count
+            source=partial(blockchain.yield_full_blockchain_states_slice, lazy=True),
+            reversed_source=partial(blockchain.yield_full_blockchain_states_slice, direction=-1, lazy=True),
+            count=blockchain.get_full_blockchain_state_count
         )
 
     def get_object(self):
@@ -52,6 +55,6 @@ class BlockchainStatesMetaViewSet(ReadOnlyModelViewSet):
         except ValueError:
             raise NotFound()
 
-        if blockchain_state.last_block_number == block_number:
+        if blockchain_state.last_block_number == block_number and not (blockchain_state.meta or {}).get('is_delta'):
             return blockchain_state
         raise NotFound()
@@ -10,7 +10,6 @@ from thenewboston_node.blockchain.serializers.signed_change_request import (
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
 from thenewboston_node.business_logic.enums import NodeRole
 from thenewboston_node.business_logic.exceptions import ValidationError
-from thenewboston_node.business_logic.models import Block
 from thenewboston_node.business_logic.models.constants import BlockType
 from thenewboston_node.business_logic.node import get_node_identifier, get_node_signing_key
 from thenewboston_node.core.clients.node import NodeClient
@@ -41,12 +40,9 @@ class SignedChangeRequestViewSet(CreateModelMixin, GenericViewSet):
 
         if blockchain.get_node_role(get_node_identifier()) == NodeRole.PRIMARY_VALIDATOR:
             try:
-                block = Block.create_from_signed_change_request(
-                    blockchain,
-                    signed_change_request=signed_change_request,
-                    pv_signing_key=get_node_signing_key(),
+                blockchain.add_block_from_signed_change_request(
+                    signed_change_request, pv_signing_key=get_node_signing_key()
                 )
-                blockchain.add_block(block)
             except ValidationError as ex:
                 # TODO(dmu) MEDIUM: Why can't we just do `raise DRFValidationError(str(ex))` ?
                 raise DRFValidationError({api_settings.NON_FIELD_ERRORS_KEY: [str(ex)]})
@@ -1,7 +1,9 @@
 import logging
+from itertools import islice
 from typing import Generator, Optional
 
 from cachetools import TTLCache
+from more_itertools import ilen
 
 from thenewboston_node.core.clients.node import NodeClient
 
@@ -45,6 +47,13 @@ class APIBlockchain(BlockchainBase):
 
             offset += len(nodes)
 
+    def get_nodes_count(self, block_number: Optional[int] = None) -> int:
+        return ilen(self.yield_nodes(block_number=block_number))
+
+    def yield_nodes_slice(self, slice_: slice, block_number: Optional[int] = None) -> Generator[Node, None, None]:
+        # Nodes are requested from the API, so there is no local node registry
+        yield from islice(self.yield_nodes(block_number=block_number), slice_.start, slice_.stop, slice_.step)
+
     def get_last_blockchain_state_last_block_number(self) -> int:
         meta = NodeClient.get_instance().get_latest_blockchain_state_meta_by_network_address(self.network_address)
         if not meta:
@@ -22,6 +22,7 @@ class BlockchainBase(ValidationMixin, BlockchainStateMixin, BlocksMixin, Account
     def __init__(self, snapshot_period_in_blocks=None, blockchain_state_signing_key=None):
         self.snapshot_period_in_blocks = snapshot_period_in_blocks
         self.blockchain_state_signing_key = blockchain_state_signing_key
+        self._blockchain_index_cache: dict = {}
 
     @classmethod
     def get_instance(cls: Type[T]) -> T:
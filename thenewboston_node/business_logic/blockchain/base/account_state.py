@@ -1,6 +1,6 @@
 import logging
 import warnings
-from itertools import chain
+from itertools import chain, islice
 from typing import Optional
 
 from more_itertools import ilen
@@ -169,3 +169,9 @@ class AccountStateMixin(BaseMixin):
             # TODO: implement sync initialization or otherwise redirection of client to get the entire
             # list of transaction from somewhere else, for example from current PV
             raise NotImplementedError('Yielding transactions from incomplete blockchain is not implemented')
+
+    def yield_transactions_slice(self, account_id, slice_: slice, is_reversed=False):
+        # Override this method if a particular blockchain implementation can provide a high performance
+        yield from islice(
+            self.yield_transactions(account_id, is_reversed=is_reversed), slice_.start, slice_.stop, slice_.step
+        )
@@ -0,0 +1,140 @@
+import json
+import logging
+from copy import copy
+from typing import Iterable, Optional
+
+from thenewboston_node.business_logic.models import AccountState, Block, BlockchainState
+from thenewboston_node.core.utils.os import replace_durably
+from thenewboston_node.core.utils.types import hexstr
+
+from .index import BlockchainIndex
+from .view import BlockchainView
+
+logger = logging.getLogger(__name__)
+
+
+class AccountStateReplay(BlockchainIndex):
+    """
+    Account states as of `last_block_number` replayed from a blockchain state and blocks after it. Account states
+    of the blockchain state are shared until changed by a block
+    """
+
+    def __init__(self, blockchain_state: BlockchainState):
+        self.account_states: dict[hexstr, AccountState] = {}
+        self._copied_accounts: set[hexstr] = set()
+        self.last_block: Optional[Block] = None
+
+        super().__init__(blockchain_state)
+
+    def copy(self):
+        replay = super().copy()
+        replay.account_states = self.account_states.copy()
+        replay._copied_accounts = set()
+        return replay
+
+    def apply_account_states(self, block_number: int, account_states: Iterable[tuple[hexstr, AccountState]]):
+        if block_number == self.blockchain_state.last_block_number:
+            self.account_states.update(account_states)
+            return
+
+        for account, block_account_state in account_states:
+            if account not in self._copied_accounts:
+                account_state = self.account_states.get(account)
+                self.account_states[account] = AccountState() if account_state is None else copy(account_state)
+                self._copied_accounts.add(account)
+
+            account_state = self.account_states[account]
+            for attribute in AccountState.get_field_names():  # type: ignore
+                # Values are replaced (never changed in place), so they can be shared with the block
+                value = getattr(block_account_state, attribute)
+                if value is not None:
+                    setattr(account_state, attribute, value)
+
+    def apply_block(self, block: Block):
+        super().apply_block(block)
+        self.last_block = block
+
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str):
+        account_state = self.account_states.get(account)
+        if account_state is None:
+            from thenewboston_node.business_logic.utils.blockchain import get_attribute_default_value
+            return get_attribute_default_value(attribute, account)
+
+        return account_state.get_attribute_value(attribute, account)
+
+    def get_next_block_identifier(self) -> hexstr:
+        return self.last_block_hash or self.blockchain_state.next_block_identifier
+
+
+class ReplayBlockchainView(BlockchainView):
+    """
+    Blockchain as seen by a block being validated during the audit: account states, the previous block and the
+    expected block identifier are taken from the replay, everything else is read from the blockchain
+    """
+
+    def __init__(self, blockchain, replay: AccountStateReplay):
+        super().__init__(blockchain)
+        self.replay = replay
+        self.block: Optional[Block] = None
+
+    def begin_block(self, block: Block):
+        self.block = block
+        return self
+
+    def apply_block(self, block: Block):
+        self.replay.apply_block(block)
+        self.block = None
+
+    def get_block_by_number(self, block_number: int) -> Optional[Block]:
+        replay = self.replay
+        if block_number == replay.last_block_number and replay.last_block is not None:
+            return replay.last_block
+
+        if block_number == replay.last_block_number + 1 and self.block is not None:
+            return self.block
+
+        return self.blockchain.get_block_by_number(block_number)
+
+    def get_expected_block_identifier(self, block_number: int) -> Optional[str]:
+        if block_number == self.replay.last_block_number + 1:
+            return self.replay.get_next_block_identifier()
+
+        return self.blockchain.get_expected_block_identifier(block_number)
+
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str, block_number: int):
+        if block_number == self.replay.last_block_number:
+            return self.replay.get_account_state_attribute_value(account, attribute)
+
+        return self.blockchain.get_account_state_attribute_value(account, attribute, block_number)
+
+
+class AuditCheckpoint:
+    """
+    The last blockchain state verified by the audit, so an interrupted audit resumes from it. The checkpoint is
+    stored in a small JSON file that is replaced atomically
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def read(self) -> Optional[tuple[int, hexstr]]:
+        try:
+            with open(self.file_path) as fo:
+                dict_ = json.load(fo)
+
+            return dict_['last_block_number'], dict_['next_block_identifier']
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning('Could not read audit checkpoint from %s', self.file_path, exc_info=True)
+            return None
+
+    def write(self, last_block_number: int, next_block_identifier: hexstr):
+        temporary_file_path = self.file_path + '.tmp'
+        with open(temporary_file_path, 'w') as fo:
+            json.dump({
+                'last_block_number': last_block_number,
+                'next_block_identifier': next_block_identifier,
+            }, fo)
+
+        replace_durably(temporary_file_path, self.file_path)
@@ -1,6 +1,7 @@
 import logging
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
+from itertools import islice
 from operator import le, lt
 from typing import Any, Callable, Generator, Optional, Union, cast
 
@@ -31,6 +32,11 @@ class BlockchainStateMixin(BaseMixin):
         warnings.warn('Using low performance implementation of get_account_root_file_count() method (override it)')
         return ilen(self.yield_blockchain_states())
 
+    def yield_blockchain_state_last_block_numbers(self) -> Generator[int, None, None]:
+        # Override this method if a particular blockchain implementation can provide a high performance
+        for blockchain_state in self.yield_blockchain_states():
+            yield cast(BlockchainState, blockchain_state).last_block_number
+
     def yield_blockchain_states_reversed(
         self, lazy=False
     ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
@@ -41,6 +47,38 @@ class BlockchainStateMixin(BaseMixin):
         )
         yield from always_reversible(self.yield_blockchain_states())
 
+    def yield_blockchain_states_slice(
+        self,
+        slice_: slice,
+        direction=1,
+        lazy=False
+    ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
+        # Override this method if a particular blockchain implementation can provide a high performance
+        assert direction in (1, -1)
+        if direction == 1:
+            blockchain_states = self.yield_blockchain_states(lazy=lazy)
+        else:
+            blockchain_states = self.yield_blockchain_states_reversed(lazy=lazy)
+
+        yield from islice(blockchain_states, slice_.start, slice_.stop, slice_.step)
+
+    def yield_full_blockchain_states_slice(
+        self,
+        slice_: slice,
+        direction=1,
+        lazy=False
+    ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
+        """
+        Yield blockchain states that are self-contained (not stored as deltas), so they can be downloaded by
+        other nodes
+        """
+        # Override this method if a particular blockchain implementation stores blockchain states as deltas
+        yield from self.yield_blockchain_states_slice(slice_, direction=direction, lazy=lazy)
+
+    def get_full_blockchain_state_count(self) -> int:
+        # Override this method if a particular blockchain implementation stores blockchain states as deltas
+        return self.get_blockchain_state_count()
+
     def add_blockchain_state(self, blockchain_state: BlockchainState):
         blockchain_state.validate(is_initial=blockchain_state.is_initial())
         self.persist_blockchain_state(blockchain_state)
@@ -118,7 +156,10 @@ class BlockchainStateMixin(BaseMixin):
             last_blockchain_state_snapshot.last_block_number
         )
 
-        account_states = deepcopy(last_blockchain_state_snapshot.account_states)
+        # Account states are shared with the previous snapshot and copied on the first write only (blockchain
+        # states are treated as immutable once generated), so the cost depends on the number of changed accounts
+        account_states = last_blockchain_state_snapshot.account_states.copy()
+        copied_account_numbers = set()
 
         block = None
         for block in self.yield_blocks_from(last_blockchain_state_snapshot.next_block_number):  # type: ignore
@@ -135,6 +176,12 @@ class BlockchainStateMixin(BaseMixin):
                     assert block_account_state.balance_lock is None
                     blockchain_state_account_state = AccountState()
                     account_states[account_number] = blockchain_state_account_state
+                    copied_account_numbers.add(account_number)
+                elif account_number not in copied_account_numbers:
+                    # Attribute values are replaced (not changed in place), so a shallow copy is enough
+                    blockchain_state_account_state = copy(blockchain_state_account_state)
+                    account_states[account_number] = blockchain_state_account_state
+                    copied_account_numbers.add(account_number)
 
                 for attribute in AccountState.get_field_names():  # type: ignore
                     value = getattr(block_account_state, attribute)
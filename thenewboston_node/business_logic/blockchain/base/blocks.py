@@ -11,6 +11,7 @@ from thenewboston_node.core.logging import timeit, timeit_method
 
 from ...models.block import Block
 from .base import BaseMixin
+from .execution import BlockExecutionContext
 
 logger = logging.getLogger(__name__)
 
@@ -58,13 +59,17 @@ class BlocksMixin(BaseMixin):
 
     # ** Blocks related base methods
     @timeit_method(level=logging.INFO)
-    def add_block(self, block: Block, validate=True):
+    def add_block(self, block: Block, validate=True, execution_context: Optional[BlockExecutionContext] = None):
         block_number = block.message.block_number
         if validate:
             if block_number != self.get_next_block_number():
                 raise ValidationError('Block number must be equal to next block number (== head block number + 1)')
 
-            block.validate(self)
+            # Reuse blockchain data read while the block was created (if it was created on the same head block)
+            if execution_context is None or execution_context.get_next_block_number() != block_number:
+                execution_context = BlockExecutionContext(self)
+
+            block.validate(execution_context)
 
         # TODO(dmu) CRITICAL: Validate block_identifier
         self.persist_block(block)
@@ -92,8 +97,9 @@ class BlocksMixin(BaseMixin):
     def add_block_from_signed_change_request(
         self, signed_change_request: CoinTransferSignedChangeRequest, pv_signing_key, validate=True
     ):
-        block = Block.create_from_signed_change_request(self, signed_change_request, pv_signing_key)
-        self.add_block(block, validate=validate)
+        execution_context = BlockExecutionContext(self)
+        block = Block.create_from_signed_change_request(execution_context, signed_change_request, pv_signing_key)
+        self.add_block(block, validate=validate, execution_context=execution_context)
 
     def get_next_block_identifier(self) -> str:
         block_identifier = self.get_expected_block_identifier(self.get_next_block_number())  # type: ignore
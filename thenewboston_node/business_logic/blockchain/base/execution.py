@@ -0,0 +1,67 @@
+from typing import Any, Optional
+
+from thenewboston_node.business_logic.models import Block
+from thenewboston_node.core.constants import SENTINEL
+from thenewboston_node.core.utils.types import hexstr
+
+from .view import BlockchainView
+
+
+class BlockExecutionContext(BlockchainView):
+    """
+    Blockchain as seen by the next block while it is created and validated. Head block data and account state
+    attribute values on the head block are read from the blockchain once and cached, so creating and validating
+    a block takes a fixed number of blockchain queries per account. The context must not be used once
+    the blockchain head changes
+    """
+
+    def __init__(self, blockchain):
+        super().__init__(blockchain)
+        self.last_block_number: int = blockchain.get_last_block_number()
+        self._last_block: Any = SENTINEL
+        self._next_block_identifier: Any = SENTINEL
+        self._account_state_attribute_values: dict[tuple[hexstr, str], Any] = {}
+
+    def get_last_block_number(self) -> int:
+        return self.last_block_number
+
+    def get_next_block_number(self) -> int:
+        return self.last_block_number + 1
+
+    def get_next_block_identifier(self) -> str:
+        block_identifier = self.get_expected_block_identifier(self.get_next_block_number())
+        assert block_identifier
+        return block_identifier
+
+    def get_expected_block_identifier(self, block_number: int) -> Optional[str]:
+        if block_number != self.get_next_block_number():
+            return self.blockchain.get_expected_block_identifier(block_number)
+
+        if self._next_block_identifier is SENTINEL:
+            self._next_block_identifier = self.blockchain.get_expected_block_identifier(block_number)
+
+        return self._next_block_identifier
+
+    def get_block_by_number(self, block_number: int) -> Optional[Block]:
+        if block_number > self.last_block_number:
+            return None  # the block being executed is not added to the blockchain yet
+
+        if block_number != self.last_block_number:
+            return self.blockchain.get_block_by_number(block_number)
+
+        if self._last_block is SENTINEL:
+            self._last_block = self.blockchain.get_block_by_number(block_number)
+
+        return self._last_block
+
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str, block_number: int):
+        if block_number != self.last_block_number:
+            return self.blockchain.get_account_state_attribute_value(account, attribute, block_number)
+
+        key = (account, attribute)
+        value = self._account_state_attribute_values.get(key, SENTINEL)
+        if value is SENTINEL:
+            value = self.blockchain.get_account_state_attribute_value(account, attribute, block_number)
+            self._account_state_attribute_values[key] = value
+
+        return value
@@ -0,0 +1,34 @@
+import copy
+from typing import Iterable, Optional
+
+from thenewboston_node.business_logic.models import AccountState, Block, BlockchainState
+from thenewboston_node.core.utils.types import hexstr
+
+
+class BlockchainIndex:
+    """
+    Data derived from account states of a blockchain state and blocks after it (up to `last_block_number`). The index
+    is updated with blocks as they are added instead of being rebuilt
+    """
+
+    def __init__(self, blockchain_state: BlockchainState):
+        self.blockchain_state = blockchain_state
+        self.last_block_number = blockchain_state.last_block_number
+        self.last_block_hash: Optional[hexstr] = None
+
+        self.apply_account_states(self.last_block_number, blockchain_state.yield_account_states())
+
+    def apply_account_states(self, block_number: int, account_states: Iterable[tuple[hexstr, AccountState]]):
+        raise NotImplementedError('Must be implemented in a child class')
+
+    def copy(self):
+        # Child classes must copy mutable attributes
+        return copy.copy(self)
+
+    def apply_block(self, block: Block):
+        block_number = block.get_block_number()
+        assert block_number == self.last_block_number + 1
+
+        self.apply_account_states(block_number, block.yield_account_states())
+        self.last_block_number = block_number
+        self.last_block_hash = block.hash
@@ -1,5 +1,6 @@
 import logging
-from typing import Generator, Optional
+from itertools import islice
+from typing import Generator, Optional, Type, TypeVar
 
 from more_itertools import ilen
 
@@ -8,9 +9,14 @@ from thenewboston_node.business_logic.models import Node
 from thenewboston_node.core.utils.types import hexstr
 
 from .base import BaseMixin
+from .index import BlockchainIndex
+from .node_registry import NodeRegistry
+from .pv_schedule_index import PrimaryValidatorScheduleIndex
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T', bound=BlockchainIndex)
+
 
 class NetworkMixin(BaseMixin):
 
@@ -20,9 +26,16 @@ class NetworkMixin(BaseMixin):
         return self.get_account_state_attribute_value(identifier, 'node', on_block_number)
 
     def get_nodes_count(self, block_number: Optional[int] = None) -> int:
+        if self._is_current_block_number(block_number):
+            return len(self.get_node_registry())
+
         return ilen(self.yield_nodes(block_number=block_number))
 
     def yield_nodes(self, block_number: Optional[int] = None) -> Generator[Node, None, None]:
+        if self._is_current_block_number(block_number):
+            yield from self.get_node_registry().yield_nodes()
+            return
+
         known_accounts = set()
         for account_number, account_state in self.yield_account_states(from_block_number=block_number):
             node = account_state.node
@@ -35,44 +48,78 @@ class NetworkMixin(BaseMixin):
             known_accounts.add(account_number)
             yield node
 
+    def yield_nodes_slice(self, slice_: slice, block_number: Optional[int] = None) -> Generator[Node, None, None]:
+        if self._is_current_block_number(block_number):
+            yield from self.get_node_registry().get_nodes_slice(slice_)
+            return
+
+        yield from islice(self.yield_nodes(block_number=block_number), slice_.start, slice_.stop, slice_.step)
+
     def has_nodes(self):
         return any(self.yield_nodes())
 
-    def get_primary_validator(self, for_block_number: Optional[int] = None) -> Optional[Node]:
-        if for_block_number is None:
-            for_block_number = self.get_next_block_number()
+    def _is_current_block_number(self, block_number: Optional[int]) -> bool:
+        return block_number is None or block_number == self.get_last_block_number()
 
+    def get_blockchain_index(self, index_class: Type[T]) -> T:
+        """
+        Return `index_class` index as of the last block. The index is cached and updated with blocks added since
+        the previous call (or rebuilt if a newer blockchain state is available or blocks were replaced)
+        """
         # We get last_block_number and blockchain_state here to avoid race conditions. Do not change it
         last_block_number = self.get_last_block_number()
         blockchain_state = self.get_blockchain_state_by_block_number(
             last_block_number, inclusive=last_block_number > -1
         )
-        known_pv_schedule_accounts = set()
-
-        logger.debug('Traverse blocks until we find a PV schedule that includes the desired block_number')
-        for block in self.yield_blocks_slice_reversed(last_block_number, blockchain_state.last_block_number):
-            for account_number, account_state in block.yield_account_states():
-                if account_number in known_pv_schedule_accounts:
-                    assert True, 'Should never get here'
-
-                pv_schedule = account_state.primary_validator_schedule
-                if pv_schedule:
-                    known_pv_schedule_accounts.add(account_number)
-                    if pv_schedule.is_block_number_included(for_block_number):
-                        return self.get_node_by_identifier(account_number)
-
-        # TODO(dmu) HIGH: Once we have more accounts this method will become slow. We need to optimize it
-        #                 by caching
-        for account_number, account_state in blockchain_state.yield_account_states():
-            if account_number in known_pv_schedule_accounts:
-                continue  # Schedule was overwritten with blocks
-
-            known_pv_schedule_accounts.add(account_number)
-            pv_schedule = account_state.primary_validator_schedule
-            if pv_schedule and pv_schedule.is_block_number_included(for_block_number):
-                return self.get_node_by_identifier(account_number)
-
-        return None
+
+        cache = self._blockchain_index_cache  # type: ignore
+        index = cache.get(index_class)
+        if not self._is_blockchain_index_reusable(index, blockchain_state, last_block_number):
+            logger.debug('Building %s from blockchain state', index_class.__name__)
+            index = index_class(blockchain_state)
+        elif index.last_block_number == last_block_number:
+            return index
+        else:
+            # Copy to keep the cached index consistent for concurrent readers
+            index = index.copy()
+
+        if index.last_block_number < last_block_number:
+            for block in self.yield_blocks_slice(index.last_block_number + 1, last_block_number):
+                index.apply_block(block)
+
+        cache[index_class] = index
+        return index
+
+    def _is_blockchain_index_reusable(self, index, blockchain_state, last_block_number):
+        if index is None or index.blockchain_state is not blockchain_state:
+            return False
+
+        index_last_block_number = index.last_block_number
+        if index_last_block_number > last_block_number:
+            return False
+
+        if index_last_block_number == blockchain_state.last_block_number:
+            return True
+
+        # Blocks might have been replaced since the index was updated
+        block = self.get_block_by_number(index_last_block_number)
+        return block is not None and block.hash is not None and block.hash == index.last_block_hash
+
+    def get_node_registry(self) -> NodeRegistry:
+        return self.get_blockchain_index(NodeRegistry)
+
+    def get_primary_validator_schedule_index(self) -> PrimaryValidatorScheduleIndex:
+        return self.get_blockchain_index(PrimaryValidatorScheduleIndex)
+
+    def get_primary_validator(self, for_block_number: Optional[int] = None) -> Optional[Node]:
+        if for_block_number is None:
+            for_block_number = self.get_next_block_number()
+
+        account_number = self.get_primary_validator_schedule_index().get_account(for_block_number)
+        if account_number is None:
+            return None
+
+        return self.get_node_by_identifier(account_number)
 
     def get_node_role(self, identifier: hexstr) -> Optional[NodeRole]:
         last_block_number = self.get_last_block_number()
@@ -0,0 +1,59 @@
+from bisect import bisect_left
+from typing import Generator, Iterable, Optional
+
+from thenewboston_node.business_logic.models import AccountState, BlockchainState, Node
+from thenewboston_node.core.utils.types import hexstr
+
+from .index import BlockchainIndex
+
+
+class NodeRegistry(BlockchainIndex):
+    """
+    Nodes declared as of `last_block_number` in the order `yield_nodes()` yields them: the most recently
+    declared first, then nodes of the blockchain state, so nodes are counted and sliced without traversing
+    account states
+    """
+
+    def __init__(self, blockchain_state: BlockchainState):
+        # ((-declared_block_number, sequence), account, node) tuples sorted by the first element
+        self._entries: list[tuple[tuple[int, int], hexstr, Node]] = []
+        self._keys_by_account: dict[hexstr, tuple[int, int]] = {}
+
+        super().__init__(blockchain_state)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def copy(self):
+        registry = super().copy()
+        registry._entries = self._entries.copy()
+        registry._keys_by_account = self._keys_by_account.copy()
+        return registry
+
+    def apply_account_states(self, block_number: int, account_states: Iterable[tuple[hexstr, AccountState]]):
+        entries = self._entries
+        keys_by_account = self._keys_by_account
+        for sequence, (account, account_state) in enumerate(account_states):
+            if not (node := account_state.node):
+                continue
+
+            if (old_key := keys_by_account.get(account)) is not None:
+                del entries[bisect_left(entries, (old_key,))]
+
+            key = (-block_number, sequence)
+            entries.insert(bisect_left(entries, (key,)), (key, account, node))
+            keys_by_account[account] = key
+
+    def get_declared_block_number(self, account: hexstr) -> Optional[int]:
+        """
+        Return number of the block the node was declared in (or the blockchain state last block number)
+        """
+        key = self._keys_by_account.get(account)
+        return None if key is None else -key[0]
+
+    def yield_nodes(self) -> Generator[Node, None, None]:
+        for _, _, node in self._entries:
+            yield node
+
+    def get_nodes_slice(self, slice_: slice) -> list[Node]:
+        return [node for _, _, node in self._entries[slice_]]
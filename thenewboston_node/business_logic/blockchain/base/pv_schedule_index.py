@@ -0,0 +1,67 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+
+from thenewboston_node.business_logic.models import AccountState, BlockchainState
+from thenewboston_node.business_logic.models.signed_change_request_message.pv_schedule import PrimaryValidatorSchedule
+from thenewboston_node.core.utils.types import hexstr
+
+from .index import BlockchainIndex
+
+
+class PrimaryValidatorScheduleIndex(BlockchainIndex):
+    """
+    Primary validator schedules of accounts as of `last_block_number` sorted by begin block number, so the account
+    scheduled for a block number is found with binary search. If schedules overlap the most recently set one wins
+    """
+
+    def __init__(self, blockchain_state: BlockchainState):
+        # (begin_block_number, end_block_number, priority, account) tuples sorted by begin block number
+        self._entries: list[tuple[int, int, tuple[int, int], hexstr]] = []
+        self._begin_block_numbers: list[int] = []  # to bisect by begin block number (not the entire tuple)
+        self._entries_by_account: dict[hexstr, tuple[int, int, tuple[int, int], hexstr]] = {}
+        self._max_length = 0
+
+        super().__init__(blockchain_state)
+
+    def copy(self):
+        index = super().copy()
+        index._entries = self._entries.copy()
+        index._begin_block_numbers = self._begin_block_numbers.copy()
+        index._entries_by_account = self._entries_by_account.copy()
+        return index
+
+    def apply_account_states(self, block_number: int, account_states: Iterable[tuple[hexstr, AccountState]]):
+        for sequence, (account, account_state) in enumerate(account_states):
+            if schedule := account_state.primary_validator_schedule:
+                # Later blocks win, within a block (or blockchain state) the account listed first wins
+                self._set_schedule(account, schedule, (block_number, -sequence))
+
+    def get_account(self, block_number: int) -> Optional[hexstr]:
+        begin_block_numbers = self._begin_block_numbers
+        # Only schedules that begin not earlier than the longest schedule length may include the block number
+        start = bisect_left(begin_block_numbers, block_number - self._max_length)
+        end = bisect_right(begin_block_numbers, block_number)
+
+        best_priority = None
+        best_account = None
+        for _, end_block_number, priority, account in self._entries[start:end]:
+            if end_block_number >= block_number and (best_priority is None or priority > best_priority):
+                best_priority = priority
+                best_account = account
+
+        return best_account
+
+    def _set_schedule(self, account: hexstr, schedule: PrimaryValidatorSchedule, priority: tuple[int, int]):
+        entries = self._entries
+        if (old_entry := self._entries_by_account.get(account)) is not None:
+            position = bisect_left(entries, old_entry)
+            del entries[position]
+            del self._begin_block_numbers[position]
+
+        begin_block_number = schedule.begin_block_number
+        entry = (begin_block_number, schedule.end_block_number, priority, account)
+        position = bisect_right(entries, entry)
+        entries.insert(position, entry)
+        self._begin_block_numbers.insert(position, begin_block_number)
+        self._entries_by_account[account] = entry
+        self._max_length = max(self._max_length, schedule.end_block_number - begin_block_number)
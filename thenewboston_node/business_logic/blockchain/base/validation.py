@@ -1,10 +1,18 @@
 import logging
+from bisect import bisect_right
 from itertools import chain, islice
 from typing import Iterable, Optional, cast
 
 from thenewboston_node.business_logic import models
-from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.exceptions import InvalidMessageSignatureError, ValidationError
+from thenewboston_node.business_logic.models.mixins.message import defer_signature_validation
 from thenewboston_node.core.logging import validates
+from thenewboston_node.core.utils.cryptography import verify_signatures
+
+from .audit import AccountStateReplay, AuditCheckpoint, ReplayBlockchainView
+
+# Signatures of this many blocks are verified together
+SIGNATURE_VERIFICATION_BATCH_SIZE_IN_BLOCKS = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -83,12 +91,14 @@ class ValidationMixin:
     @validates(
         'blockchain state balances (last_block_number={blockchain_state.last_block_number})', is_plural_target=True
     )
-    def validate_blockchain_state_balances(self, *, blockchain_state):
-        generated_account_root_file = self.generate_blockchain_state(  # type: ignore
-            blockchain_state.last_block_number
-        )
+    def validate_blockchain_state_balances(self, *, blockchain_state, expected_account_states=None):
+        if expected_account_states is None:
+            expected_account_states = self.generate_blockchain_state(  # type: ignore
+                blockchain_state.last_block_number
+            ).account_states
+
         with validates('number of blockchain state balances'):
-            expected_accounts_count = len(generated_account_root_file.account_states)
+            expected_accounts_count = len(expected_account_states)
             actual_accounts_count = len(blockchain_state.account_states)
             if expected_accounts_count != actual_accounts_count:
                 raise ValidationError(
@@ -97,7 +107,7 @@ class ValidationMixin:
                 )
 
         actual_accounts = blockchain_state.account_states
-        for account_number, account_state in generated_account_root_file.account_states.items():
+        for account_number, account_state in expected_account_states.items():
             with validates(f'account {account_number} existence'):
                 actual_account_state = actual_accounts.get(account_number)
                 if actual_account_state is None:
@@ -169,18 +179,187 @@ class ValidationMixin:
             expected_block_identifier = prev_block.hash
 
         expected_block_number = first_blockchain_state.next_block_number + offset
-        for block in chain((first_block,), blocks_iter):
-            block.validate(self)
+        blocks_iter = chain((first_block,), blocks_iter)
+        while blocks := list(islice(blocks_iter, SIGNATURE_VERIFICATION_BATCH_SIZE_IN_BLOCKS)):
+            expected_block_number, expected_block_identifier = self._validate_blocks_batch(
+                blocks, expected_block_number, expected_block_identifier
+            )
+
+    def _validate_blocks_batch(self, blocks, expected_block_number, expected_block_identifier, replay_view=None):
+        # Signatures are verified in batch, but validation errors are reported in the order of the blocks
+        signature_ends: list[int] = []
+        with defer_signature_validation() as signatures:
+            try:
+                for block in blocks:
+                    block.validate(self if replay_view is None else replay_view.begin_block(block))
+
+                    assert block.message
+
+                    self.validate_block(
+                        block=block,
+                        expected_block_number=expected_block_number,
+                        expected_block_identifier=expected_block_identifier
+                    )
+                    expected_block_number += 1
+                    expected_block_identifier = block.hash
+                    signature_ends.append(len(signatures))
+                    if replay_view is not None:
+                        replay_view.apply_block(block)
+            except Exception:
+                self._validate_deferred_signatures(blocks, signatures, signature_ends)
+                raise
+
+        self._validate_deferred_signatures(blocks, signatures, signature_ends)
+        return expected_block_number, expected_block_identifier
+
+    @validates('BLOCKCHAIN (audit)')
+    def audit(self, is_partial_allowed: bool = True, checkpoint_file_path=None, progress_callback=None):
+        """
+        Validate the blockchain in a single pass: blocks are replayed once on top of the first blockchain state
+        keeping running account states, which every following blockchain state is checked against as the replay
+        passes its last block number. Blocks are validated against the running account states instead of
+        querying the blockchain.
+
+        If `checkpoint_file_path` is given the last verified blockchain state is saved to it, so the next audit
+        resumes from it. `progress_callback(block_number)` is called after each validated batch of blocks.
+        """
+        checkpoint = None if checkpoint_file_path is None else AuditCheckpoint(checkpoint_file_path)
+        start_blockchain_state = self.get_audit_start_blockchain_state(is_partial_allowed, checkpoint)
+        replay_view = ReplayBlockchainView(self, AccountStateReplay(start_blockchain_state))
+        blocks_iter = self.yield_blocks_from(start_blockchain_state.next_block_number)  # type: ignore
+
+        for last_block_number in self.yield_blockchain_state_last_block_numbers():  # type: ignore
+            if last_block_number <= start_blockchain_state.last_block_number:
+                continue
+
+            self._audit_blocks(blocks_iter, replay_view, last_block_number, progress_callback)
+            blockchain_state = self.get_blockchain_state_by_block_number(  # type: ignore
+                last_block_number, inclusive=True
+            )
+            self._audit_blockchain_state(blockchain_state=blockchain_state, replay=replay_view.replay)
+            if checkpoint:
+                checkpoint.write(last_block_number, blockchain_state.next_block_identifier)
+
+        self._audit_blocks(blocks_iter, replay_view, None, progress_callback)
+        self.validate_has_declared_node()
+        self.validate_has_pv_schedule()
+
+    def audit_segment(self, start_block_number: int, end_block_number: Optional[int] = None):
+        """
+        Validate blocks after the blockchain state with `start_block_number` last block number up to the
+        blockchain state with `end_block_number` (it is checked too) or up to the last block if `end_block_number`
+        is None. Segments are validated independently, so they can be validated in parallel. Return next block
+        identifier of the start blockchain state, last validated block number and its hash to check segment
+        boundaries.
+        """
+        start_blockchain_state = self.get_blockchain_state_by_block_number(  # type: ignore
+            start_block_number, inclusive=start_block_number > -1
+        )
+        assert start_blockchain_state.last_block_number == start_block_number
+
+        replay_view = ReplayBlockchainView(self, AccountStateReplay(start_blockchain_state))
+        blocks_iter = self.yield_blocks_from(start_blockchain_state.next_block_number)  # type: ignore
+        self._audit_blocks(blocks_iter, replay_view, end_block_number, None)
+
+        replay = replay_view.replay
+        if end_block_number is not None:
+            blockchain_state = self.get_blockchain_state_by_block_number(  # type: ignore
+                end_block_number, inclusive=True
+            )
+            self._audit_blockchain_state(blockchain_state=blockchain_state, replay=replay)
+
+        return start_blockchain_state.next_block_identifier, replay.last_block_number, replay.get_next_block_identifier(
+        )
+
+    def get_audit_start_blockchain_state(self, is_partial_allowed, checkpoint: Optional[AuditCheckpoint]):
+        with validates('number of blockchain states (at least one)'):
+            try:
+                first_blockchain_state = next(self.yield_blockchain_states())  # type: ignore
+            except StopIteration:
+                raise ValidationError('Blockchain must contain at least one blockchain state')
 
-            assert block.message
+        is_initial = first_blockchain_state.is_initial()
+        if not is_partial_allowed and not is_initial:
+            raise ValidationError('Blockchain must start with initial blockchain state')
+
+        if checkpoint and (checkpoint_value := checkpoint.read()):
+            last_block_number, next_block_identifier = checkpoint_value
+            blockchain_state = self.get_blockchain_state_by_block_number(  # type: ignore
+                last_block_number, inclusive=True
+            )
+            if (
+                blockchain_state.last_block_number == last_block_number and
+                blockchain_state.next_block_identifier == next_block_identifier
+            ):
+                logger.info('Resuming audit from blockchain state with last_block_number=%s', last_block_number)
+                return blockchain_state
+
+            logger.warning('Audit checkpoint does not match the blockchain: auditing from the start')
+
+        with validates('blockchain state number 0'):
+            self.validate_blockchain_state(
+                blockchain_state=first_blockchain_state, is_initial=is_initial, is_first=True
+            )
+
+        return first_blockchain_state
+
+    def _audit_blocks(self, blocks_iter, replay_view: ReplayBlockchainView, till_block_number, progress_callback):
+        replay = replay_view.replay
+        while True:
+            # Batches end at blockchain states, so a blockchain state is checked once signatures are verified
+            batch_size = SIGNATURE_VERIFICATION_BATCH_SIZE_IN_BLOCKS
+            if till_block_number is not None:
+                batch_size = min(batch_size, till_block_number - replay.last_block_number)
 
-            self.validate_block(
-                block=block,
-                expected_block_number=expected_block_number,
-                expected_block_identifier=expected_block_identifier
+            if batch_size <= 0 or not (blocks := list(islice(blocks_iter, batch_size))):
+                break
+
+            self._validate_blocks_batch(
+                blocks, replay.last_block_number + 1, replay.get_next_block_identifier(), replay_view
             )
-            expected_block_number += 1
-            expected_block_identifier = block.hash
+            if progress_callback:
+                progress_callback(replay.last_block_number)
+
+    @validates('blockchain state (last_block_number={blockchain_state.last_block_number})')
+    def _audit_blockchain_state(self, *, blockchain_state: models.BlockchainState, replay: AccountStateReplay):
+        blockchain_state.validate(is_initial=False)
+
+        with validates('blockchain state last_block_number'):
+            if replay.last_block_number != blockchain_state.last_block_number:
+                raise ValidationError('Blockchain state last_block_number points to non-existing block')
+
+        last_block = replay.last_block
+        assert last_block
+        with validates('blockchain state last_block_identifier'):
+            if last_block.message.block_identifier != blockchain_state.last_block_identifier:
+                raise ValidationError('Blockchain state last_block_identifier does not match block_identifier')
+
+        with validates('blockchain state next_block_identifier'):
+            if last_block.hash != blockchain_state.next_block_identifier:
+                raise ValidationError(
+                    'Blockchain state next_block_identifier does not match last_block_number message hash'
+                )
+
+        self.validate_blockchain_state_balances(
+            blockchain_state=blockchain_state, expected_account_states=replay.account_states
+        )
+
+    def _validate_deferred_signatures(self, blocks, signatures, signature_ends):
+        """
+        Verify signatures collected while validating `blocks` (`signature_ends` are the numbers of signatures
+        collected after each block is validated) and raise signature validation error of the first invalid block
+        """
+        if not signature_ends:
+            return
+
+        is_valid = verify_signatures(signatures[:signature_ends[-1]])
+        if all(is_valid):
+            return
+
+        block = blocks[bisect_right(signature_ends, is_valid.index(False))]
+        # Validate the block again without deferring to raise the error with proper context
+        block.validate(self)
+        raise InvalidMessageSignatureError()
 
     @validates(
         'block number {block.message.block_number} (identifier: block.message.block_identifier) '
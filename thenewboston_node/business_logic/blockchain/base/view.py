@@ -0,0 +1,36 @@
+from typing import Optional
+
+from thenewboston_node.core.utils.types import hexstr
+
+
+class BlockchainView:
+    """
+    Blockchain proxy that answers some of the queries differently. Account state queries go through
+    `get_account_state_attribute_value()`, everything not overridden is read from the blockchain
+    """
+
+    def __init__(self, blockchain):
+        self.blockchain = blockchain
+
+    def __getattr__(self, name):
+        return getattr(self.blockchain, name)
+
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str, block_number: int):
+        return self.blockchain.get_account_state_attribute_value(account, attribute, block_number)
+
+    def get_account_balance(self, account: hexstr, on_block_number: int) -> int:
+        return self.get_account_state_attribute_value(account, 'balance', on_block_number)
+
+    def get_account_current_balance(self, account: hexstr) -> int:
+        return self.get_account_balance(account, self.get_last_block_number())
+
+    def get_account_balance_lock(self, account: hexstr, on_block_number: int) -> hexstr:
+        return self.get_account_state_attribute_value(account, 'balance_lock', on_block_number)
+
+    def get_account_current_balance_lock(self, account: hexstr) -> hexstr:
+        return self.get_account_balance_lock(account, self.get_last_block_number())
+
+    def get_node_by_identifier(self, identifier: hexstr, on_block_number: Optional[int] = None):
+        if on_block_number is None:
+            on_block_number = self.get_last_block_number()
+        return self.get_account_state_attribute_value(identifier, 'node', on_block_number)
@@ -6,14 +6,22 @@ from typing import Optional
 import filelock
 from cachetools import LRUCache
 
+from thenewboston_node.business_logic.storages.file_system import DURABILITY_NONE
 from thenewboston_node.business_logic.storages.path_optimized_file_system import PathOptimizedFileSystemStorage
 from thenewboston_node.core.logging import timeit_method
 from thenewboston_node.core.utils.file_lock import lock_method
 
 from ..base import BlockchainBase
+from .account_state.base import AccountStateFileBlockchainMixin
+from .account_state.index import AccountStateIndex
 from .base import EXPECTED_LOCK_EXCEPTION, LOCKED_EXCEPTION, FileBlockchainBaseMixin  # noqa: I101
 from .block_chunk.base import BlockChunkFileBlockchainMixin
+from .block_chunk.finalizer import BackgroundBlockChunkFinalizer
 from .blockchain_state.base import BlochainStateFileBlockchainMixin
+from .head.base import HeadFileBlockchainMixin
+from .head.pointer import BlockchainHead
+from .transaction.base import TransactionFileBlockchainMixin
+from .transaction.index import TransactionIndex
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,7 @@ def copytree_safe(source, destination):
 
 
 class FileBlockchain(
+    TransactionFileBlockchainMixin, AccountStateFileBlockchainMixin, HeadFileBlockchainMixin,
     BlockChunkFileBlockchainMixin, BlochainStateFileBlockchainMixin, FileBlockchainBaseMixin, BlockchainBase
 ):
 
@@ -36,11 +45,29 @@ class FileBlockchain(
         blockchain_state_subdirectory='blockchain-states',
         blockchain_state_storage_kwargs=None,
         blockchain_state_cache_size=128,
+        storage_manifest_filename='.manifest.msgpack',
+        # Store blockchain states as deltas against the previous blockchain state, so a full blockchain state is
+        # stored every `blockchain_state_max_delta_depth + 1` blockchain states (delta files are not self-contained,
+        # so they can not be consumed by other nodes)
+        blockchain_state_max_delta_depth=None,
 
         # Blocks
         block_chunk_subdirectory='block-chunks',
         block_chunk_storage_kwargs=None,
         block_cache_size=None,
+        block_chunk_index_subdirectory='block-chunk-indexes',
+        block_chunk_index_cache_size=128,
+        background_block_chunk_finalization=False,
+        block_chunk_finalization_lock_subdirectory='block-chunk-finalization-locks',
+        block_chunk_journal_subdirectory='block-chunk-journals',
+        durability=DURABILITY_NONE,
+        head_filename='head.msgpack',
+
+        # Account states
+        account_state_index_filename='account-state-index.msgpack',
+
+        # Transactions
+        transaction_index_filename='transaction-index.msgpack',
 
         # Misc
         snapshot_period_in_blocks=100,
@@ -51,6 +78,15 @@ class FileBlockchain(
         if not os.path.isabs(base_directory):
             raise ValueError('base_directory must be an absolute path')
 
+        # Block chunks and blockchain states are served to other nodes, which can not decompress files
+        # compressed with a zstd dictionary they do not have
+        for name, storage_kwargs in (
+            ('blockchain_state_storage_kwargs', blockchain_state_storage_kwargs),
+            ('block_chunk_storage_kwargs', block_chunk_storage_kwargs),
+        ):
+            if (storage_kwargs or {}).get('zstd_dictionary_path'):
+                raise ValueError(f'{name} must not contain zstd_dictionary_path: files are served to other nodes')
+
         super().__init__(**dict(kwargs, snapshot_period_in_blocks=snapshot_period_in_blocks))
 
         # Blockchain states
@@ -60,19 +96,51 @@ class FileBlockchain(
         self._blockchain_state_storage_kwargs = blockchain_state_storage_kwargs
         self._blockchain_state_cache_size = blockchain_state_cache_size
         self._blockchain_state_cache: Optional[LRUCache] = None
+        self._blockchain_state_index_cache: dict = {}
+        self._blockchain_state_max_delta_depth = blockchain_state_max_delta_depth
 
         # Block chunks (blocks)
         self._block_chunk_directory = os.path.join(base_directory, block_chunk_subdirectory)
         self._block_chunk_subdirectory = block_chunk_subdirectory
         self._block_chunk_storage = None
         self._block_chunk_storage_kwargs = block_chunk_storage_kwargs
+        self._durability = durability
+        self._block_chunk_journal_directory = (
+            os.path.join(base_directory, block_chunk_journal_subdirectory)
+            if block_chunk_journal_subdirectory else None
+        )
         self._block_cache_size = block_cache_size
         self._block_cache: Optional[LRUCache] = None
 
         self._block_chunk_last_block_number_cache: Optional[LRUCache] = None
+        self._block_chunk_filename_index_cache: dict = {}
         self._block_number_digits_count = block_number_digits_count
 
+        self._block_chunk_index_directory = os.path.join(base_directory, block_chunk_index_subdirectory)
+        self._block_chunk_index_storage = None
+        self._block_chunk_index_cache_size = block_chunk_index_cache_size
+        self._block_chunk_index_cache: Optional[LRUCache] = None
+
+        self._background_block_chunk_finalization = background_block_chunk_finalization
+        self._block_chunk_finalizer: Optional[BackgroundBlockChunkFinalizer] = None
+        self._block_chunk_finalization_lock_directory = os.path.join(
+            base_directory, block_chunk_finalization_lock_subdirectory
+        )
+
+        self._head_file_path = os.path.join(base_directory, head_filename)
+        self._head: Optional[BlockchainHead] = None
+
+        # Account states
+        self._account_state_index_file_path = os.path.join(base_directory, account_state_index_filename)
+        self._account_state_index: Optional[AccountStateIndex] = None
+
+        # Transactions
+        self._transaction_index_file_path = os.path.join(base_directory, transaction_index_filename)
+        self._transaction_index: Optional[TransactionIndex] = None
+        self._is_transaction_index_unavailable = False
+
         # Common
+        self._storage_manifest_filename = storage_manifest_filename
         self._base_directory = base_directory
         self._file_lock = None
         self._lock_filename = lock_filename
@@ -105,17 +173,34 @@ class FileBlockchain(
         self.clear_caches()
 
         # Clear blocks
+        self.wait_block_chunk_finalization()
         self.get_block_chunk_storage().clear()
         self.get_block_chunk_last_block_number_cache().clear()
+        self.get_block_chunk_index_storage().clear()
+        self.get_head().remove()
 
         # Clear blockchain states
         self.get_blockchain_state_storage().clear()
 
+        # Clear account states
+        self.get_account_state_index().remove()
+
+        # Clear transactions
+        self.get_transaction_index().remove()
+
         # TODO(dmu) HIGH: Clear lock file
 
     def clear_caches(self):
         self.get_block_cache().clear()
+        self.get_block_chunk_index_cache().clear()
+        self.get_block_chunk_filename_index_cache().clear()
         self.get_blockchain_state_cache().clear()
+        self.get_blockchain_state_index_cache().clear()
+        self._blockchain_index_cache.clear()
+        self.get_account_state_index().reset()
+        self.get_transaction_index().reset()
+        self._is_transaction_index_unavailable = False
+        self._lock_cache.clear()
 
     # Blockchain state methods
     def get_blockchain_states_subdirectory(self):
@@ -126,12 +211,20 @@ class FileBlockchain(
 
     def get_blockchain_state_storage(self):
         if (storage := self._blockchain_state_storage) is None:
+            kwargs = {'manifest_filename': self._storage_manifest_filename}
+            kwargs.update(self._blockchain_state_storage_kwargs or {})
             self._blockchain_state_storage = storage = PathOptimizedFileSystemStorage(
-                base_path=self._blockchain_state_directory, **(self._blockchain_state_storage_kwargs or {})
+                base_path=self._blockchain_state_directory, **kwargs
             )
 
         return storage
 
+    def get_blockchain_state_max_delta_depth(self):
+        return self._blockchain_state_max_delta_depth
+
+    def get_blockchain_state_index_cache(self):
+        return self._blockchain_state_index_cache
+
     def get_blockchain_state_cache(self):
         if (cache := self._blockchain_state_cache) is None:
             self._blockchain_state_cache = cache = LRUCache(self._blockchain_state_cache_size)
@@ -151,12 +244,76 @@ class FileBlockchain(
 
     def get_block_chunk_storage(self):
         if (storage := self._block_chunk_storage) is None:
+            kwargs = {
+                'journal_directory': self._block_chunk_journal_directory,
+                'durability': self._durability,
+                'manifest_filename': self._storage_manifest_filename,
+            }
+            kwargs.update(self._block_chunk_storage_kwargs or {})
             self._block_chunk_storage = storage = PathOptimizedFileSystemStorage(
-                base_path=self._block_chunk_directory, **(self._block_chunk_storage_kwargs or {})
+                base_path=self._block_chunk_directory, recover_on_open=False, **kwargs
             )
+            try:
+                # Recovery truncates records being written, so it is done under the lock only
+                with self.file_lock:
+                    storage.recover()
+            except filelock.Timeout:
+                # Blockchain is being modified by another process (the process has recovered the storage)
+                logger.debug('Skipped block chunk storage recovery: blockchain is locked')
 
         return storage
 
+    def get_block_chunk_index_storage(self):
+        if (storage := self._block_chunk_index_storage) is None:
+            # Block chunk indexes are small, so there is no reason to compress them
+            self._block_chunk_index_storage = storage = PathOptimizedFileSystemStorage(
+                base_path=self._block_chunk_index_directory, compressors=()
+            )
+
+        return storage
+
+    def get_block_chunk_index_cache(self):
+        if (cache := self._block_chunk_index_cache) is None:
+            self._block_chunk_index_cache = cache = LRUCache(self._block_chunk_index_cache_size)
+
+        return cache
+
+    def get_block_chunk_filename_index_cache(self):
+        return self._block_chunk_filename_index_cache
+
+    def get_block_chunk_finalizer(self):
+        if not self._background_block_chunk_finalization:
+            return None
+
+        if (finalizer := self._block_chunk_finalizer) is None:
+            self._block_chunk_finalizer = finalizer = BackgroundBlockChunkFinalizer(
+                self.get_block_chunk_storage(), self._block_chunk_finalization_lock_directory
+            )
+
+        return finalizer
+
+    def wait_block_chunk_finalization(self):
+        if finalizer := self.get_block_chunk_finalizer():
+            finalizer.wait()
+
+    def close(self):
+        """
+        Wait for background block chunk finalization, fsync appended blocks not fsync'ed yet and release
+        threads and processes used for finalization. The blockchain can still be used after closing
+        """
+        if finalizer := self._block_chunk_finalizer:
+            finalizer.close()
+
+        for storage in (self._block_chunk_storage, self._blockchain_state_storage, self._block_chunk_index_storage):
+            if storage:
+                storage.close()
+
+    def get_head(self):
+        if (head := self._head) is None:
+            self._head = head = BlockchainHead(self._head_file_path)
+
+        return head
+
     def get_block_cache(self):
         if (cache := self._block_cache) is None:
             self._block_cache = cache = LRUCache(
@@ -167,6 +324,20 @@ class FileBlockchain(
 
         return cache
 
+    # Account states methods
+    def get_account_state_index(self):
+        if (index := self._account_state_index) is None:
+            self._account_state_index = index = AccountStateIndex(self._account_state_index_file_path)
+
+        return index
+
+    # Transactions methods
+    def get_transaction_index(self):
+        if (index := self._transaction_index) is None:
+            self._transaction_index = index = TransactionIndex(self._transaction_index_file_path)
+
+        return index
+
     @timeit_method(logger=logger, level=logging.INFO)
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
     def copy_from(self, blockchain: BlockchainBase):
@@ -176,6 +347,7 @@ class FileBlockchain(
 
         with blockchain.file_lock:
             self._clear_locked()
+            blockchain.wait_block_chunk_finalization()
             # TODO(dmu) MEDIUM: Consider a hard-linking copying (except for incomplete block chunks, since they are
             #                   being written) for even faster copying and consuming less space
             copytree_safe(
@@ -183,3 +355,11 @@ class FileBlockchain(
                 self.get_blockchain_state_storage().base_path
             )
             copytree_safe(blockchain.get_block_chunk_storage().base_path, self.get_block_chunk_storage().base_path)
+            source_journal_directory = blockchain.get_block_chunk_storage().journal_directory
+            target_journal_directory = self.get_block_chunk_storage().journal_directory
+            if source_journal_directory and target_journal_directory:
+                copytree_safe(source_journal_directory, target_journal_directory)
+            copytree_safe(
+                blockchain.get_block_chunk_index_storage().base_path,
+                self.get_block_chunk_index_storage().base_path
+            )
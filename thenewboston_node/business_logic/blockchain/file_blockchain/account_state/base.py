@@ -0,0 +1,69 @@
+import logging
+
+from thenewboston_node.business_logic.blockchain.file_blockchain.base import (  # noqa: I101
+    EXPECTED_LOCK_EXCEPTION, LOCKED_EXCEPTION, FileBlockchainBaseMixin
+)
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.logging import timeit_method
+from thenewboston_node.core.utils.file_lock import ensure_locked, lock_method
+from thenewboston_node.core.utils.types import hexstr
+
+from .index import AccountStateIndex
+
+logger = logging.getLogger(__name__)
+
+
+class AccountStateFileBlockchainMixin(FileBlockchainBaseMixin):
+
+    def get_account_state_index(self) -> AccountStateIndex:
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_up_to_date_account_state_index(self) -> AccountStateIndex:
+        index = self.get_account_state_index()
+        # The index can always be rebuilt starting from the last blockchain state
+        self.update_sidecar_index(index, self._rebuild_account_state_index)  # type: ignore
+        return index
+
+    @timeit_method(level=logging.INFO)
+    def _rebuild_account_state_index(self, index: AccountStateIndex):
+        logger.info('Rebuilding account state index')
+        blockchain_state = self.get_last_blockchain_state()  # type: ignore
+        index.reset()
+        index.apply(blockchain_state.last_block_number, blockchain_state.account_states)
+        for block in self.yield_blocks_from(blockchain_state.next_block_number):  # type: ignore
+            index.apply(block.get_block_number(), block.message.updated_account_states)
+
+        self.rewrite_sidecar_index(index)
+
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str, block_number: int):
+        if block_number >= -1:
+            index = self.get_up_to_date_account_state_index()
+            if block_number <= index.last_block_number:  # type: ignore
+                account_state, account_block_number = index.get(account)
+                if account_state is None:
+                    # Account that is not known on the head block is not known on any previous block either
+                    from thenewboston_node.business_logic.utils.blockchain import get_attribute_default_value
+                    return get_attribute_default_value(attribute, account)
+
+                if account_block_number <= block_number:  # type: ignore
+                    return account_state.get_attribute_value(attribute, account)
+
+        return super().get_account_state_attribute_value(account, attribute, block_number)  # type: ignore
+
+    def get_number_of_accounts(self):
+        return len(self.get_up_to_date_account_state_index())
+
+    @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
+    def persist_block(self, block: Block):
+        index = self.get_up_to_date_account_state_index()
+        super().persist_block(block)  # type: ignore
+        self.append_to_sidecar_index(index, block.get_block_number(), block.message.updated_account_states)
+
+    @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
+    def snapshot_blockchain_state(self):
+        super().snapshot_blockchain_state()  # type: ignore
+
+        # Compact the index once in a snapshot period to keep it proportional to the number of accounts
+        index = self.get_account_state_index()
+        if index.last_block_number == self.get_next_block_number() - 1:  # type: ignore
+            index.rewrite()
@@ -0,0 +1,63 @@
+from collections import defaultdict
+from typing import Optional
+
+from thenewboston_node.business_logic.models import AccountState
+from thenewboston_node.core.utils.types import hexstr
+
+from ..index import SidecarIndex
+
+
+class AccountStateIndex(SidecarIndex):
+    """
+    Map of account to its latest known account state and the number of the block that changed it last.
+
+    Records are `[block_number, {account: compact account state}]`, the compacted file has one record per
+    block number that changed an account state last.
+    """
+
+    name = 'account state index'
+
+    def reset(self):
+        super().reset()
+        self.account_states: dict[hexstr, AccountState] = {}
+        self.account_block_numbers: dict[hexstr, int] = {}
+
+    def __len__(self):
+        return len(self.account_states)
+
+    def get(self, account: hexstr) -> tuple[Optional[AccountState], Optional[int]]:
+        return self.account_states.get(account), self.account_block_numbers.get(account)
+
+    def apply(self, block_number: int, account_states: dict[hexstr, AccountState]):
+        index_account_states = self.account_states
+        index_account_block_numbers = self.account_block_numbers
+        field_names = AccountState.get_field_names()
+        for account, account_state in account_states.items():
+            index_account_state = index_account_states.get(account)
+            if index_account_state is None:
+                index_account_states[account] = index_account_state = AccountState()
+
+            for attribute in field_names:
+                value = getattr(account_state, attribute)
+                if value is not None:
+                    setattr(index_account_state, attribute, value)
+
+            index_account_block_numbers[account] = block_number
+
+        self.last_block_number = block_number
+
+    def get_compacted_records(self):
+        by_block_number: dict[int, dict[hexstr, AccountState]] = defaultdict(dict)
+        for account, block_number in self.account_block_numbers.items():
+            by_block_number[block_number][account] = self.account_states[account]
+
+        return by_block_number
+
+    def pack_block_data(self, account_states):
+        return {account: account_state.to_compact_dict() for account, account_state in account_states.items()}
+
+    def unpack_block_data(self, compact_account_states):
+        return {
+            account: AccountState.from_compact_dict(compact_account_state)
+            for account, compact_account_state in compact_account_states.items()
+        }
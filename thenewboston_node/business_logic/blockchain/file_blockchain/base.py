@@ -1,8 +1,17 @@
+import logging
+from typing import Callable
+
+import filelock
+
 from thenewboston_node.business_logic.exceptions import BlockchainLockedError, BlockchainUnlockedError
 
+from .index import SidecarIndex
+
 LOCKED_EXCEPTION = BlockchainLockedError('Blockchain locked. Probably it is being modified by another process')
 EXPECTED_LOCK_EXCEPTION = BlockchainUnlockedError('Blockchain was expected to be locked')
 
+logger = logging.getLogger(__name__)
+
 
 class FileBlockchainBaseMixin:
 
@@ -20,3 +29,35 @@ class FileBlockchainBaseMixin:
 
     def finalize_all_block_chunks(self):
         raise NotImplementedError('Must be implemented in child class')
+
+    def update_sidecar_index(self, index: SidecarIndex, rebuild: Callable[[SidecarIndex], None]) -> bool:
+        """
+        Catch up `index` with the blocks (rebuild it with `rebuild` if needed) and return True if the index
+        reflects all blocks
+        """
+        last_block_number = self.get_last_block_number()  # type: ignore
+        if index.last_block_number != last_block_number:
+            index.load()  # catch up with blocks added by another process
+            if index.last_block_number != last_block_number:
+                rebuild(index)
+
+        return index.last_block_number == last_block_number
+
+    def rewrite_sidecar_index(self, index: SidecarIndex):
+        """
+        Persist rebuilt `index` unless the blockchain is being modified by another process
+        """
+        try:
+            with self.file_lock:  # type: ignore
+                # Make sure the index still reflects the blocks on disk before we write it
+                if index.last_block_number == self.get_next_block_number() - 1:  # type: ignore
+                    index.rewrite()
+        except filelock.Timeout:
+            logger.debug('Blockchain is locked by another process: %s is not persisted', index.name)
+
+    @staticmethod
+    def append_to_sidecar_index(index: SidecarIndex, block_number: int, block_data):
+        if index.last_block_number == block_number - 1:
+            index.append(block_number, block_data)
+        else:
+            index.reset()  # the index is going to be rebuilt on next use
@@ -1,8 +1,11 @@
 import logging
+import math
 import os.path
-from typing import Generator, Optional
+from bisect import bisect_left, bisect_right
+from typing import Generator, Optional, Union
 
-from more_itertools import always_reversible, ilen
+import msgpack
+from more_itertools import always_reversible
 
 from thenewboston_node.business_logic.blockchain.file_blockchain.base import (  # noqa: I101
     EXPECTED_LOCK_EXCEPTION, LOCKED_EXCEPTION, FileBlockchainBaseMixin
@@ -12,9 +15,12 @@ from thenewboston_node.business_logic.exceptions import InvalidBlockchainError
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.core.logging import timeit, timeit_method
 from thenewboston_node.core.utils.file_lock import ensure_locked, lock_cached, lock_method
+from thenewboston_node.core.utils.itertools import FULL_SLICE
+from thenewboston_node.core.utils.misc import if_none
 
+from .index import BlockChunkIndex
 from .meta import BlockChunkFilenameMeta, get_block_chunk_filename_meta
-from .misc import BLOCK_CHUNK_FILENAME_TEMPLATE
+from .misc import BLOCK_CHUNK_FILENAME_TEMPLATE, BLOCK_CHUNK_INDEX_FILENAME_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,18 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
     def get_block_cache(self):
         raise NotImplementedError('Must be implemented in child class')
 
+    def get_block_chunk_index_storage(self):
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_block_chunk_index_cache(self):
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_block_chunk_filename_index_cache(self):
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_block_chunk_finalizer(self):
+        raise NotImplementedError('Must be implemented in child class')
+
     @staticmethod
     def make_block_chunk_filename_from_start_end_str(start_block_str, end_block_str):
         return BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=start_block_str, end=end_block_str)
@@ -93,11 +111,11 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
         return file_path, self.get_block_chunk_storage().get_mtime(file_path)
 
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
-    def add_block(self, block: Block, validate=True):
+    def add_block(self, block: Block, validate=True, execution_context=None):
         block_number = block.get_block_number()
 
         logger.debug('Adding block number %s to the blockchain', block_number)
-        rv = super().add_block(block, validate)  # type: ignore
+        rv = super().add_block(block, validate, execution_context)  # type: ignore
 
         cache = self.get_block_chunk_last_block_number_cache()
         assert cache is not None
@@ -117,6 +135,32 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
 
         return self.make_block_chunk_filename_from_start_end_str(start_block_str, end_block_str)
 
+    def make_block_chunk_index_filename(self, start_block, end_block):
+        block_number_digits_count = self.get_block_number_digits_count()
+        return BLOCK_CHUNK_INDEX_FILENAME_TEMPLATE.format(
+            start=str(start_block).zfill(block_number_digits_count),
+            end=str(end_block).zfill(block_number_digits_count),
+        )
+
+    def get_block_chunk_index(self, block_chunk_filename) -> Optional[BlockChunkIndex]:
+        meta = get_block_chunk_filename_meta(filename=block_chunk_filename)
+        if meta is None or meta.end_block_number is None:
+            return None  # only finalized block chunks are indexed
+
+        cache = self.get_block_chunk_index_cache()
+        if (block_chunk_index := cache.get(block_chunk_filename)) is not None:
+            return block_chunk_index
+
+        index_filename = self.make_block_chunk_index_filename(meta.start_block_number, meta.end_block_number)
+        try:
+            data = self.get_block_chunk_index_storage().load(index_filename)
+        except OSError:
+            # Block chunks finalized before indexes were introduced are not indexed
+            return None
+
+        cache[block_chunk_filename] = block_chunk_index = BlockChunkIndex.from_messagepack(data)
+        return block_chunk_index
+
     def get_current_block_chunk_filename(self) -> str:
         chunk_block_number_start = self.get_last_blockchain_state().last_block_number + 1  # type: ignore
         return self.make_block_chunk_filename(chunk_block_number_start)
@@ -128,18 +172,34 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
 
         meta = get_block_chunk_filename_meta(filename=block_chunk_filename)
         assert meta.end_block_number is None
+
+        start = meta.start_block_number
+        data = storage.load(block_chunk_filename)
+        block_chunk_index = BlockChunkIndex.from_binary_data(start, data)
         if last_block_number is None:
-            try:
-                block = next(self._yield_blocks_from_file_simple(block_chunk_filename, -1))
-            except StopIteration:
+            offsets = block_chunk_index.offsets
+            if len(offsets) < 2:
                 raise InvalidBlockchainError(f'File {block_chunk_filename} does not appear to contain blocks')
 
-            last_block_number = block.get_block_number()
+            last_block_number = Block.from_compact_dict(msgpack.unpackb(data[offsets[-2]:offsets[-1]])
+                                                        ).get_block_number()
 
         end = last_block_number
-        destination_filename = self.make_block_chunk_filename_from_start_end(meta.start_block_number, end)
+        destination_filename = self.make_block_chunk_filename_from_start_end(start, end)
         storage.move(block_chunk_filename, destination_filename)
-        storage.finalize(destination_filename)
+        if finalizer := self.get_block_chunk_finalizer():
+            # Compression does not block adding blocks: the uncompressed block chunk is read until it is done
+            finalizer.schedule(destination_filename)
+        else:
+            storage.finalize(destination_filename)
+
+        if block_chunk_index.end_block_number == end:
+            self.get_block_chunk_index_storage().save(
+                self.make_block_chunk_index_filename(start, end), block_chunk_index.to_messagepack(), is_final=True
+            )
+            self.get_block_chunk_index_cache()[destination_filename] = block_chunk_index
+        else:
+            logger.warning('Block chunk %s contains unexpected number of blocks: not indexed', destination_filename)
 
         absolute_file_path = storage.get_optimized_absolute_actual_path(destination_filename)
         meta = get_block_chunk_filename_meta(
@@ -157,6 +217,8 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
             assert block.meta['chunk_absolute_file_path'].endswith(block_chunk_filename)  # type: ignore
             self._set_block_meta(block, meta)
 
+        return destination_filename
+
     def finalize_all_block_chunks(self):
         # This method is used to clean for super rare case when something goes wrong between blockchain state
         # generation and block chunk finalization
@@ -164,11 +226,17 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
         # TODO(dmu) HIGH: Implement a higher performance algorithm for this. Options: 1) cache finalized names
         #                 to avoid filename parsing 2) list directory by glob pattern 3) cache the last known
         #                 finalized name to reduce traversal
-        for filename in self.get_block_chunk_storage().list_directory():
+        storage = self.get_block_chunk_storage()
+        finalizer = self.get_block_chunk_finalizer()
+        for filename in storage.list_directory():
             meta = get_block_chunk_filename_meta(filename=filename)
             if meta.end_block_number is None:
                 logger.warning('Found not finalized block chunk: %s', filename)
                 self.finalize_block_chunk(filename)
+            elif finalizer and not finalizer.is_pending(filename) and not storage.is_finalized(filename):
+                # Background finalization was interrupted (by process termination, for example)
+                logger.warning('Found not compressed block chunk: %s', filename)
+                finalizer.schedule(filename)
 
     @timeit_method()
     @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
@@ -205,11 +273,23 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
         if block is not None:
             return block
 
-        try:
-            return next(self.yield_blocks_from(block_number))
-        except StopIteration:
+        start_block_numbers, end_block_numbers, filenames = self.get_block_chunk_filename_index()
+        position = bisect_right(start_block_numbers, block_number) - 1
+        if position < 0:
             return None
 
+        filename = filenames[position]
+        end_block_number = end_block_numbers[position]
+        if end_block_number != math.inf:
+            if block_number > end_block_number:
+                return None
+
+            block_chunk_index = self.get_block_chunk_index(filename)
+            if block_chunk_index is not None:
+                return self._read_block_from_file(filename, block_chunk_index, block_number)
+
+        return next(self._yield_blocks_from_file_cached(filename, direction=1, start=block_number), None)
+
     def get_block_count(self) -> int:
         count = 0
         for file_path in self._yield_block_chunk_filenames():
@@ -283,6 +363,36 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
         assert direction in (1, -1)
         yield from BinaryDataBlockSource(self.get_block_chunk_storage().load(filename), direction=direction)
 
+    def _yield_blocks_from_file_indexed(self, filename, block_chunk_index: BlockChunkIndex, direction, start=None):
+        assert direction in (1, -1)
+
+        first_block_number = block_chunk_index.start_block_number
+        last_block_number = block_chunk_index.end_block_number
+        if direction == 1:
+            start = first_block_number if start is None else max(start, first_block_number)
+            block_numbers = range(start, last_block_number + 1)
+        else:
+            start = last_block_number if start is None else min(start, last_block_number)
+            block_numbers = range(start, first_block_number - 1, -1)
+
+        data = memoryview(self.get_block_chunk_storage().load(filename))
+        for block_number in block_numbers:
+            record_start, record_end = block_chunk_index.get_block_span(block_number)
+            yield Block.from_compact_dict(msgpack.unpackb(data[record_start:record_end]))
+
+    def _read_block_from_file(self, filename, block_chunk_index: BlockChunkIndex, block_number):
+        storage = self.get_block_chunk_storage()
+        record_start, record_end = block_chunk_index.get_block_span(block_number)
+        block = Block.from_compact_dict(msgpack.unpackb(storage.load_range(filename, record_start, record_end)))
+
+        meta = get_block_chunk_filename_meta(
+            absolute_file_path=storage.get_optimized_absolute_actual_path(filename),
+            filename=filename,
+        )
+        self._set_block_meta(block, meta)
+        self.get_block_cache()[block_number] = block
+        return block
+
     def _yield_blocks_from_file(self, filename, direction, start=None):
         assert direction in (1, -1)
 
@@ -292,8 +402,14 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
             filename=filename,
         )
 
+        block_chunk_index = self.get_block_chunk_index(filename)
+        if block_chunk_index is None:
+            blocks = self._yield_blocks_from_file_simple(filename, direction)
+        else:
+            blocks = self._yield_blocks_from_file_indexed(filename, block_chunk_index, direction, start=start)
+
         blocks_cache = self.get_block_cache()
-        for block in self._yield_blocks_from_file_simple(filename, direction):
+        for block in blocks:
             block_number = block.get_block_number()
             # TODO(dmu) HIGH: Implement a better skip
             if start is not None:
@@ -332,14 +448,83 @@ class BlockChunkFileBlockchainMixin(FileBlockchainBaseMixin):
         except StopIteration:
             return None
 
+    def get_block_chunk_filename_index(self) -> tuple[list[int], list[Union[int, float]], list[str]]:
+        """
+        Return sorted start block numbers of block chunks, corresponding end block numbers (`math.inf` for
+        the block chunk which is not finalized yet) and filenames
+        """
+        manifest = self.get_block_chunk_storage().get_manifest()
+        if manifest is None:
+            return self._make_block_chunk_filename_index()
+
+        # Manifest version changes only when block chunks are added or finalized (not on block appending)
+        cache = self.get_block_chunk_filename_index_cache()
+        version = manifest.version
+        if (index := cache.get(version)) is None:
+            cache.clear()
+            cache[version] = index = self._make_block_chunk_filename_index()
+
+        return index
+
+    @timeit_method()
+    def _make_block_chunk_filename_index(self):
+        start_block_numbers = []
+        end_block_numbers: list[Union[int, float]] = []
+        filenames = []
+        for filename in self._yield_block_chunk_filenames():
+            meta = get_block_chunk_filename_meta(filename=filename)
+            if meta is None:
+                logger.warning('File %s has invalid name format', filename)
+                continue
+
+            start_block_numbers.append(meta.start_block_number)
+            end_block_numbers.append(if_none(meta.end_block_number, math.inf))
+            filenames.append(filename)
+
+        return start_block_numbers, end_block_numbers, filenames
+
     def yield_block_chunks_meta(self, direction=1) -> Generator[BlockChunkFilenameMeta, None, None]:
-        for block_chunk_filename in self._yield_block_chunk_filenames(direction=direction):
-            meta = self._get_block_chunk_file_path_meta_enhanced(block_chunk_filename)
+        yield from self.yield_block_chunks_meta_slice(FULL_SLICE, direction=direction)
+
+    def yield_block_chunks_meta_slice(
+        self,
+        slice_: slice,
+        direction=1,
+        from_block_number: Optional[int] = None,
+        to_block_number: Optional[int] = None,
+    ) -> Generator[BlockChunkFilenameMeta, None, None]:
+        """
+        Yield meta of block chunks containing blocks from `from_block_number` to `to_block_number` (both
+        inclusive). Only meta of block chunks in the `slice_` (applied after filtering and ordering) is built
+        """
+        assert direction in (1, -1)
+
+        start_block_numbers, end_block_numbers, filenames = self.get_block_chunk_filename_index()
+        start = 0
+        stop = len(filenames)
+        if from_block_number is not None:
+            # Block chunks do not overlap, so end block numbers are sorted as well
+            start = bisect_left(end_block_numbers, from_block_number)
+            if start < stop and end_block_numbers[start] == math.inf:
+                last_block_number = self._get_block_chunk_last_block_number(filenames[start])
+                if last_block_number is None or last_block_number < from_block_number:
+                    start += 1
+
+        if to_block_number is not None:
+            stop = bisect_right(start_block_numbers, to_block_number)
+
+        positions = range(start, stop)
+        if direction == -1:
+            positions = positions[::-1]
+
+        for position in positions[slice_]:
+            filename = filenames[position]
+            meta = self._get_block_chunk_file_path_meta_enhanced(filename)
             if meta is None:
-                logger.warning('File %s has invalid name format', block_chunk_filename)
+                logger.warning('File %s has invalid name format', filename)
                 continue
 
             yield meta
 
     def get_block_chunks_count(self):
-        return ilen(self._yield_block_chunk_filenames())
+        return len(self.get_block_chunk_filename_index()[2])
@@ -0,0 +1,105 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+import filelock
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBlockChunkFinalizer:
+    """
+    Compress and finalize block chunks in a background thread, so blockchain lock is not held for compression.
+    Block chunks are moved to their final names before scheduling, so readers use uncompressed block chunk
+    until compressed one replaces it.
+
+    Other processes may find a block chunk not compressed yet and schedule its finalization too, so block chunks
+    are finalized under per block chunk file locks (in `lock_directory`): block chunks being finalized by another
+    process are not scheduled and block chunks finalized by another process are skipped.
+    """
+
+    def __init__(self, storage, lock_directory):
+        self.storage = storage
+        self.lock_directory = lock_directory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Futures are removed by done callbacks run in the finalizer thread
+        self._futures_lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if (executor := self._executor) is None:
+            self._executor = executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='block-chunk-finalizer')
+
+        return executor
+
+    def get_lock(self, filename):
+        os.makedirs(self.lock_directory, exist_ok=True)
+        return filelock.FileLock(os.path.join(self.lock_directory, filename + '.lock'), timeout=0)
+
+    def schedule(self, filename):
+        with self._futures_lock:
+            if filename in self._futures:
+                return
+
+            if self._is_locked(filename):
+                logger.debug('Block chunk %s is being finalized by another process', filename)
+                return
+
+            future = self.get_executor().submit(self._finalize, filename)
+            self._futures[filename] = future
+
+        # The callback is called immediately (in this thread) if the future is already done
+        future.add_done_callback(lambda _: self._remove_future(filename))
+
+    def _remove_future(self, filename):
+        with self._futures_lock:
+            self._futures.pop(filename, None)
+
+    def is_pending(self, filename):
+        with self._futures_lock:
+            return filename in self._futures
+
+    def wait(self):
+        with self._futures_lock:
+            futures = list(self._futures.values())
+
+        wait(futures)
+
+    def close(self):
+        """
+        Wait for scheduled block chunks to be finalized and stop the finalizer thread (it is started again if
+        finalization is scheduled after closing)
+        """
+        with self._futures_lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor:
+            executor.shutdown(wait=True)
+
+    def _is_locked(self, filename):
+        lock = self.get_lock(filename)
+        try:
+            lock.acquire()
+        except filelock.Timeout:
+            return True
+
+        lock.release()
+        return False
+
+    def _finalize(self, filename):
+        try:
+            with self.get_lock(filename) as lock:
+                # Lock file is removed while it is locked, so a process that opened it before is the only one
+                # that may lock it after us and it finds the block chunk finalized
+                if not self.storage.is_finalized(filename):
+                    self.storage.finalize(filename)
+
+                os.remove(lock.lock_file)
+        except filelock.Timeout:
+            logger.debug('Block chunk %s is being finalized by another process', filename)
+        except Exception:
+            logger.exception('Could not finalize block chunk %s', filename)
+            raise
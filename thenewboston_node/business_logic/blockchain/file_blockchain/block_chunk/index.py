@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+import msgpack
+
+from thenewboston_node.business_logic.storages.seekable import get_record_offsets
+
+
+class BlockChunkIndex(namedtuple('BlockChunkIndex', 'start_block_number offsets')):
+    """
+    Offsets of blocks in the uncompressed block chunk data: block `start_block_number + i` spans from
+    `offsets[i]` to `offsets[i + 1]` (exclusive)
+    """
+
+    @classmethod
+    def from_binary_data(cls, start_block_number, binary_data):
+        return cls(start_block_number, get_record_offsets(binary_data))
+
+    @classmethod
+    def from_messagepack(cls, messagepack_binary):
+        start_block_number, offsets = msgpack.unpackb(messagepack_binary)
+        return cls(start_block_number, offsets)
+
+    def to_messagepack(self):
+        return msgpack.packb([self.start_block_number, self.offsets])
+
+    @property
+    def end_block_number(self):
+        return self.start_block_number + len(self.offsets) - 2
+
+    def get_block_span(self, block_number) -> tuple[int, int]:
+        position = block_number - self.start_block_number
+        if not 0 <= position < len(self.offsets) - 1:
+            raise IndexError(f'Block number {block_number} is out of the block chunk range')
+
+        offsets = self.offsets
+        return offsets[position], offsets[position + 1]
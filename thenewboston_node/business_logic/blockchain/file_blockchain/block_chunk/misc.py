@@ -3,6 +3,7 @@ import re
 from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FUNCTIONS
 
 BLOCK_CHUNK_FILENAME_TEMPLATE = '{start}-{end}-block-chunk.msgpack'
+BLOCK_CHUNK_INDEX_FILENAME_TEMPLATE = '{start}-{end}-block-chunk-index.msgpack'
 BLOCK_CHUNK_FILENAME_RE = re.compile(
     BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=r'(?P<start>\d+)', end=r'(?P<end>\d+|x+)') +
     r'(?:|\.(?P<compression>{}))$'.format('|'.join(COMPRESSION_FUNCTIONS.keys()))
@@ -1,18 +1,23 @@
 import logging
 import os.path
+from bisect import bisect_left, bisect_right
 from typing import Any, Callable, Generator, Union, cast
 
-from more_itertools import ilen
-
 from thenewboston_node.business_logic.blockchain.file_blockchain.base import (  # noqa: I101
     EXPECTED_LOCK_EXCEPTION, LOCKED_EXCEPTION, FileBlockchainBaseMixin
 )
+from thenewboston_node.business_logic.exceptions import InvalidBlockchainError
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
 from thenewboston_node.core.logging import timeit_method
-from thenewboston_node.core.utils.file_lock import ensure_locked, lock_method
+from thenewboston_node.core.utils.file_lock import ensure_locked, lock_cached, lock_method
+from thenewboston_node.core.utils.itertools import FULL_SLICE
+from thenewboston_node.core.utils.misc import if_none
 
+from .delta import BlockchainStateDelta, load_blockchain_state_or_delta
 from .meta import get_blockchain_state_filename_meta
-from .misc import BLOCKCHAIN_STATE_FILENAME_TEMPLATE, LAST_BLOCK_NUMBER_NONE_SENTINEL
+from .misc import (
+    BLOCKCHAIN_STATE_DELTA_FILENAME_TEMPLATE, BLOCKCHAIN_STATE_FILENAME_TEMPLATE, LAST_BLOCK_NUMBER_NONE_SENTINEL
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +27,23 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
     def get_blockchain_state_storage(self):
         raise NotImplementedError('Must be implemented in child class')
 
+    def get_blockchain_state_index_cache(self):
+        raise NotImplementedError('Must be implemented in child class')
+
     def get_blockchain_state_cache(self):
         raise NotImplementedError('Must be implemented in child class')
 
     def get_blockchain_state_directory(self):
         raise NotImplementedError('Must be implemented in child class')
 
-    def make_blockchain_state_filename(self, last_block_number):
+    def get_blockchain_state_max_delta_depth(self):
+        raise NotImplementedError('Must be implemented in child class')
+
+    def make_blockchain_state_filename(self, last_block_number, is_delta=False):
         # We need to zfill LAST_BLOCK_NUMBER_NONE_SENTINEL to maintain the nested structure of directories
         prefix_base = LAST_BLOCK_NUMBER_NONE_SENTINEL if last_block_number in (None, -1) else str(last_block_number)
-        return BLOCKCHAIN_STATE_FILENAME_TEMPLATE.format(
-            last_block_number=prefix_base.zfill(self.get_block_number_digits_count())
-        )
+        template = BLOCKCHAIN_STATE_DELTA_FILENAME_TEMPLATE if is_delta else BLOCKCHAIN_STATE_FILENAME_TEMPLATE
+        return template.format(last_block_number=prefix_base.zfill(self.get_block_number_digits_count()))
 
     @lock_method(lock_attr='file_lock', exception=LOCKED_EXCEPTION)
     def add_blockchain_state(self, blockchain_state: BlockchainState):
@@ -42,8 +52,96 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
     @timeit_method()
     @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
     def persist_blockchain_state(self, blockchain_state: BlockchainState):
-        filename = self.make_blockchain_state_filename(blockchain_state.last_block_number)
-        self.get_blockchain_state_storage().save(filename, blockchain_state.to_messagepack(), is_final=True)
+        # Get the index before saving to avoid the index being built with the new file already included
+        last_block_numbers, filenames = self.get_blockchain_state_index()
+
+        last_block_number = blockchain_state.last_block_number
+        delta = self._make_blockchain_state_delta(blockchain_state, last_block_numbers, filenames)
+        if delta is None:
+            filename = self.make_blockchain_state_filename(last_block_number)
+            binary_data = blockchain_state.to_messagepack()
+        else:
+            filename = self.make_blockchain_state_filename(last_block_number, is_delta=True)
+            binary_data = delta.to_messagepack()
+
+        self.get_blockchain_state_storage().save(filename, binary_data, is_final=True)
+
+        position = bisect_left(last_block_numbers, last_block_number)
+        last_block_numbers.insert(position, last_block_number)
+        filenames.insert(position, filename)
+
+    def _make_blockchain_state_delta(self, blockchain_state: BlockchainState, last_block_numbers, filenames):
+        max_delta_depth = self.get_blockchain_state_max_delta_depth()
+        if not max_delta_depth or not filenames:
+            return None
+
+        # Only the blockchain state following the last one is stored as a delta, so a delta base always exists
+        if if_none(blockchain_state.last_block_number, -1) <= last_block_numbers[-1]:
+            return None
+
+        base = self._load_blockchain_state(filenames[-1])
+        base_depth = base.meta.get('delta_depth', 0) if base.meta else 0  # type: ignore
+        if base_depth >= max_delta_depth:
+            return None
+
+        return BlockchainStateDelta.from_blockchain_states(blockchain_state, base, base_depth=base_depth)
+
+    def get_blockchain_state_index(self) -> tuple[list[int], list[str]]:
+        """
+        Return sorted last block numbers of blockchain states (-1 for the genesis state) and corresponding filenames
+        """
+        manifest = self.get_blockchain_state_storage().get_manifest()
+        if manifest is None:
+            return self._get_blockchain_state_index_lock_cached()
+
+        # Manifest version changes on any change of blockchain states (including changes made by other processes)
+        cache = self.get_blockchain_state_index_cache()
+        version = manifest.version
+        if (index := cache.get(version)) is None:
+            cache.clear()
+            cache[version] = index = self._make_blockchain_state_index()
+
+        return index
+
+    def get_full_blockchain_state_index(self) -> tuple[list[int], list[str]]:
+        """
+        Return the same as `get_blockchain_state_index()`, but for full (not delta) blockchain states only
+        """
+        full_last_block_numbers = []
+        full_filenames = []
+        for last_block_number, filename in zip(*self.get_blockchain_state_index()):
+            if not get_blockchain_state_filename_meta(filename=filename).is_delta:  # type: ignore
+                full_last_block_numbers.append(last_block_number)
+                full_filenames.append(filename)
+
+        return full_last_block_numbers, full_filenames
+
+    def _get_blockchain_state_filename(self, last_block_number):
+        last_block_numbers, filenames = self.get_blockchain_state_index()
+        position = bisect_left(last_block_numbers, last_block_number)
+        if position == len(last_block_numbers) or last_block_numbers[position] != last_block_number:
+            raise InvalidBlockchainError(f'Blockchain state with last block number {last_block_number} is not found')
+
+        return filenames[position]
+
+    @lock_cached
+    def _get_blockchain_state_index_lock_cached(self):
+        return self._make_blockchain_state_index()
+
+    @timeit_method()
+    def _make_blockchain_state_index(self):
+        last_block_numbers = []
+        filenames = []
+        for filename in self.get_blockchain_state_storage().list_directory():
+            meta = get_blockchain_state_filename_meta(filename=filename)
+            if meta is None:
+                logger.warning('File %s has invalid name format', filename)
+                continue
+
+            last_block_numbers.append(if_none(meta.last_block_number, -1))
+            filenames.append(filename)
+
+        return last_block_numbers, filenames
 
     @timeit_method(verbose_args=True)
     def _load_blockchain_state(self, filename):
@@ -55,7 +153,16 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
 
         storage = self.get_blockchain_state_storage()
         assert storage.is_finalized(filename)
-        blockchain_state = BlockchainState.from_messagepack(storage.load(filename))
+        blockchain_state_or_delta = load_blockchain_state_or_delta(storage.load(filename))
+        if isinstance(blockchain_state_or_delta, BlockchainStateDelta):
+            base = self._load_blockchain_state(
+                self._get_blockchain_state_filename(blockchain_state_or_delta.base_last_block_number)
+            )
+            blockchain_state = blockchain_state_or_delta.apply(base)
+            delta_depth = blockchain_state_or_delta.depth
+        else:
+            blockchain_state = blockchain_state_or_delta
+            delta_depth = 0
 
         absolute_file_path = storage.get_optimized_absolute_actual_path(filename)
 
@@ -73,7 +180,7 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
             blockchain=self,
         )
 
-        blockchain_state.meta = meta._asdict()
+        blockchain_state.meta = dict(meta._asdict(), delta_depth=delta_depth)
         cache[filename] = blockchain_state
 
         return blockchain_state
@@ -81,11 +188,20 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
     def _yield_blockchain_states(
         self,
         direction,
-        lazy=False
+        lazy=False,
+        slice_: slice = FULL_SLICE,
+        is_full_only=False,
     ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
         assert direction in (1, -1)
 
-        for file_path in self.get_blockchain_state_storage().list_directory(sort_direction=direction):
+        if is_full_only:
+            _, filenames = self.get_full_blockchain_state_index()
+        else:
+            _, filenames = self.get_blockchain_state_index()
+
+        # We make a copy of filenames to be safe in case new blockchain states are added during the iteration
+        filenames = filenames[:] if direction == 1 else filenames[::-1]
+        for file_path in filenames[slice_]:
             if lazy:
                 yield cast(
                     Callable[[Any], BlockchainState],
@@ -104,8 +220,69 @@ class BlochainStateFileBlockchainMixin(FileBlockchainBaseMixin):
     ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
         yield from self._yield_blockchain_states(-1, lazy=lazy)
 
+    def yield_blockchain_states_slice(
+        self,
+        slice_: slice,
+        direction=1,
+        lazy=False
+    ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
+        yield from self._yield_blockchain_states(direction, lazy=lazy, slice_=slice_)
+
+    def yield_full_blockchain_states_slice(
+        self,
+        slice_: slice,
+        direction=1,
+        lazy=False
+    ) -> Generator[Union[BlockchainState, Callable[[Any], BlockchainState]], None, None]:
+        yield from self._yield_blockchain_states(direction, lazy=lazy, slice_=slice_, is_full_only=True)
+
     def get_blockchain_state_count(self) -> int:
-        return ilen(self.get_blockchain_state_storage().list_directory())
+        return len(self.get_blockchain_state_index()[0])
+
+    def get_full_blockchain_state_count(self) -> int:
+        return len(self.get_full_blockchain_state_index()[0])
+
+    def yield_blockchain_state_last_block_numbers(self) -> Generator[int, None, None]:
+        yield from self.get_blockchain_state_index()[0][:]
+
+    def has_blockchain_states(self):
+        return bool(self.get_blockchain_state_index()[0])
+
+    def get_first_blockchain_state(self) -> BlockchainState:
+        _, filenames = self.get_blockchain_state_index()
+        if not filenames:
+            raise InvalidBlockchainError('Blockchain must contain a blockchain state')
+
+        return self._load_blockchain_state(filenames[0])
+
+    def get_last_blockchain_state(self) -> BlockchainState:
+        _, filenames = self.get_blockchain_state_index()
+        if not filenames:
+            raise InvalidBlockchainError('Blockchain must contain a blockchain state')
+
+        return self._load_blockchain_state(filenames[-1])
+
+    def get_last_blockchain_state_last_block_number(self) -> int:
+        last_block_numbers, _ = self.get_blockchain_state_index()
+        if not last_block_numbers:
+            raise InvalidBlockchainError('Blockchain must contain a blockchain state')
+
+        return last_block_numbers[-1]
+
+    def get_blockchain_state_by_block_number(self, block_number: int, inclusive: bool = False) -> BlockchainState:
+        if block_number < -1:
+            raise ValueError('block_number must be greater or equal to -1')
+
+        if block_number == -1:
+            assert not inclusive
+            return self.get_first_blockchain_state()
+
+        last_block_numbers, filenames = self.get_blockchain_state_index()
+        position = (bisect_right if inclusive else bisect_left)(last_block_numbers, block_number)
+        if position == 0:
+            raise InvalidBlockchainError(f'Blockchain state before block number {block_number} is not found')
+
+        return self._load_blockchain_state(filenames[position - 1])
 
     def _get_blockchain_state_real_file_path(self, file_path):
         optimized_path = self.get_blockchain_state_storage().get_optimized_path(file_path)
@@ -0,0 +1,63 @@
+"""
+Delta blockchain state file format: messagepack array `[base_last_block_number, delta_depth, compact_blockchain_state]`
+where the blockchain state contains only account states that differ from the base blockchain state (the one with
+`base_last_block_number`, -1 for the genesis blockchain state). Full blockchain state files contain a messagepack
+map, so both formats can be told apart by the top level type.
+"""
+from dataclasses import replace
+from typing import Union
+
+import msgpack
+
+from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
+from thenewboston_node.core.utils.misc import if_none
+
+
+class BlockchainStateDelta:
+
+    def __init__(self, base_last_block_number: int, depth: int, blockchain_state: BlockchainState):
+        self.base_last_block_number = base_last_block_number
+        self.depth = depth
+        self.blockchain_state = blockchain_state
+
+    @classmethod
+    def from_blockchain_states(cls, blockchain_state: BlockchainState, base: BlockchainState, base_depth=0):
+        base_account_states = base.message.account_states
+        changed_account_states = {
+            account: account_state
+            for account, account_state in blockchain_state.message.account_states.items()
+            # Account states are shared by blockchain states until changed, so identity check goes first
+            if (base_account_state := base_account_states.get(account)) is not account_state and
+            base_account_state != account_state
+        }
+        assert base_account_states.keys() <= blockchain_state.message.account_states.keys()
+
+        return cls(
+            base_last_block_number=if_none(base.last_block_number, -1),
+            depth=base_depth + 1,
+            blockchain_state=replace(
+                blockchain_state,
+                message=replace(blockchain_state.message, account_states=changed_account_states),
+                meta=None,
+            )
+        )
+
+    def to_messagepack(self) -> bytes:
+        return msgpack.packb([self.base_last_block_number, self.depth, self.blockchain_state.to_compact_dict()])
+
+    def apply(self, base: BlockchainState) -> BlockchainState:
+        blockchain_state = self.blockchain_state
+        account_states = base.message.account_states.copy()
+        account_states.update(blockchain_state.message.account_states)
+        return replace(blockchain_state, message=replace(blockchain_state.message, account_states=account_states))
+
+
+def load_blockchain_state_or_delta(binary_data: bytes) -> Union[BlockchainState, BlockchainStateDelta]:
+    unpacked = msgpack.unpackb(binary_data)
+    if isinstance(unpacked, list):
+        base_last_block_number, depth, compact_blockchain_state = unpacked
+        return BlockchainStateDelta(
+            base_last_block_number, depth, BlockchainState.from_compact_dict(compact_blockchain_state)
+        )
+
+    return BlockchainState.from_compact_dict(unpacked)
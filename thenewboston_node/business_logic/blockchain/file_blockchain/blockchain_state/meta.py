@@ -9,7 +9,7 @@ from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FU
 BlockchainFilenameMeta = namedtuple(
     'BlockchainFilenameMeta',
     'absolute_file_path blockchain_root_relative_file_path storage_relative_file_path filename base_filename '
-    'last_block_number compression blockchain'
+    'last_block_number compression is_delta blockchain'
 )
 
 
@@ -54,5 +54,6 @@ def get_blockchain_state_filename_meta(
         base_filename=base_filename,
         last_block_number=last_block_number,
         compression=match.group('compression') or None,
+        is_delta=bool(match.group('delta')),
         blockchain=blockchain,
     )
@@ -4,7 +4,10 @@ from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FU
 
 LAST_BLOCK_NUMBER_NONE_SENTINEL = '!'
 BLOCKCHAIN_STATE_FILENAME_TEMPLATE = '{last_block_number}-blockchain-state.msgpack'
+# Delta files are not self-contained (see `delta` module), so they are named differently to never be taken
+# for full blockchain states (by other nodes, for example)
+BLOCKCHAIN_STATE_DELTA_FILENAME_TEMPLATE = '{last_block_number}-blockchain-state-delta.msgpack'
 BLOCKCHAIN_STATE_FILENAME_RE = re.compile(
-    BLOCKCHAIN_STATE_FILENAME_TEMPLATE.format(last_block_number=r'(?P<last_block_number>\d*(?:!|\d))') +
+    r'(?P<last_block_number>\d*(?:!|\d))-blockchain-state(?P<delta>-delta)?\.msgpack' +
     r'(?:|\.(?P<compression>{}))$'.format('|'.join(COMPRESSION_FUNCTIONS.keys()))
 )
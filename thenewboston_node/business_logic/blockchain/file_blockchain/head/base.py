@@ -0,0 +1,109 @@
+import logging
+from typing import Optional
+
+import filelock
+
+from thenewboston_node.business_logic.blockchain.file_blockchain.base import (  # noqa: I101
+    EXPECTED_LOCK_EXCEPTION, FileBlockchainBaseMixin
+)
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.utils.file_lock import ensure_locked
+
+from .pointer import BlockchainHead
+
+logger = logging.getLogger(__name__)
+
+
+class HeadFileBlockchainMixin(FileBlockchainBaseMixin):
+
+    def get_head(self) -> BlockchainHead:
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_up_to_date_head(self) -> Optional[BlockchainHead]:
+        """
+        Return head pointing to the last block or None if it is not known (no blocks or the head could not be
+        verified against the blocks on disk)
+        """
+        head = self.get_head()
+        head.load()  # catch up with blocks added by another process
+        if not head.is_verified:
+            self._verify_head(head)
+
+        return head if head.is_verified and head.is_set() else None
+
+    def _get_head_on_disk(self):
+        last_block_chunk_filename = self._get_last_block_chunk_file_path()  # type: ignore
+        if last_block_chunk_filename is None:
+            return None, None
+
+        return self._get_block_chunk_last_block_number(
+            last_block_chunk_filename
+        ), last_block_chunk_filename  # type: ignore
+
+    def _verify_head(self, head: BlockchainHead):
+        # The head is written after a block is appended, so it may be behind the blocks on disk after a crash
+        # (or be missing for blockchains created before the head was introduced)
+        if (head.block_number, head.chunk_filename) == self._get_head_on_disk():
+            head.is_verified = True
+            return
+
+        try:
+            with self.file_lock:  # type: ignore
+                self._rebuild_head(head)
+        except filelock.Timeout:
+            logger.debug('Blockchain is locked by another process: head is not verified')
+
+    def _rebuild_head(self, head: BlockchainHead):
+        head.load()
+        block_number, chunk_filename = self._get_head_on_disk()
+        if (head.block_number, head.chunk_filename) != (block_number, chunk_filename):
+            logger.warning('Blockchain head does not match blocks on disk: rebuilding')
+            block = None if block_number is None else self.get_block_by_number(block_number)  # type: ignore
+            if block is None:
+                head.remove()
+            else:
+                self._write_head(head, block, chunk_filename)
+
+        head.is_verified = True
+
+    @staticmethod
+    def _write_head(head: BlockchainHead, block: Block, chunk_filename):
+        head.write(block.get_block_number(), block.hash, block.message.timestamp, chunk_filename)  # type: ignore
+
+    @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
+    def persist_block(self, block: Block):
+        super().persist_block(block)  # type: ignore
+
+        # The appended block becomes the last block on disk regardless of the previous head state
+        head = self.get_head()
+        self._write_head(head, block, self.get_current_block_chunk_filename())
+        head.is_verified = True
+
+    @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
+    def finalize_block_chunk(self, block_chunk_filename, last_block_number=None):
+        destination_filename = super(
+        ).finalize_block_chunk(  # type: ignore
+            block_chunk_filename, last_block_number=last_block_number
+        )
+
+        head = self.get_head()
+        head.load()
+        if head.is_set() and head.chunk_filename == block_chunk_filename:
+            head.write(head.block_number, head.block_hash, head.block_timestamp, destination_filename)  # type: ignore
+
+        return destination_filename
+
+    def get_next_block_number(self) -> int:
+        if (head := self.get_up_to_date_head()) is None:
+            return super().get_next_block_number()  # type: ignore
+
+        return head.block_number + 1  # type: ignore
+
+    def get_next_block_identifier(self) -> str:
+        if (head := self.get_up_to_date_head()) is None:
+            return super().get_next_block_identifier()  # type: ignore
+
+        # Blockchain state for the last block (if any) has the last block hash as the next block identifier
+        block_hash = head.block_hash
+        assert block_hash
+        return block_hash
@@ -0,0 +1,99 @@
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+import msgpack
+
+from thenewboston_node.core.utils.misc import coerce_from_json_type, coerce_to_json_type
+from thenewboston_node.core.utils.types import hexstr
+
+logger = logging.getLogger(__name__)
+
+
+class BlockchainHead:
+    """
+    Number, hash and timestamp of the last block and filename of the block chunk it is stored in.
+
+    The head is backed by a small messagepack file that is replaced atomically on every change, so readers
+    (including other processes) never see a partially written head and catch up by rereading the file
+    once it is replaced.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        # Set once the head was checked against (or written after) the blocks on disk by this process
+        self.is_verified = False
+        self.reset()
+
+    def reset(self):
+        self.block_number: Optional[int] = None
+        self.block_hash: Optional[hexstr] = None
+        self.block_timestamp: Optional[datetime] = None
+        self.chunk_filename: Optional[str] = None
+        self._file_identity = None
+
+    def is_set(self):
+        return self.block_number is not None
+
+    def load(self):
+        """
+        Read the file if it was replaced since the last read
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            self.reset()
+            return
+
+        file_identity = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_identity == self._file_identity:
+            return
+
+        self.reset()
+        try:
+            with open(self.file_path, 'rb') as fo:
+                dict_ = msgpack.unpackb(fo.read())
+
+            self.block_number = dict_['block_number']
+            self.block_hash = dict_['block_hash']
+            self.block_timestamp = coerce_from_json_type(dict_['block_timestamp'], datetime)
+            self.chunk_filename = dict_['chunk_filename']
+        except Exception:
+            logger.warning('Could not read blockchain head from %s', self.file_path, exc_info=True)
+            self.reset()
+            return
+
+        self._file_identity = file_identity
+
+    def write(self, block_number: int, block_hash: hexstr, block_timestamp: datetime, chunk_filename: str):
+        binary_data = msgpack.packb({
+            'block_number': block_number,
+            'block_hash': block_hash,
+            'block_timestamp': coerce_to_json_type(block_timestamp),
+            'chunk_filename': chunk_filename,
+        })
+
+        # The head is not fsynced: it is verified against the blocks on disk after process restart anyway
+        temporary_file_path = self.file_path + '.tmp'
+        with open(temporary_file_path, 'wb') as fo:
+            fo.write(binary_data)
+
+        os.replace(temporary_file_path, self.file_path)
+
+        self.block_number = block_number
+        self.block_hash = block_hash
+        self.block_timestamp = block_timestamp
+        self.chunk_filename = chunk_filename
+
+        stat = os.stat(self.file_path)
+        self._file_identity = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def remove(self):
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+        self.reset()
+        self.is_verified = False
@@ -0,0 +1,126 @@
+import logging
+import os
+from typing import Any, Optional
+
+import msgpack
+
+from thenewboston_node.core.logging import timeit_method
+from thenewboston_node.core.utils.os import replace_durably
+
+logger = logging.getLogger(__name__)
+
+
+class SidecarIndex:
+    """
+    Index of blocks data kept in memory and backed by an append-only file of messagepack records
+    `[block_number, block data]` (one record per block), so other processes (and process restarts) can catch up
+    by reading the records appended since the last read. The file is compacted by `rewrite()`.
+
+    Child classes define how block data is applied to the index and what records the compacted file consists of.
+    """
+
+    name = 'index'  # used for logging
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.reset()
+
+    def reset(self):
+        self.last_block_number: Optional[int] = None
+        self._file_identity = None
+        self._file_offset = 0
+
+    def apply(self, block_number: int, block_data):
+        raise NotImplementedError('Must be implemented in a child class')
+
+    def get_compacted_records(self) -> dict[int, Any]:
+        """
+        Return block data by block number the index can be restored from
+        """
+        raise NotImplementedError('Must be implemented in a child class')
+
+    def pack_block_data(self, block_data):
+        return block_data
+
+    def unpack_block_data(self, packed_block_data):
+        return packed_block_data
+
+    def append(self, block_number: int, block_data):
+        assert self.last_block_number is not None and self.last_block_number < block_number
+        if self._file_identity is None:
+            # The index was not read from or written to the file yet, so we can not rely on the file content
+            self.apply(block_number, block_data)
+            self.rewrite()
+            return
+
+        data = self._pack_records([(block_number, block_data)])
+        with open(self.file_path, 'ab') as fo:
+            fo.write(data)
+
+        self._file_offset += len(data)
+        self.apply(block_number, block_data)
+
+    @timeit_method()
+    def load(self):
+        """
+        Apply records appended to the file since the last read (the entire file is reread if it was replaced)
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            self.reset()
+            return
+
+        file_identity = (stat.st_dev, stat.st_ino)
+        if file_identity != self._file_identity or stat.st_size < self._file_offset:
+            self.reset()
+            self._file_identity = file_identity
+
+        if stat.st_size == self._file_offset:
+            return
+
+        start_offset = self._file_offset
+        with open(self.file_path, 'rb') as fo:
+            fo.seek(start_offset)
+            unpacker = msgpack.Unpacker(fo)
+            try:
+                # Unpacker stops at the last complete record, so a torn record is never applied
+                for block_number, packed_block_data in unpacker:
+                    self.apply(block_number, self.unpack_block_data(packed_block_data))
+                    self._file_offset = start_offset + unpacker.tell()
+            except Exception:
+                logger.warning('Could not read %s from %s', self.name, self.file_path, exc_info=True)
+                self.reset()
+
+    @timeit_method()
+    def rewrite(self):
+        """
+        Replace the file with the compacted content of the index
+        """
+        records = sorted(self.get_compacted_records().items())
+        last_block_number = self.last_block_number
+        if last_block_number is not None and (not records or records[-1][0] != last_block_number):
+            records.append((last_block_number, {}))
+
+        temporary_file_path = self.file_path + '.tmp'
+        with open(temporary_file_path, 'wb') as fo:
+            fo.write(self._pack_records(records))
+
+        replace_durably(temporary_file_path, self.file_path)
+
+        stat = os.stat(self.file_path)
+        self._file_identity = (stat.st_dev, stat.st_ino)
+        self._file_offset = stat.st_size
+
+    def remove(self):
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+        self.reset()
+
+    def _pack_records(self, records) -> bytes:
+        return b''.join(
+            msgpack.packb([block_number, self.pack_block_data(block_data)]) for block_number, block_data in records
+        )
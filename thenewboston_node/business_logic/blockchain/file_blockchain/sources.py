@@ -1,11 +1,36 @@
 from collections.abc import Iterator
-from urllib.request import urlopen
 
 import msgpack
 from more_itertools import always_reversible
 
 from thenewboston_node.business_logic.models import Block
-from thenewboston_node.business_logic.storages.file_system import decompress, get_compressor_from_location
+from thenewboston_node.business_logic.storages.file_system import (
+    decompress, get_compressor_from_location, yield_decompressed
+)
+from thenewboston_node.business_logic.storages.seekable import SeekableReader
+from thenewboston_node.core.utils.http_utils import open_url
+
+HTTP_PARTIAL_CONTENT = 206
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def yield_records_reversed(reader: SeekableReader):
+    for frame in reader.yield_frames(direction=-1):
+        unpacker = msgpack.Unpacker()
+        unpacker.feed(frame)
+        yield from reversed(list(unpacker))
+
+
+def yield_binary_data_chunks(binary_data_stream, chunk_size):
+    while chunk := binary_data_stream.read(chunk_size):
+        yield chunk
+
+
+def yield_unpacked(binary_data_chunks):
+    unpacker = msgpack.Unpacker()
+    for chunk in binary_data_chunks:
+        unpacker.feed(chunk)
+        yield from unpacker
 
 
 class BinaryDataBlockSource(Iterator):
@@ -25,7 +50,7 @@ class BinaryDataBlockSource(Iterator):
     def binary_data(self):
         if (binary_data := self._binary_data) is None:
             compressor = self.compressor
-            original_binary_data = self._original_binary_data
+            original_binary_data = self.original_binary_data
             if compressor:
                 self._binary_data = binary_data = decompress(original_binary_data, compressor)
             else:
@@ -33,9 +58,25 @@ class BinaryDataBlockSource(Iterator):
 
         return binary_data
 
+    @property
+    def original_binary_data(self):
+        return self._original_binary_data
+
+    def get_seekable_reader(self) -> SeekableReader:
+        return SeekableReader.from_binary_data(self.original_binary_data)
+
     @property
     def unpacker(self):
         if (unpacker := self._unpacker) is None:
+            if self.direction == -1 and self.compressor == 'seekable':
+                reader = self.get_seekable_reader()
+                if reader.is_record_aligned:
+                    # Decompress frames from the end one at a time instead of decompressing the entire data
+                    self._unpacker = unpacker = yield_records_reversed(reader)
+                    return unpacker
+
+                self._binary_data = b''.join(reader.yield_frames())
+
             unpacker = msgpack.Unpacker()
             unpacker.feed(self.binary_data)
             if self.direction == -1:
@@ -50,9 +91,15 @@ class BinaryDataBlockSource(Iterator):
 
 
 class BinaryDataStreamBlockSource(BinaryDataBlockSource):
+    """
+    Blocks are read in forward direction as the stream data arrives (through incremental decompressor), so only
+    `read_chunk_size` bytes of the stream and an incomplete block are kept in memory. Other cases require
+    the entire stream to be read
+    """
 
-    def __init__(self, binary_data_stream, **kwargs):
+    def __init__(self, binary_data_stream, read_chunk_size=READ_CHUNK_SIZE, **kwargs):
         self._binary_data_stream = binary_data_stream
+        self.read_chunk_size = read_chunk_size
 
         super().__init__(None, **kwargs)
 
@@ -65,14 +112,22 @@ class BinaryDataStreamBlockSource(BinaryDataBlockSource):
         return self._binary_data_stream
 
     @property
-    def binary_data(self):
-        if (binary_data := self._binary_data) is None:
-            # TODO(dmu) LOW: Later we may need to read data in chunk (in case of longer data streams)
-            self._original_binary_data = self.binary_data_stream.read()
-            binary_data = super().binary_data
-            assert self._binary_data is not None
+    def original_binary_data(self):
+        if (original_binary_data := self._original_binary_data) is None:
+            self._original_binary_data = original_binary_data = self.binary_data_stream.read()
 
-        return binary_data
+        return original_binary_data
+
+    @property
+    def unpacker(self):
+        if self._unpacker is None and self.direction == 1 and self._original_binary_data is None:
+            self._unpacker = yield_unpacked(
+                yield_decompressed(
+                    yield_binary_data_chunks(self.binary_data_stream, self.read_chunk_size), self.compressor
+                )
+            )
+
+        return super().unpacker
 
 
 class OpenableBlockSource(BinaryDataStreamBlockSource):
@@ -104,8 +159,46 @@ class FileBlockSource(OpenableBlockSource):
     def open(self):  # noqa: A003
         return open(self.source_location, mode='rb')
 
+    def get_seekable_reader(self) -> SeekableReader:
+        if self._original_binary_data is not None:
+            return super().get_seekable_reader()
+
+        return SeekableReader.from_file_object(self.binary_data_stream)
+
 
 class URLBlockSource(OpenableBlockSource):
+    """
+    Block source downloaded with `session` (to reuse pooled connections) or with `urlopen()` if it is not provided
+    """
+
+    def __init__(self, source_location, *, session=None, timeout=None, **kwargs):
+        self.session = session
+        self.timeout = timeout
+        super().__init__(source_location, **kwargs)
 
     def open(self):  # noqa: A003
-        return urlopen(self.source_location)
+        return open_url(self.source_location, session=self.session, timeout=self.timeout)
+
+    def get_seekable_reader(self) -> SeekableReader:
+        if self._original_binary_data is not None:
+            return super().get_seekable_reader()
+
+        # Download only the frame table and the frames being read with HTTP range requests
+        return SeekableReader(
+            lambda start, end: self._read_range(f'bytes={start}-{end - 1}', start, end),
+            lambda length: self._read_range(f'bytes=-{length}', -length, None),
+        )
+
+    def _read_range(self, range_header, start, end):
+        if (original_binary_data := self._original_binary_data) is None:
+            with open_url(
+                self.source_location, session=self.session, timeout=self.timeout, headers={'Range': range_header}
+            ) as response:
+                data = response.read()
+                if response.status == HTTP_PARTIAL_CONTENT:
+                    return data
+
+            # The server does not support range requests and returned the entire content
+            self._original_binary_data = original_binary_data = data
+
+        return original_binary_data[start:end]
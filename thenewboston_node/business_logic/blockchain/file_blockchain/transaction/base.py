@@ -0,0 +1,104 @@
+import logging
+from itertools import islice
+from typing import Optional
+
+from thenewboston_node.business_logic.blockchain.file_blockchain.base import (  # noqa: I101
+    EXPECTED_LOCK_EXCEPTION, FileBlockchainBaseMixin
+)
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.logging import timeit_method
+from thenewboston_node.core.utils.file_lock import ensure_locked
+
+from .index import TransactionIndex, get_block_transaction_postings
+
+logger = logging.getLogger(__name__)
+
+
+def yield_reversed_positions(postings: list[tuple[int, int]]):
+    """
+    Yield positions of `postings` from the last block to the first one keeping the order of transactions
+    within a block (the same order blocks are read in reversed order by other blockchain implementations)
+    """
+    end = len(postings)
+    while end:
+        block_number = postings[end - 1][0]
+        start = end - 1
+        while start and postings[start - 1][0] == block_number:
+            start -= 1
+
+        yield from range(start, end)
+        end = start
+
+
+class TransactionFileBlockchainMixin(FileBlockchainBaseMixin):
+
+    def get_transaction_index(self) -> TransactionIndex:
+        raise NotImplementedError('Must be implemented in child class')
+
+    def get_up_to_date_transaction_index(self) -> Optional[TransactionIndex]:
+        """
+        Return transaction index reflecting all blocks or None if the index can not be built (for incomplete
+        blockchain)
+        """
+        if self._is_transaction_index_unavailable:  # type: ignore
+            return None  # incomplete blockchain remains incomplete until it is cleared
+
+        index = self.get_transaction_index()
+        if not self.update_sidecar_index(index, self._rebuild_transaction_index):  # type: ignore
+            return None
+
+        return index
+
+    @timeit_method(level=logging.INFO)
+    def _rebuild_transaction_index(self, index: TransactionIndex):
+        logger.info('Rebuilding transaction index')
+        index.reset()
+        index.last_block_number = -1
+        for block in self.yield_blocks():  # type: ignore
+            block_number = block.get_block_number()
+            if block_number != index.last_block_number + 1:
+                logger.debug('Incomplete blockchain: transactions are not indexed')
+                self._is_transaction_index_unavailable = True
+                index.reset()
+                return
+
+            index.apply(block_number, get_block_transaction_postings(block))
+
+        self.rewrite_sidecar_index(index)
+
+    def yield_transactions(self, account_id, is_reversed=False):
+        if (index := self.get_up_to_date_transaction_index()) is None:
+            yield from super().yield_transactions(account_id, is_reversed=is_reversed)  # type: ignore
+            return
+
+        yield from self._yield_indexed_transactions(index, account_id, slice(None), is_reversed)
+
+    def yield_transactions_slice(self, account_id, slice_: slice, is_reversed=False):
+        if (index := self.get_up_to_date_transaction_index()) is None:
+            yield from super().yield_transactions_slice(  # type: ignore
+                account_id, slice_, is_reversed=is_reversed
+            )
+            return
+
+        yield from self._yield_indexed_transactions(index, account_id, slice_, is_reversed)
+
+    def _yield_indexed_transactions(self, index: TransactionIndex, account_id, slice_: slice, is_reversed):
+        postings = index.get_postings(account_id)
+        if is_reversed:
+            positions = islice(yield_reversed_positions(postings), slice_.start, slice_.stop, slice_.step)
+        else:
+            positions = range(len(postings))[slice_]
+
+        # Only blocks of the requested slice are read
+        for position in positions:
+            block_number, transaction_index = postings[position]
+            block = self.get_block_by_number(block_number)  # type: ignore
+            assert block
+            yield block.message.signed_change_request.message.txs[transaction_index]
+
+    @ensure_locked(lock_attr='file_lock', exception=EXPECTED_LOCK_EXCEPTION)
+    def persist_block(self, block: Block):
+        index = self.get_up_to_date_transaction_index()
+        super().persist_block(block)  # type: ignore
+        if index is not None:
+            self.append_to_sidecar_index(index, block.get_block_number(), get_block_transaction_postings(block))
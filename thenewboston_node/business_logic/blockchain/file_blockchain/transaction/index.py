@@ -0,0 +1,61 @@
+from collections import defaultdict
+
+from thenewboston_node.business_logic.models import Block, CoinTransferSignedChangeRequest
+from thenewboston_node.core.utils.types import hexstr
+
+from ..index import SidecarIndex
+
+
+def get_block_transaction_postings(block: Block) -> dict[hexstr, list[int]]:
+    """
+    Return map of account to indexes of transactions (of the block coin transfer) the account is involved into
+    """
+    signed_change_request = block.message.signed_change_request
+    if not isinstance(signed_change_request, CoinTransferSignedChangeRequest):
+        return {}
+
+    signer = signed_change_request.signer
+    postings: dict[hexstr, list[int]] = defaultdict(list)
+    for transaction_index, transaction in enumerate(signed_change_request.message.txs):
+        postings[signer].append(transaction_index)
+        if (recipient := transaction.recipient) != signer:
+            postings[recipient].append(transaction_index)
+
+    return dict(postings)
+
+
+class TransactionIndex(SidecarIndex):
+    """
+    Map of account to ordered list of `(block_number, transaction_index)` postings of transactions the account
+    is involved into (as a sender or as a recipient).
+
+    Records are `[block_number, {account: [transaction_index, ...]}]`.
+    """
+
+    name = 'transaction index'
+
+    def reset(self):
+        super().reset()
+        self.postings: dict[hexstr, list[tuple[int, int]]] = {}
+
+    def get_postings(self, account: hexstr) -> list[tuple[int, int]]:
+        return self.postings.get(account, [])
+
+    def apply(self, block_number: int, block_postings: dict[hexstr, list[int]]):
+        postings = self.postings
+        for account, transaction_indexes in block_postings.items():
+            account_postings = postings.get(account)
+            if account_postings is None:
+                postings[account] = account_postings = []
+
+            account_postings.extend((block_number, transaction_index) for transaction_index in transaction_indexes)
+
+        self.last_block_number = block_number
+
+    def get_compacted_records(self):
+        by_block_number: dict[int, dict[hexstr, list[int]]] = defaultdict(lambda: defaultdict(list))
+        for account, account_postings in self.postings.items():
+            for block_number, transaction_index in account_postings:
+                by_block_number[block_number][account].append(transaction_index)
+
+        return by_block_number
@@ -10,6 +10,8 @@ class ValidationError(BlockchainError):
 
     def __init__(self, message):
         super(ValidationError, self).__init__(message)
+        # Targets of `validates()` the error was raised in (from the innermost to the outermost one)
+        self.targets: list[str] = []
 
 
 class InvalidSignatureError(ValidationError):
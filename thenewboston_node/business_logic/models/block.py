@@ -14,6 +14,7 @@ from thenewboston_node.core.utils.types import hexstr
 from .base import BaseDataclass
 from .block_message import BlockMessage
 from .mixins.compactable import MessagpackCompactableMixin
+from .mixins.message import frozen_messages
 from .mixins.metadata import MetadataMixin
 from .mixins.signable import SignableMixin
 from .signed_change_request import (  # noqa: I101
@@ -90,8 +91,10 @@ class Block(SignableMixin, MessagpackCompactableMixin, MetadataMixin, BaseDatacl
             signer=derive_public_key(pv_signing_key),
             message=BlockMessage.from_signed_change_request(blockchain, signed_change_request)
         )
-        block.sign(pv_signing_key)
-        block.hash_message()
+        with block.message.frozen():
+            block.sign(pv_signing_key)
+            block.hash_message()
+
         return block
 
     @classmethod
@@ -134,8 +137,11 @@ class Block(SignableMixin, MessagpackCompactableMixin, MetadataMixin, BaseDatacl
     @validates('block')
     def validate(self, blockchain):
         validate_not_empty(f'{self.humanized_class_name} message', self.message)
-        with validates(f'block number {self.message.block_number} (identifier: {self.message.block_identifier})'):
-            self.message.validate(blockchain)
-            validate_exact_value(f'{self.humanized_class_name} hash', self.hash, self.message.get_hash())
-            with validates('block signature'):
-                self.validate_signature()
+        message = self.message
+        with validates(f'block number {message.block_number} (identifier: {message.block_identifier})'):
+            # Messages are normalized for cryptography once per validation
+            with frozen_messages(message, getattr(message.signed_change_request, 'message', None)):
+                message.validate(blockchain)
+                validate_exact_value(f'{self.humanized_class_name} hash', self.hash, message.get_hash())
+                with validates('block signature'):
+                    self.validate_signature()
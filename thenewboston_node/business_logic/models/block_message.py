@@ -16,6 +16,7 @@ from thenewboston_node.core.utils.types import hexstr
 
 from . import AccountState
 from .base import BaseDataclass  # noqa: I101
+from .mixins.compactable import compact_key
 from .mixins.message import MessageMixin
 from .signed_change_request import SIGNED_CHANGE_REQUEST_TYPE_MAP, SignedChangeRequest
 
@@ -84,6 +85,23 @@ class BlockMessage(MessageMixin, BaseDataclass):
 
         return serialized
 
+    def fix_compact_dict(self, compact_dict):
+        node_key = compact_key('node')
+        for account_state in compact_dict[compact_key('updated_account_states')].values():
+            if node := account_state.get(node_key):
+                node.pop('identifier', None)
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        signed_change_request_class = SIGNED_CHANGE_REQUEST_TYPE_MAP.get(kwargs['block_type'])
+        if type(kwargs['signed_change_request']) is not signed_change_request_class:
+            # Malformed data error (see `MALFORMED_DATA_ERRORS`): validated by the generic path
+            raise TypeError('Signed change request does not match block type')
+
+        for account, account_state in kwargs['updated_account_states'].items():
+            if node := account_state.node:
+                node.identifier = account
+
     @classmethod
     def get_field_types(cls, dict_):
         field_types = super().get_field_types(dict_)
@@ -5,6 +5,7 @@ from typing import Any, Optional, Type, TypeVar
 
 from thenewboston_node.business_logic.models import AccountState
 from thenewboston_node.business_logic.models.base import BaseDataclass
+from thenewboston_node.business_logic.models.mixins.compactable import compact_key
 from thenewboston_node.business_logic.models.mixins.message import MessageMixin
 from thenewboston_node.business_logic.validators import (
     validate_gte_value, validate_is_none, validate_not_none, validate_type
@@ -83,6 +84,28 @@ class BlockchainStateMessage(MessageMixin, BaseDataclass):
 
         return serialized
 
+    def fix_compact_dict(self, compact_dict):
+        account_states = self.account_states
+        compact_account_states = compact_dict[compact_key('account_states')]
+        if len(compact_account_states) != len(account_states):
+            raise ValueError('Account numbers are not unique after compaction')
+
+        balance_lock_key = compact_key('balance_lock')
+        node_key = compact_key('node')
+        for (account_number,
+             account_state), compact_account_state in zip(account_states.items(), compact_account_states.values()):
+            if account_state.balance_lock == account_number:
+                del compact_account_state[balance_lock_key]
+
+            if node := compact_account_state.get(node_key):
+                node.pop('identifier', None)
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        for account_number, account_state in kwargs['account_states'].items():
+            if (node := account_state.node) and node.identifier is None:
+                node.identifier = account_number
+
     @validates('blockchain state')
     def validate(self, is_initial=False):
         self.validate_attributes(is_initial=is_initial)
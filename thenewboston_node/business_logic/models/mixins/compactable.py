@@ -1,11 +1,14 @@
 import logging
 import typing
+from datetime import datetime
 
 import msgpack
 
 from thenewboston_node.business_logic.validators import validate_not_none
 from thenewboston_node.core.utils.collections import replace_keys
+from thenewboston_node.core.utils.misc import coerce_from_json_type, coerce_to_json_type
 from thenewboston_node.core.utils.types import hexstr
+from thenewboston_node.core.utils.typing import unwrap_optional
 
 from .serializable import SerializableMixin
 
@@ -98,10 +101,177 @@ def transform_value(value, type_, transform_map):
         return value
 
 
+def make_compact_value_encoder(type_) -> typing.Optional[typing.Callable]:
+    """
+    Return function transforming a value of `type_` to its compact representation (None means no transformation)
+    """
+    type_origin = typing.get_origin(type_)
+    if type_origin is None:
+        if not isinstance(type_, type):
+            raise TypeError(f'Unsupported type: {type_}')
+
+        if issubclass(type_, CompactableMixin):
+            # Nested values are serialized according to their actual class (like `serialize_to_dict()` does)
+            return lambda value: get_compact_codec(type(value)).encode(value)
+        elif issubclass(type_, hexstr):
+            return bytes.fromhex
+        elif issubclass(type_, datetime):
+            return coerce_to_json_type
+
+        return None
+
+    type_args = typing.get_args(type_)
+    if issubclass(type_origin, dict):
+        key_encoder, value_encoder = map(make_compact_value_encoder, type_args)
+        if key_encoder is None and value_encoder is None:
+            return dict
+
+        key_encoder = key_encoder or (lambda key: key)
+        value_encoder = value_encoder or (lambda value: value)
+        return lambda value: {
+            key_encoder(item_key): value_encoder(item_value) for item_key, item_value in value.items()
+        }
+    elif issubclass(type_origin, list):
+        item_encoder = make_compact_value_encoder(type_args[0])
+        if item_encoder is None:
+            return list
+
+        return lambda value: [item_encoder(item) for item in value]
+
+    raise TypeError(f'Unsupported type: {type_}')
+
+
+def make_compact_value_decoder(type_) -> typing.Optional[typing.Callable]:
+    """
+    Return function transforming compact representation of a value of `type_` to the value (None means no
+    transformation)
+    """
+    type_origin = typing.get_origin(type_)
+    if type_origin is None:
+        if not isinstance(type_, type):
+            raise TypeError(f'Unsupported type: {type_}')
+
+        if issubclass(type_, CompactableMixin):
+            return lambda value: get_compact_codec(type_.get_compact_class(value)).decode(value)
+        elif issubclass(type_, hexstr):
+            return type_.from_bytes
+
+        # Scalars are coerced the same way `SerializableMixin.deserialize_from_dict()` does
+        return lambda value: coerce_from_json_type(value, type_)
+
+    type_args = typing.get_args(type_)
+    if issubclass(type_origin, dict):
+        key_decoder, value_decoder = map(make_compact_value_decoder, type_args)
+        if key_decoder is None and value_decoder is None:
+            return dict
+
+        key_decoder = key_decoder or (lambda key: key)
+        value_decoder = value_decoder or (lambda value: value)
+        return lambda value: {
+            key_decoder(item_key): value_decoder(item_value) for item_key, item_value in value.items()
+        }
+    elif issubclass(type_origin, list):
+        item_decoder = make_compact_value_decoder(type_args[0])
+        if item_decoder is None:
+            return list
+
+        return lambda value: [item_decoder(item) for item in value]
+
+    raise TypeError(f'Unsupported type: {type_}')
+
+
+# Errors `CompactCodec` fails to decode malformed data with (unknown or missing keys, unexpected value types)
+MALFORMED_DATA_ERRORS = (KeyError, TypeError, ValueError, AttributeError)
+
+
+class CompactCodec:
+    """
+    Encoder and decoder between model instances and their compact dicts compiled once from the model field
+    metadata, so compact dicts are produced and consumed in a single pass (without intermediate serialized dicts,
+    key replacement and per value type reflection).
+
+    The result must be identical to the one of the generic path (see `CompactableMixin.to_compact_dict()` and
+    `CompactableMixin.from_compact_dict()`). The generic path is used as a fallback if decoding of malformed
+    data fails with one of `MALFORMED_DATA_ERRORS` (to produce the same validation error), other errors
+    are propagated.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+
+        encoder_fields = []
+        decoder_fields = {}
+        required_field_names = set()
+        for field_name in cls.get_field_names():
+            if not cls.is_serializable_field(field_name):
+                continue
+
+            type_ = unwrap_optional(cls.get_field(field_name).type)
+            encoder_fields.append((field_name, compact_key(field_name), make_compact_value_encoder(type_)))
+            decoder_fields[field_name] = make_compact_value_decoder(type_)
+            if not cls.is_optional_field(field_name):
+                required_field_names.add(field_name)
+
+        self.encoder_fields = tuple(encoder_fields)
+        self.decoder_fields = decoder_fields
+        self.required_field_names = frozenset(required_field_names)
+        self.non_init_field_names = frozenset(
+            field_name for field_name in cls.get_field_names() if not cls.is_init_field(field_name)
+        )
+
+    def encode(self, instance) -> dict:
+        compact_dict = {}
+        for field_name, key, encoder in self.encoder_fields:
+            value = getattr(instance, field_name)
+            if value is not None:
+                compact_dict[key] = value if encoder is None else encoder(value)
+
+        instance.fix_compact_dict(compact_dict)
+        return compact_dict
+
+    def decode(self, compact_dict: dict):
+        kwargs = {}
+        decoder_fields = self.decoder_fields
+        for key, value in compact_dict.items():
+            field_name = UNCOMPACT_KEY_MAP.get(key, key)
+            decoder = decoder_fields[field_name]  # KeyError for unknown keys
+            kwargs[field_name] = value if decoder is None else decoder(value)
+
+        if not self.required_field_names <= kwargs.keys():
+            raise KeyError(f'Missing keys: {", ".join(sorted(self.required_field_names - kwargs.keys()))}')
+
+        cls = self.cls
+        cls.fix_compact_kwargs(kwargs)
+        if not self.non_init_field_names.isdisjoint(kwargs):
+            raise TypeError(f'Non-init fields: {", ".join(sorted(self.non_init_field_names & kwargs.keys()))}')
+
+        return cls(**kwargs)
+
+
+_compact_codec_cache: dict[type, CompactCodec] = {}
+
+
+def get_compact_codec(cls) -> CompactCodec:
+    if (codec := _compact_codec_cache.get(cls)) is None:
+        _compact_codec_cache[cls] = codec = CompactCodec(cls)
+
+    return codec
+
+
 class CompactableMixin(SerializableMixin):
 
     @classmethod
     def from_compact_dict(cls, compact_dict, compact_keys=True, compact_values=True):
+        if compact_keys and compact_values:
+            try:
+                return get_compact_codec(cls.get_compact_class(compact_dict)).decode(compact_dict)
+            except MALFORMED_DATA_ERRORS:
+                logger.debug('Could not deserialize %s with fast path', cls.__name__, exc_info=True)
+
+        return cls.from_compact_dict_generic(compact_dict, compact_keys=compact_keys, compact_values=compact_values)
+
+    @classmethod
+    def from_compact_dict_generic(cls, compact_dict, compact_keys=True, compact_values=True):
         dict_ = compact_dict
 
         if compact_keys:
@@ -113,6 +283,12 @@ class CompactableMixin(SerializableMixin):
         return cls.deserialize_from_dict(dict_)
 
     def to_compact_dict(self, compact_keys=True, compact_values=True):
+        if compact_keys and compact_values:
+            return get_compact_codec(type(self)).encode(self)
+
+        return self.to_compact_dict_generic(compact_keys=compact_keys, compact_values=compact_values)
+
+    def to_compact_dict_generic(self, compact_keys=True, compact_values=True):
         dict_ = self.serialize_to_dict()
         if compact_values:
             dict_ = self.to_compact_values(dict_)
@@ -122,6 +298,25 @@ class CompactableMixin(SerializableMixin):
 
         return dict_
 
+    @classmethod
+    def get_compact_class(cls, compact_dict):
+        """
+        Return class to deserialize `compact_dict` to (polymorphic models choose a subclass here)
+        """
+        return cls
+
+    def fix_compact_dict(self, compact_dict):
+        """
+        Apply to `compact_dict` produced by `CompactCodec` the changes `serialize_to_dict()` override makes
+        """
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        """
+        Apply to deserialized `kwargs` produced by `CompactCodec` the changes `deserialize_from_dict()`
+        override makes
+        """
+
     @classmethod
     def to_compact_values(cls, dict_):
         return cls._transform_dict(dict_, transform_map=get_type_compact_transform_map())
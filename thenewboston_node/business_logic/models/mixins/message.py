@@ -1,4 +1,7 @@
 import logging
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Optional
 
 from thenewboston_node.business_logic.exceptions import InvalidMessageSignatureError
 from thenewboston_node.core.utils.cryptography import (
@@ -8,16 +11,99 @@ from thenewboston_node.core.utils.types import hexstr
 
 logger = logging.getLogger(__name__)
 
+FROZEN_DEPTH_ATTRIBUTE = '_frozen_depth'
+CRYPTOGRAPHY_CACHE_ATTRIBUTE = '_cryptography_cache'
+
+_deferred_signatures: ContextVar[Optional[list[tuple[hexstr, bytes,
+                                                     hexstr]]]] = ContextVar('deferred_signatures', default=None)
+
+
+@contextmanager
+def defer_signature_validation():
+    """
+    Make `MessageMixin.validate_signature()` collect `(verify_key, message, signature)` items to the yielded list
+    instead of verifying them, so they can be verified in batch with `verify_signatures()`
+    """
+    signatures: list[tuple[hexstr, bytes, hexstr]] = []
+    token = _deferred_signatures.set(signatures)
+    try:
+        yield signatures
+    finally:
+        _deferred_signatures.reset(token)
+
+
+@contextmanager
+def frozen_messages(*messages):
+    """
+    Freeze messages (`None` values are skipped) while in the context (see `MessageMixin.frozen()`)
+    """
+    with ExitStack() as stack:
+        for message in messages:
+            if message is not None:
+                stack.enter_context(message.frozen())
+
+        yield
+
 
 class MessageMixin:
 
+    def __setattr__(self, name, value):
+        # Changing the message invalidates cached normalized message and its hash
+        if name != FROZEN_DEPTH_ATTRIBUTE:
+            self.__dict__.pop(CRYPTOGRAPHY_CACHE_ATTRIBUTE, None)
+
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # Copies (and unpickled instances) are not frozen
+        state = self.__dict__.copy()
+        state.pop(FROZEN_DEPTH_ATTRIBUTE, None)
+        state.pop(CRYPTOGRAPHY_CACHE_ATTRIBUTE, None)
+        return state
+
+    @contextmanager
+    def frozen(self):
+        """
+        Cache normalized message and its hash while in the context. Setting message attributes invalidates
+        the cache, but changes of nested objects are not tracked, so they must not be changed in the context.
+        """
+        dict_ = self.__dict__
+        dict_[FROZEN_DEPTH_ATTRIBUTE] = dict_.get(FROZEN_DEPTH_ATTRIBUTE, 0) + 1
+        try:
+            yield self
+        finally:
+            depth = dict_.pop(FROZEN_DEPTH_ATTRIBUTE) - 1
+            if depth:
+                dict_[FROZEN_DEPTH_ATTRIBUTE] = depth
+            else:
+                dict_.pop(CRYPTOGRAPHY_CACHE_ATTRIBUTE, None)
+
+    def is_frozen(self):
+        return FROZEN_DEPTH_ATTRIBUTE in self.__dict__
+
+    def _get_cryptography_cached(self, key, getter):
+        if not self.is_frozen():
+            return getter()
+
+        cache = self.__dict__.setdefault(CRYPTOGRAPHY_CACHE_ATTRIBUTE, {})
+        if (value := cache.get(key)) is None:
+            cache[key] = value = getter()
+
+        return value
+
     def serialize_to_dict_for_cryptography(self):
         return self.serialize_to_dict()
 
-    def get_normalized_for_cryptography(self) -> bytes:
+    def normalize_for_cryptography(self) -> bytes:
         return normalize_dict(self.serialize_to_dict_for_cryptography())
 
+    def get_normalized_for_cryptography(self) -> bytes:
+        return self._get_cryptography_cached('normalized', self.normalize_for_cryptography)
+
     def get_hash(self) -> hexstr:
+        return self._get_cryptography_cached('hash', self._make_hash)
+
+    def _make_hash(self) -> hexstr:
         normalized_message = self.get_normalized_for_cryptography()
         message_hash = hash_normalized_dict(normalized_message)
         logger.debug('Got %s hash for message: %r', message_hash, normalized_message)
@@ -27,5 +113,9 @@ class MessageMixin:
         return generate_signature(signing_key, self.get_normalized_for_cryptography())
 
     def validate_signature(self, verify_key: hexstr, signature: hexstr):
+        if (deferred_signatures := _deferred_signatures.get()) is not None:
+            deferred_signatures.append((verify_key, self.get_normalized_for_cryptography(), signature))
+            return
+
         if not is_signature_valid(verify_key, self.get_normalized_for_cryptography(), signature):
             raise InvalidMessageSignatureError()
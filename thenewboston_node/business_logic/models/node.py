@@ -10,6 +10,7 @@ from thenewboston_node.core.utils.dataclass import cover_docstring, revert_docst
 from thenewboston_node.core.utils.types import hexstr
 
 from .base import BaseDataclass
+from .mixins.compactable import compact_key
 
 
 @revert_docstring
@@ -37,6 +38,11 @@ class Node(BaseDataclass):
 
         return serialized
 
+    def fix_compact_dict(self, compact_dict):
+        fee_account = self.fee_account
+        if fee_account is not None and fee_account == self.identifier:
+            del compact_dict[compact_key('fee_account')]
+
     def __hash__(self):
         return hash(self.identifier)
 
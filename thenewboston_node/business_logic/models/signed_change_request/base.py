@@ -10,6 +10,7 @@ from thenewboston_node.core.utils.cryptography import derive_public_key
 from thenewboston_node.core.utils.dataclass import cover_docstring, revert_docstring
 from thenewboston_node.core.utils.types import hexstr
 
+from ..mixins.compactable import compact_key
 from ..mixins.signable import SignableMixin
 from ..signed_change_request_message import SignedChangeRequestMessage
 
@@ -53,6 +54,22 @@ class SignedChangeRequest(SignableMixin, BaseDataclass):
 
         return super().deserialize_from_dict(dict_, complain_excessive_keys=complain_excessive_keys)
 
+    @classmethod
+    def get_compact_class(cls, compact_dict):
+        from . import SIGNED_CHANGE_REQUEST_TYPE_MAP
+
+        signed_change_request_type = compact_dict[compact_key('message')][compact_key('signed_change_request_type')]
+        class_ = SIGNED_CHANGE_REQUEST_TYPE_MAP[signed_change_request_type]
+        if cls == SignedChangeRequest:
+            return class_
+
+        if not issubclass(cls, class_):
+            raise ValidationError(
+                f'{cls} does not match with signed_change_request_type: {signed_change_request_type}'
+            )
+
+        return cls
+
     @classmethod
     def create_from_signed_change_request_message(
         cls: Type[T], message: SignedChangeRequestMessage, signing_key: hexstr
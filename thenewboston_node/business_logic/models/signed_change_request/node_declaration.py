@@ -9,6 +9,7 @@ from thenewboston_node.core.utils.dataclass import cover_docstring, revert_docst
 from thenewboston_node.core.utils.types import hexstr
 
 from ..account_state import AccountState
+from ..mixins.compactable import compact_key
 from ..signed_change_request_message import NodeDeclarationSignedChangeRequestMessage
 from .base import SignedChangeRequest
 
@@ -68,5 +69,12 @@ class NodeDeclarationSignedChangeRequest(SignedChangeRequest):
         serialized['message']['node'].pop('identifier', None)
         return serialized
 
+    def fix_compact_dict(self, compact_dict):
+        compact_dict[compact_key('message')][compact_key('node')].pop('identifier', None)
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        kwargs['message'].node.identifier = kwargs.get('signer')
+
     def get_updated_account_states(self, blockchain) -> dict[hexstr, AccountState]:
         return {self.signer: AccountState(node=deepcopy(self.message.node))}
@@ -7,6 +7,7 @@ from thenewboston_node.business_logic.models.base import BaseDataclass
 from thenewboston_node.business_logic.models.constants import BlockType
 from thenewboston_node.core.utils.dataclass import cover_docstring, revert_docstring
 
+from ..mixins.compactable import compact_key
 from ..mixins.message import MessageMixin
 
 
@@ -44,5 +45,25 @@ class SignedChangeRequestMessage(MessageMixin, BaseDataclass):
 
         return super().deserialize_from_dict(dict_copy, complain_excessive_keys=complain_excessive_keys)
 
+    @classmethod
+    def get_compact_class(cls, compact_dict):
+        if cls != SignedChangeRequestMessage:
+            return cls
+
+        from . import SIGNED_CHANGE_REQUEST_MESSAGE_TYPE_MAP
+        return SIGNED_CHANGE_REQUEST_MESSAGE_TYPE_MAP[compact_dict[compact_key('signed_change_request_type')]]
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        from . import SIGNED_CHANGE_REQUEST_MESSAGE_TYPE_MAP
+
+        # Signed change request type is defined by the class (not an init field)
+        if signed_change_request_type := kwargs.pop('signed_change_request_type', None):
+            class_ = SIGNED_CHANGE_REQUEST_MESSAGE_TYPE_MAP.get(signed_change_request_type)
+            if class_ is None or not issubclass(cls, class_):
+                raise ValidationError(
+                    f'{cls} does not match with signed_change_request_type: {signed_change_request_type}'
+                )
+
     def validate(self):
         raise NotImplementedError('Must be implemented in subclass')
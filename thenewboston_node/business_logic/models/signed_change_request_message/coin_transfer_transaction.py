@@ -14,6 +14,7 @@ from thenewboston_node.core.utils.misc import humanize_camel_case
 from thenewboston_node.core.utils.types import hexstr
 
 from ..base import BaseDataclass
+from ..mixins.compactable import compact_key
 
 
 @revert_docstring
@@ -55,6 +56,16 @@ class CoinTransferTransaction(BaseDataclass):
 
         return serialized
 
+    def fix_compact_dict(self, compact_dict):
+        key = compact_key('is_fee')
+        if compact_dict.get(key, SENTINEL) in (None, False):
+            del compact_dict[key]
+
+    @classmethod
+    def fix_compact_kwargs(cls, kwargs):
+        if kwargs.get('is_fee', SENTINEL) is None:
+            kwargs['is_fee'] = False
+
     @property
     def humanized_class_name(self):
         return humanize_camel_case(self.__class__.__name__)
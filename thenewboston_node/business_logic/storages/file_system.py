@@ -6,13 +6,41 @@ import os
 import re
 import shutil
 import stat
-from functools import partial
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, update_wrapper
 from pathlib import Path
-from typing import Optional, Union
+from time import monotonic
+from typing import Any, Generator, Iterable, Optional, Union
 
 from thenewboston_node.business_logic import exceptions
 from thenewboston_node.core.logging import timeit, timeit_method
 from thenewboston_node.core.utils.atomic_write import atomic_write_append
+from thenewboston_node.core.utils.os import fsync_directory
+
+from . import seekable
+from .journal import append_journaled, get_file_size, get_journaled_size, recover_journaled, remove_journal
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # optional dependency
+    lz4 = None
+
+ZSTD_COMPRESSION_LEVEL = 9
+
+COMPRESSION_POLICY_SMALLEST = 'smallest'
+COMPRESSION_POLICY_FASTEST = 'fastest'
+COMPRESSION_POLICY_TIME_BUDGET = 'time_budget'
+COMPRESSION_POLICIES = (COMPRESSION_POLICY_SMALLEST, COMPRESSION_POLICY_FASTEST, COMPRESSION_POLICY_TIME_BUDGET)
+
+# Known compressors from the fastest to the slowest one
+COMPRESSORS_BY_SPEED = ('lz4', 'zst', 'gz', 'seekable', 'bz2', 'xz')
 
 
 def bz2_best_compress(data):
@@ -23,19 +51,77 @@ def gzip_best_compress(data):
     return gzip.compress(data, compresslevel=9)
 
 
-# TODO(dmu) LOW: Support more / better compression methods
+def zstd_compress(data, dictionary_data=None):
+    # Dictionary is passed as bytes to keep the function picklable for compression in a process pool
+    dictionary = None if dictionary_data is None else zstandard.ZstdCompressionDict(dictionary_data)
+    return zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL, dict_data=dictionary).compress(data)
+
+
+def zstd_decompress(data, dictionaries=None):
+    """
+    Decompress zstd `data` looking up the dictionary it was compressed with (if any) in `dictionaries`
+    (by dictionary id, which is stored in compressed frame header)
+    """
+    dictionary_id = zstandard.get_frame_parameters(data).dict_id
+    dictionary = None
+    if dictionary_id:
+        dictionary = (dictionaries or {}).get(dictionary_id)
+        if dictionary is None:
+            raise ValueError(f'Unknown zstd dictionary: {dictionary_id}')
+
+    return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+
+
+def train_zstd_dictionary(samples: list[bytes], dictionary_size=112640) -> bytes:
+    return zstandard.train_dictionary(dictionary_size, samples).as_bytes()
+
+
 COMPRESSION_FUNCTIONS = {
     'xz': lzma.compress,  # TODO(dmu) HIGH: This algorithm is 10 times more expensive than the bz2 or gz. Reconsider
     'bz2': bz2_best_compress,
     'gz': gzip_best_compress,
+    # Independently compressed frames: larger than the other formats, but allows reading a part of a file
+    'seekable': seekable.compress,
 }
 
 DECOMPRESSION_FUNCTIONS = {
     'xz': lzma.decompress,
     'bz2': bz2.decompress,
     'gz': gzip.decompress,
+    'seekable': seekable.decompress,
+}
+
+
+def make_gzip_decompressor():
+    return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+
+
+# Incremental decompressors (with `decompress()` method and `eof` and `unused_data` attributes) factories.
+# Data compressed with other compressors is decompressed in one piece
+STREAMING_DECOMPRESSOR_FACTORIES = {
+    'xz': lzma.LZMADecompressor,
+    'bz2': bz2.BZ2Decompressor,
+    'gz': make_gzip_decompressor,
 }
 
+if zstandard:
+    COMPRESSION_FUNCTIONS['zst'] = zstd_compress
+    DECOMPRESSION_FUNCTIONS['zst'] = zstd_decompress
+
+if lz4:
+    COMPRESSION_FUNCTIONS['lz4'] = lz4.frame.compress
+    DECOMPRESSION_FUNCTIONS['lz4'] = lz4.frame.decompress
+    STREAMING_DECOMPRESSOR_FACTORIES['lz4'] = lz4.frame.LZ4FrameDecompressor
+
+DURABILITY_NONE = 'none'
+DURABILITY_BLOCK = 'block'
+DURABILITY_GROUP = 'group'
+DURABILITY_CHUNK = 'chunk'
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_BLOCK, DURABILITY_GROUP, DURABILITY_CHUNK)
+
+# Seekable container is opt-in: it is never the smallest, so it would not be chosen along with others anyway
+DEFAULT_COMPRESSORS = ('xz', 'bz2', 'gz')
+
 SOURCE_LOCATION_RE = re.compile(r'.*\.(?P<compressor>{})$'.format('|'.join(DECOMPRESSION_FUNCTIONS)))
 STAT_WRITE_PERMS_ALL = stat.S_IWGRP | stat.S_IWUSR | stat.S_IWOTH
 
@@ -69,26 +155,73 @@ def strip_compression_extension(filename):
 open_read_binary = partial(open, mode='rb')
 
 
+def fsync_file_path(file_path):
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:  # moved or removed since it was written
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def get_compressor_from_location(location):
     match = SOURCE_LOCATION_RE.match(location)
     return match.group('compressor') if match else None
 
 
-def decompress(data, compressor):
+def decompress(data, compressor, zstd_dictionaries=None):
     if compressor:
         decompress_function = DECOMPRESSION_FUNCTIONS.get(compressor)
         if not decompress_function:
             raise ValueError('Unsupported compressor')
 
+        if compressor == 'zst' and zstd_dictionaries:
+            return zstd_decompress(data, dictionaries=zstd_dictionaries)
+
         return decompress_function(data)
 
     return data
 
 
-def read_compressed_file(file_path,
-                         compressor=None,
-                         raise_uncompressed_missing=True,
-                         open_function=open_read_binary) -> Optional[bytes]:
+def yield_decompressed(binary_data_chunks: Iterable[bytes], compressor) -> Generator[bytes, None, None]:
+    """
+    Decompress data as it arrives in `binary_data_chunks`, so compressed and decompressed data are not kept in
+    memory entirely (unless `compressor` does not support incremental decompression)
+    """
+    if not compressor:
+        yield from binary_data_chunks
+        return
+
+    make_decompressor = STREAMING_DECOMPRESSOR_FACTORIES.get(compressor)
+    if make_decompressor is None:
+        yield decompress(b''.join(binary_data_chunks), compressor)
+        return
+
+    decompressor = None
+    for chunk in binary_data_chunks:
+        while chunk:
+            if decompressor is None or decompressor.eof:  # data may consist of several concatenated streams
+                decompressor = make_decompressor()
+
+            if data := decompressor.decompress(chunk):
+                yield data
+
+            chunk = decompressor.unused_data if decompressor.eof else b''
+
+    if decompressor is not None and not decompressor.eof:
+        raise EOFError('Compressed data ended before the end-of-stream marker was reached')
+
+
+def read_compressed_file(
+    file_path,
+    compressor=None,
+    raise_uncompressed_missing=True,
+    open_function=open_read_binary,
+    zstd_dictionaries=None
+) -> Optional[bytes]:
     if compressor is None:
         compressor = get_compressor_from_location(file_path)
     elif compressor:  # we use empty line ('') to denote no compression
@@ -103,28 +236,157 @@ def read_compressed_file(file_path,
 
         return None
 
-    return decompress(data, compressor)  # type: ignore
+    return decompress(data, compressor, zstd_dictionaries=zstd_dictionaries)  # type: ignore
 
 
 class FileSystemStorage:
     """
-    Compressing / decompressing storage for capacity optimization
+    Compressing / decompressing storage for capacity optimization.
+
+    `compression_policy` defines how compressors are chosen on finalization:
+
+    - smallest: try all compressors and use the one that gives the smallest result
+    - fastest: use the fastest compressor that reduces data size
+    - time_budget: try compressors from the fastest to the slowest while the expected compression time
+      (based on previous compressions) fits into `compression_time_budget` seconds and use the smallest result
+
+    zst and lz4 compressors require `fast-compression` extra to be installed (so do nodes that read files
+    compressed with them). zst compressor uses `zstd_dictionary_path` dictionary if given, files compressed with
+    a dictionary are loadable by storages the dictionary is registered with only (see `register_zstd_dictionary()`),
+    so a dictionary must not be used for files served to other nodes (`FileBlockchain` rejects it for block chunk
+    and blockchain state storages).
+
+    With `journal_directory` appends are written with O_APPEND and journaled (see `journal` module) instead of
+    atomic rewriting of the entire file, so append cost does not depend on the file size. Torn trailing records
+    are truncated when the storage is opened (unless `recover_on_open` is False, then `recover()` must be called
+    explicitly before appending).
+
+    With `compression_workers` greater than 1 compressors are tried in parallel in a process pool
+    (for smallest policy only, since other policies depend on results of faster compressors). The pool is shut
+    down by `close()`.
+
+    `durability` defines when appended data is flushed to disk (fsync) and what survives a crash (power loss,
+    kernel panic; a process crash does not lose written data at any level):
+
+    - none: data is never fsync'ed explicitly. Appended data written within the last few seconds (operating system
+      dependent) may be lost, a torn trailing record is truncated by journal recovery
+    - block: every append is fsync'ed before returning. Appended data is never lost
+    - group: appends are fsync'ed once `group_commit_blocks` appends are made or `group_commit_interval_ms`
+      milliseconds passed since the first not fsync'ed append (by a timer thread), also on finalization,
+      `sync()` and `close()` calls. Up to the last group of appended data may be lost
+    - chunk: data is fsync'ed on finalization only. Not finalized file content may be lost, finalized files are
+      never lost
+
+    Files saved with atomic write are always fsync'ed. With durability other than none directories are also
+    fsync'ed after files are created, moved or replaced by compressed ones.
     """
 
     def __init__(
         self,
         base_path: Union[str, Path],
-        compressors=tuple(COMPRESSION_FUNCTIONS),
+        compressors=DEFAULT_COMPRESSORS,
         temp_dir='.tmp',
-        use_atomic_write=True
+        use_atomic_write=True,
+        seekable_frame_size=seekable.DEFAULT_FRAME_SIZE,
+        seekable_codec=seekable.DEFAULT_CODEC,
+        compression_policy=COMPRESSION_POLICY_SMALLEST,
+        compression_time_budget=1.0,
+        zstd_dictionary_path=None,
+        compression_workers=1,
+        journal_directory=None,
+        durability=DURABILITY_NONE,
+        group_commit_blocks=10,
+        group_commit_interval_ms=100,
+        recover_on_open=True,
     ):
+        unsupported_compressors = set(compressors) - set(COMPRESSION_FUNCTIONS)
+        if unsupported_compressors:
+            raise ValueError(
+                f'Unsupported compressors: {", ".join(sorted(unsupported_compressors))} '
+                '(optional compression libraries may be not installed)'
+            )
+
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f'Unsupported durability: {durability}')
+
+        if compression_policy not in COMPRESSION_POLICIES:
+            raise ValueError(f'Unsupported compression policy: {compression_policy}')
+
         self.base_path = Path(base_path).resolve()
         self.compressors = compressors
+        self.seekable_frame_size = seekable_frame_size
+        self.seekable_codec = seekable_codec
+        self.compression_policy = compression_policy
+        self.compression_time_budget = compression_time_budget
+        self.compression_workers = compression_workers
+        self._compression_executor_lock = threading.Lock()
+        self._compression_executor: Optional[ProcessPoolExecutor] = None
+        self.journal_directory = Path(journal_directory).resolve() if journal_directory else None
+
+        self.durability = durability
+        self.group_commit_blocks = group_commit_blocks
+        self.group_commit_interval_ms = group_commit_interval_ms
+        # Appends are registered by the thread that writes blocks, while finalization (including sync) may be run
+        # by a background thread
+        self._sync_lock = threading.Lock()
+        self._unsynced_file_paths: set[str] = set()
+        self._unsynced_appends_count = 0
+        self._last_sync_time = monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+
+        # zstd dictionaries finalized files may be compressed with by dictionary id
+        self.zstd_dictionaries: dict[int, Any] = {}
+        self.zstd_dictionary = None
+        if zstd_dictionary_path:
+            with open(zstd_dictionary_path, 'rb') as fo:
+                self.zstd_dictionary = self.register_zstd_dictionary(fo.read())
+
+        # Compression speed in bytes per second by compressor measured on previous compressions
+        self._compression_speeds: dict[str, float] = {}
         self.temp_dir = self.base_path / temp_dir
         self.use_atomic_write = use_atomic_write
 
+        if recover_on_open:
+            self.recover()
+
+    def register_zstd_dictionary(self, dictionary_data: bytes):
+        """
+        Make files compressed with the dictionary loadable (the dictionary is not used for compression)
+        """
+        dictionary = zstandard.ZstdCompressionDict(dictionary_data)
+        self.zstd_dictionaries[dictionary.dict_id()] = dictionary
+        return dictionary
+
     def clear(self):
         shutil.rmtree(self.base_path, ignore_errors=True)
+        if journal_directory := self.journal_directory:
+            shutil.rmtree(journal_directory, ignore_errors=True)
+
+        with self._sync_lock:
+            self._unsynced_file_paths = set()
+            self._unsynced_appends_count = 0
+            self._cancel_sync_timer()
+
+    def close(self):
+        """
+        Fsync appended data that has not been fsync'ed yet and shut down compression process pool.
+        The storage can still be used after closing
+        """
+        self.sync()
+
+        with self._compression_executor_lock:
+            executor = self._compression_executor
+            self._compression_executor = None
+
+        if executor:
+            executor.shutdown(wait=True)
+
+    def get_compression_executor(self) -> ProcessPoolExecutor:
+        with self._compression_executor_lock:
+            if (executor := self._compression_executor) is None:
+                self._compression_executor = executor = ProcessPoolExecutor(max_workers=self.compression_workers)
+
+            return executor
 
     @timeit_method()
     def save(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
@@ -132,16 +394,47 @@ class FileSystemStorage:
 
     def load(self, file_path: Union[str, Path]) -> bytes:
         actual_file_path = self.get_actual_file_path(file_path)
-        data = read_compressed_file(actual_file_path)
+        data = read_compressed_file(actual_file_path, zstd_dictionaries=self.zstd_dictionaries)
         if data is None:
             raise IOError(f'Could not read data from {actual_file_path} ({file_path})')
 
         return data
 
+    def load_range(self, file_path: Union[str, Path], start: int, end: int) -> bytes:
+        """
+        Return bytes from `start` to `end` (exclusive) of uncompressed file content
+        """
+        actual_file_path = self.get_actual_file_path(file_path)
+        compressor = get_compressor_from_location(actual_file_path)
+        if compressor == 'seekable':
+            with open(actual_file_path, 'rb') as fo:
+                return seekable.SeekableReader.from_file_object(fo).read(start, end)
+
+        if compressor:
+            return read_compressed_file(actual_file_path,
+                                        zstd_dictionaries=self.zstd_dictionaries)[start:end]  # type: ignore
+
+        with open(actual_file_path, 'rb') as fo:
+            fo.seek(start)
+            return fo.read(end - start)
+
     @timeit_method()
     def append(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
         self._persist(file_path, binary_data, 'ab', is_final=is_final)
 
+    @timeit_method()
+    def recover(self):
+        """
+        Truncate torn trailing records of journaled (not finalized) files
+        """
+        journal_directory = self.journal_directory
+        if not journal_directory or not journal_directory.exists():
+            return
+
+        for journal_file_path in journal_directory.rglob('*.journal'):
+            file_path = self.base_path / str(journal_file_path.relative_to(journal_directory))[:-len('.journal')]
+            recover_journaled(str(file_path), str(journal_file_path))
+
     def finalize(self, file_path: Union[str, Path]):
         return self._finalize(self._get_absolute_path(file_path))
 
@@ -155,6 +448,11 @@ class FileSystemStorage:
         destination = self._get_absolute_path(destination)
         ensure_directory_exists_for_file_path(destination)
         os.rename(source, destination)
+        self._remove_journal(source)
+        if self.durability != DURABILITY_NONE:
+            fsync_directory(destination.parent)
+            if source.parent != destination.parent:
+                fsync_directory(source.parent)
 
     def get_mtime(self, file_path):
         return os.path.getmtime(self.get_actual_file_path(file_path))
@@ -189,26 +487,153 @@ class FileSystemStorage:
 
         return absolute_path
 
+    def _get_journal_file_path(self, absolute_file_path: Path) -> str:
+        assert self.journal_directory
+        return str(self.journal_directory / absolute_file_path.relative_to(self.base_path)) + '.journal'
+
+    def _remove_journal(self, absolute_file_path: Path):
+        if self.journal_directory:
+            journal_file_path = self._get_journal_file_path(absolute_file_path)
+            remove_journal(journal_file_path)
+            with self._sync_lock:
+                self._unsynced_file_paths.discard(journal_file_path)
+
+    @timeit_method()
+    def _append_journaled(self, absolute_file_path: Path, binary_data: bytes):
+        file_path = str(absolute_file_path)
+        journal_file_path = self._get_journal_file_path(absolute_file_path)
+        if get_journaled_size(journal_file_path) != get_file_size(file_path):
+            # The file was changed not by journaled append (written before journaling was enabled or
+            # by another process, for example)
+            recover_journaled(file_path, journal_file_path)
+
+        append_journaled(file_path, journal_file_path, binary_data, fsync=self.durability == DURABILITY_BLOCK)
+        self._register_append(file_path, journal_file_path)
+
+    def _register_append(self, *file_paths):
+        durability = self.durability
+        if durability in (DURABILITY_NONE, DURABILITY_BLOCK):
+            return  # nothing to sync later
+
+        with self._sync_lock:
+            self._unsynced_file_paths.update(file_paths)
+            if durability != DURABILITY_GROUP:
+                return
+
+            self._unsynced_appends_count += 1
+            is_sync_due = (
+                self._unsynced_appends_count >= self.group_commit_blocks or
+                (monotonic() - self._last_sync_time) * 1000 >= self.group_commit_interval_ms
+            )
+            if not is_sync_due and self._sync_timer is None:
+                # The group is synced within the interval even if no more appends are made
+                self._sync_timer = timer = threading.Timer(self.group_commit_interval_ms / 1000, self.sync)
+                timer.daemon = True
+                timer.start()
+
+        if is_sync_due:
+            self.sync()
+
+    def _cancel_sync_timer(self):
+        if timer := self._sync_timer:
+            timer.cancel()
+            self._sync_timer = None
+
+    @timeit_method()
+    def sync(self):
+        """
+        Fsync files appended since the previous sync
+        """
+        # The set is swapped under the lock, so files are fsync'ed without blocking appends
+        with self._sync_lock:
+            unsynced_file_paths = self._unsynced_file_paths
+            self._unsynced_file_paths = set()
+            self._unsynced_appends_count = 0
+            self._last_sync_time = monotonic()
+            self._cancel_sync_timer()
+
+        for file_path in unsynced_file_paths:
+            fsync_file_path(file_path)
+
+        # Files may be created by the appends
+        for directory in {os.path.dirname(file_path) for file_path in unsynced_file_paths}:
+            fsync_file_path(directory)
+
     def get_actual_file_path(self, file_path: Union[str, Path]) -> str:
         return self._get_compressed_file_path(str(self._get_absolute_path(file_path)))
 
+    def _get_compress_function(self, compressor):
+        if compressor == 'seekable':
+            return update_wrapper(
+                partial(seekable.compress, frame_size=self.seekable_frame_size, codec=self.seekable_codec),
+                seekable.compress
+            )
+
+        if compressor == 'zst' and self.zstd_dictionary:
+            return update_wrapper(
+                partial(zstd_compress, dictionary_data=self.zstd_dictionary.as_bytes()), zstd_compress
+            )
+
+        return COMPRESSION_FUNCTIONS[compressor]
+
+    def _get_compressors_by_speed(self):
+        return sorted(
+            self.compressors,
+            key=lambda compressor: COMPRESSORS_BY_SPEED.index(compressor)
+            if compressor in COMPRESSORS_BY_SPEED else len(COMPRESSORS_BY_SPEED)
+        )
+
+    def _fits_time_budget(self, compressor, data_size, elapsed):
+        speed = self._compression_speeds.get(compressor)
+        expected_duration = 0 if speed is None else data_size / speed
+        return elapsed + expected_duration <= self.compression_time_budget
+
+    def _yield_compressed_data(self, data):
+        policy = self.compression_policy
+        # Compressors are tried from the fastest one, so the fastest one wins if compressed sizes are equal
+        compressors = self._get_compressors_by_speed()
+        if self.compression_workers > 1 and policy == COMPRESSION_POLICY_SMALLEST and len(compressors) > 1:
+            executor = self.get_compression_executor()
+            futures = [(compressor, executor.submit(self._get_compress_function(compressor), data))
+                       for compressor in compressors]
+            for compressor, future in futures:
+                yield compressor, future.result()
+
+            return
+
+        data_size = len(data)
+        start = monotonic()
+        for index, compressor in enumerate(compressors):
+            if (
+                policy == COMPRESSION_POLICY_TIME_BUDGET and index > 0 and
+                not self._fits_time_budget(compressor, data_size,
+                                           monotonic() - start)
+            ):
+                logger.debug('Skipping %s compression: it does not fit into time budget', compressor)
+                continue
+
+            compress_function = self._get_compress_function(compressor)
+            compression_start = monotonic()
+            compressed_data = timeit()(compress_function)(data)  # type: ignore
+            self._compression_speeds[compressor] = data_size / max(monotonic() - compression_start, 1e-6)
+            yield compressor, compressed_data
+
     @timeit_method()
     def _get_best_compression(self, data):
         best_compressor = None
         best_data = data
-        for compressor in self.compressors:
-            compress_function = COMPRESSION_FUNCTIONS[compressor]
-            compressed_data = timeit()(compress_function)(data)  # type: ignore
+        for compressor, compressed_data in self._yield_compressed_data(data):
             compressed_size = len(compressed_data)
             logger.debug(
                 'Data compressed with %s size: %s bytes (%.2f ratio)', compressor, compressed_size,
                 compressed_size / len(data)
             )
-            # TODO(dmu) LOW: For compressed_size == best[0] choose fastest compression
             if compressed_size < len(best_data):
                 best_compressor = compressor
                 best_data = compressed_data
                 logger.debug('New best %s: %s size', best_compressor, len(best_data))
+                if self.compression_policy == COMPRESSION_POLICY_FASTEST:
+                    break
 
         return best_data, best_compressor
 
@@ -229,7 +654,8 @@ class FileSystemStorage:
 
         if best_absolute_file_path != absolute_file_path:
             logger.debug('Writing compressed file: %s (%s bytes)', best_absolute_file_path, len(best_data))
-            self._write_file(best_absolute_file_path, best_data, mode='wb')
+            # Readers prefer the compressed file, so it is always written atomically to never be read half-written
+            self._write_file(best_absolute_file_path, best_data, mode='wb', atomic=True)
 
             logger.debug('Removing %s', absolute_file_path)
             os.remove(absolute_file_path)
@@ -247,34 +673,53 @@ class FileSystemStorage:
             ext = ('.' + compressor) if compressor else ''
             absolute_file_path = Path(str(absolute_file_path) + ext)
             compress = False
+            atomic = bool(compressor)
         else:
             compress = True
+            atomic = False
 
-        self._write_file(absolute_file_path, binary_data, mode)
+        self._write_file(absolute_file_path, binary_data, mode, atomic=atomic)
 
         if is_final:
             self._finalize(absolute_file_path, compress=compress)
 
     @timeit_method()
     def _finalize(self, absolute_file_path: Path, compress=True):
+        self._remove_journal(absolute_file_path)
+        with self._sync_lock:
+            self._unsynced_file_paths.discard(str(absolute_file_path))  # finalized file is fsync'ed below
+
         if compress:
             absolute_file_path = self._compress(absolute_file_path)
 
         drop_write_permissions(absolute_file_path)
+        if self.durability != DURABILITY_NONE:
+            self.sync()
+            fsync_file_path(absolute_file_path)
+            # Compressed file is created and the original one is removed
+            fsync_directory(absolute_file_path.parent)
+
         return absolute_file_path
 
     def _is_finalized(self, actual_file_path):
         return os.path.exists(actual_file_path) and not has_write_permissions(actual_file_path)
 
     @timeit_method()
-    def _write_file(self, absolute_file_path: Path, binary_data: bytes, mode):
+    def _write_file(self, absolute_file_path: Path, binary_data: bytes, mode, atomic=False):
         compressed_file_path = self._get_compressed_file_path(str(absolute_file_path))
         if self._is_finalized(compressed_file_path):
             raise exceptions.FinalizedFileWriteError(
                 f'Could not write to file {absolute_file_path} finalized as {compressed_file_path}'
             )
 
-        if self.use_atomic_write:
+        if self.journal_directory:
+            if mode == 'ab':
+                self._append_journaled(absolute_file_path, binary_data)
+                return
+
+            self._remove_journal(absolute_file_path)
+
+        if self.use_atomic_write or atomic:
             self.temp_dir.mkdir(parents=True, exist_ok=True)
             # TODO(dmu) HIGH: Atomic write is about 30 times slower than a simple write. Consider optimizations
             with atomic_write_append(absolute_file_path, mode=mode, dir=self.temp_dir) as fo:
@@ -282,3 +727,9 @@ class FileSystemStorage:
         else:
             with open(absolute_file_path, mode=mode) as fo:
                 fo.write(binary_data)
+                if self.durability == DURABILITY_BLOCK:
+                    fo.flush()
+                    os.fsync(fo.fileno())
+
+            if mode == 'ab':
+                self._register_append(str(absolute_file_path))
@@ -0,0 +1,165 @@
+"""
+Append journal: a sidecar file of fixed size entries `(offset, length, crc32)` describing records appended to
+a data file. Data file content is not changed by journaling (it remains a plain concatenation of records), while
+the journal allows to detect and truncate a torn trailing record left by a crash during append.
+"""
+import logging
+import os
+import struct
+import zlib
+from typing import Optional
+
+from thenewboston_node.core.utils.os import fsync_directory
+
+JOURNAL_ENTRY_FORMAT = '>QII'  # offset, length, crc32
+JOURNAL_ENTRY_SIZE = struct.calcsize(JOURNAL_ENTRY_FORMAT)
+
+logger = logging.getLogger(__name__)
+
+
+def write_all(fd, binary_data: bytes):
+    view = memoryview(binary_data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def append_to_file(file_path, binary_data: bytes, fsync=False) -> int:
+    """
+    Append data with O_APPEND (no copying of existing content) and return offset of the appended data
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        offset = os.fstat(fd).st_size
+        write_all(fd, binary_data)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    return offset
+
+
+def read_last_journal_entry(journal_file_path) -> Optional[tuple[int, int, int]]:
+    try:
+        with open(journal_file_path, 'rb') as fo:
+            size = fo.seek(0, os.SEEK_END)
+            entries_count = size // JOURNAL_ENTRY_SIZE
+            if not entries_count:
+                return None
+
+            fo.seek((entries_count - 1) * JOURNAL_ENTRY_SIZE)
+            return struct.unpack(JOURNAL_ENTRY_FORMAT, fo.read(JOURNAL_ENTRY_SIZE))
+    except FileNotFoundError:
+        return None
+
+
+def get_file_size(file_path) -> int:
+    try:
+        return os.path.getsize(file_path)
+    except FileNotFoundError:
+        return 0
+
+
+def get_journaled_size(journal_file_path) -> int:
+    entry = read_last_journal_entry(journal_file_path)
+    return 0 if entry is None else entry[0] + entry[1]
+
+
+def create_journal(journal_file_path, fsync=False):
+    os.makedirs(os.path.dirname(journal_file_path), exist_ok=True)
+    fd = os.open(journal_file_path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    if fsync:
+        fsync_directory(os.path.dirname(journal_file_path))
+
+
+def append_journaled(file_path, journal_file_path, binary_data: bytes, fsync=False):
+    is_first_append = not os.path.exists(journal_file_path)
+    if is_first_append:
+        # An empty journal is created before the first record is written, so a record torn by a crash is
+        # truncated by recovery (a data file without journal is trusted as a whole)
+        create_journal(journal_file_path, fsync=fsync)
+
+    # Data is written before the journal entry, so a journal entry never describes not yet written data
+    offset = append_to_file(file_path, binary_data, fsync=fsync)
+    if fsync and is_first_append:
+        fsync_directory(os.path.dirname(file_path))
+
+    append_to_file(
+        journal_file_path,
+        struct.pack(JOURNAL_ENTRY_FORMAT, offset, len(binary_data), zlib.crc32(binary_data)),
+        fsync=fsync
+    )
+
+
+def recover_journaled(file_path, journal_file_path) -> int:
+    """
+    Truncate data file to the end of the last journaled record with valid checksum and drop journal entries
+    beyond it. Return the number of truncated data bytes.
+    """
+    try:
+        file_size = os.path.getsize(file_path)
+    except FileNotFoundError:
+        remove_journal(journal_file_path)
+        return 0
+
+    try:
+        with open(journal_file_path, 'rb') as fo:
+            journal = fo.read()
+    except FileNotFoundError:
+        journal = None
+
+    if journal is None:
+        # Data file was written without journaling (legacy or copied without journal) or finalized (journal is
+        # removed on finalization): it is trusted as a whole
+        if file_size:
+            os.makedirs(os.path.dirname(journal_file_path), exist_ok=True)
+            with open(file_path, 'rb') as fo:
+                crc32 = zlib.crc32(fo.read())
+
+            with open(journal_file_path, 'wb') as fo:
+                fo.write(struct.pack(JOURNAL_ENTRY_FORMAT, 0, file_size, crc32))
+
+        return 0
+
+    entries_count = len(journal) // JOURNAL_ENTRY_SIZE
+    valid_end = valid_entries_count = 0
+    with open(file_path, 'rb') as fo:
+        # Only trailing records may be torn, so we check records starting from the last one
+        for entry_number in range(entries_count - 1, -1, -1):
+            offset, length, crc32 = struct.unpack_from(
+                JOURNAL_ENTRY_FORMAT, journal, entry_number * JOURNAL_ENTRY_SIZE
+            )
+            if offset + length > file_size:
+                continue
+
+            fo.seek(offset)
+            if zlib.crc32(fo.read(length)) == crc32:
+                valid_end = offset + length
+                valid_entries_count = entry_number + 1
+                break
+
+    valid_journal_size = valid_entries_count * JOURNAL_ENTRY_SIZE
+    if valid_journal_size != len(journal):
+        logger.warning('Truncating journal %s to %s entries', journal_file_path, valid_entries_count)
+        os.truncate(journal_file_path, valid_journal_size)
+
+    truncated_size = file_size - valid_end
+    if truncated_size:
+        logger.warning('Truncating torn record(s) of %s bytes at the end of %s', truncated_size, file_path)
+        os.truncate(file_path, valid_end)
+
+    return truncated_size
+
+
+def remove_journal(journal_file_path):
+    try:
+        os.remove(journal_file_path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,162 @@
+import logging
+import os
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Generator, Iterable, Optional
+
+import msgpack
+
+from thenewboston_node.core.utils.os import replace_durably
+
+logger = logging.getLogger(__name__)
+
+ADDED = '+'
+REMOVED = '-'
+
+
+class DirectoryManifest:
+    """
+    Sorted lists of file names of a storage (grouped by directory) backed by an append-only file of messagepack
+    records `[operation, name]`, so other processes can catch up by reading the records appended since the last read.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.reset()
+
+    def reset(self):
+        self._names_by_directory: dict[str, list[str]] = {}
+        # Lists of names being consumed by `yield_names()` generators are copied on change instead of modifying them
+        self._yielded_directories: set[str] = set()
+        self._names_set: set[str] = set()
+        self._file_identity: Optional[tuple[int, int]] = None
+        self._file_offset = 0
+
+    def __contains__(self, name):
+        return name in self._names_set
+
+    def __len__(self):
+        return len(self._names_set)
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(chain.from_iterable(self._names_by_directory.values()))
+
+    @property
+    def version(self):
+        """
+        Value that changes on every manifest change (as long as the manifest is loaded)
+        """
+        return self._file_identity, self._file_offset
+
+    def exists(self):
+        return os.path.exists(self.file_path)
+
+    def yield_names(self, directory='', sort_direction=1) -> Generator[str, None, None]:
+        """
+        Yield names of files located in `directory` (not in its subdirectories). Names added or removed while
+        the generator is being consumed are not yielded or still yielded respectively
+        """
+        names = self._names_by_directory.get(directory)
+        if names:
+            self._yielded_directories.add(directory)
+            yield from (reversed(names) if sort_direction == -1 else names)
+
+    def add(self, name: str):
+        if name not in self._names_set:
+            self._append_record(ADDED, name)
+
+    def remove(self, name: str):
+        if name in self._names_set:
+            self._append_record(REMOVED, name)
+
+    def load(self):
+        """
+        Apply records appended to the file since the last read (the entire file is reread if it was replaced)
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            self.reset()
+            return
+
+        file_identity = (stat.st_dev, stat.st_ino)
+        if file_identity != self._file_identity or stat.st_size < self._file_offset:
+            self.reset()
+            self._file_identity = file_identity
+
+        if stat.st_size == self._file_offset:
+            return
+
+        start_offset = self._file_offset
+        with open(self.file_path, 'rb') as fo:
+            fo.seek(start_offset)
+            unpacker = msgpack.Unpacker(fo)
+            try:
+                # Unpacker stops at the last complete record, so a torn record is never applied
+                for operation, name in unpacker:
+                    self._apply(operation, name)
+                    self._file_offset = start_offset + unpacker.tell()
+            except Exception:
+                logger.warning('Could not read manifest %s', self.file_path, exc_info=True)
+                self.reset()
+
+    def rewrite(self, names: Iterable[str]):
+        """
+        Replace the file with one record per name
+        """
+        self.reset()
+        for name in names:
+            self._apply(ADDED, name)
+
+        temporary_file_path = self.file_path + '.tmp'
+        with open(temporary_file_path, 'wb') as fo:
+            fo.write(b''.join(msgpack.packb([ADDED, name]) for name in self.names))
+
+        replace_durably(temporary_file_path, self.file_path)
+
+        stat = os.stat(self.file_path)
+        self._file_identity = (stat.st_dev, stat.st_ino)
+        self._file_offset = stat.st_size
+
+    def _get_directory_names_for_change(self, directory) -> list[str]:
+        names_by_directory = self._names_by_directory
+        names = names_by_directory.get(directory)
+        if names is None:
+            names_by_directory[directory] = names = []
+        elif directory in self._yielded_directories:
+            self._yielded_directories.discard(directory)
+            names_by_directory[directory] = names = names.copy()
+
+        return names
+
+    def _apply(self, operation, name):
+        names_set = self._names_set
+        if operation == ADDED:
+            if name not in names_set:
+                names_set.add(name)
+                insort(self._get_directory_names_for_change(os.path.dirname(name)), name)
+        elif operation == REMOVED:
+            if name in names_set:
+                names_set.remove(name)
+                directory = os.path.dirname(name)
+                names = self._get_directory_names_for_change(directory)
+                del names[bisect_left(names, name)]
+                if not names:
+                    del self._names_by_directory[directory]
+        else:
+            raise ValueError(f'Unknown manifest operation: {operation}')
+
+    def _append_record(self, operation, name):
+        data = msgpack.packb([operation, name])
+        if self._file_identity is None:
+            # The manifest was not read from or written to the file yet, so we can not rely on the file content
+            self._apply(operation, name)
+            self.rewrite(self.names)
+            return
+
+        with open(self.file_path, 'ab') as fo:
+            fo.write(data)
+
+        self._file_offset += len(data)
+        self._apply(operation, name)
@@ -2,9 +2,10 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .file_system import FileSystemStorage, strip_compression_extension
+from .manifest import DirectoryManifest
 
 logger = logging.getLogger(__name__)
 
@@ -23,21 +24,74 @@ def make_optimized_file_path(path, max_depth):
 class PathOptimizedFileSystemStorage(FileSystemStorage):
     """
     Storage decorator transparently placing file to
-    subdirectories (for file system performance reason)
+    subdirectories (for file system performance reason).
+
+    With `manifest_filename` the storage records names of files it creates, moves and removes in a manifest
+    (see `DirectoryManifest`), so listing does not walk the directory tree. The manifest is reconciled with
+    the directory tree once per storage instance (to pick up changes made bypassing the storage).
     """
 
-    def __init__(self, base_path: Union[str, Path], max_depth=DEFAULT_MAX_DEPTH, **kwargs):
+    def __init__(self, base_path: Union[str, Path], max_depth=DEFAULT_MAX_DEPTH, manifest_filename=None, **kwargs):
         super().__init__(base_path=base_path, **kwargs)
         self.max_depth = max_depth
+        self.manifest_filename = manifest_filename
+        self._manifest: Optional[DirectoryManifest] = None
+        self._is_manifest_reconciled = False
+
+    def get_manifest(self) -> Optional[DirectoryManifest]:
+        """
+        Return up to date manifest or None if the storage is configured not to use it
+        """
+        if not self.manifest_filename:
+            return None
+
+        if (manifest := self._manifest) is None:
+            self._manifest = manifest = DirectoryManifest(str(self.base_path / self.manifest_filename))
+
+        if self._is_manifest_reconciled:
+            manifest.load()
+        else:
+            self._reconcile_manifest(manifest)
+
+        return manifest
+
+    def _reconcile_manifest(self, manifest: DirectoryManifest):
+        manifest.load()
+        actual_names = sorted(self._list_directory_generator('.'))
+        if manifest.names != actual_names:
+            if manifest.exists():
+                logger.warning('Manifest %s does not match the directory content: rebuilding', manifest.file_path)
+
+            if actual_names or manifest.exists():
+                self.base_path.mkdir(parents=True, exist_ok=True)
+                manifest.rewrite(actual_names)
+
+        self._is_manifest_reconciled = True
+
+    def _add_to_manifest(self, file_path):
+        if (manifest := self.get_manifest()) is not None:
+            manifest.add(os.path.normpath(file_path))
+
+    def clear(self):
+        super().clear()
+        if (manifest := self._manifest) is not None:
+            manifest.reset()
 
     def save(self, file_path, binary_data: bytes, is_final=False):
-        return super().save(self.get_optimized_path(file_path), binary_data, is_final=is_final)
+        rv = super().save(self.get_optimized_path(file_path), binary_data, is_final=is_final)
+        self._add_to_manifest(file_path)
+        return rv
 
     def load(self, file_path) -> bytes:
         return super().load(self.get_optimized_path(file_path))
 
+    def load_range(self, file_path, start: int, end: int) -> bytes:
+        return super().load_range(self.get_optimized_path(file_path), start, end)
+
     def append(self, file_path, binary_data: bytes, is_final=False):
-        return super().append(self.get_optimized_path(file_path), binary_data, is_final=is_final)
+        rv = super().append(self.get_optimized_path(file_path), binary_data, is_final=is_final)
+        self._add_to_manifest(file_path)
+        return rv
 
     def finalize(self, file_path):
         return super().finalize(self.get_optimized_path(file_path))
@@ -50,6 +104,12 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
             raise ValueError('sort_direction must be either of the values: 1, -1, None')
 
         directory_path = prefix or '.'
+        if (manifest := self.get_manifest()) is not None:
+            directory = os.path.normpath(directory_path)
+            directory = '' if directory == '.' else directory
+            yield from manifest.yield_names(directory, sort_direction=sort_direction or 1)
+            return
+
         generator = self._list_directory_generator(directory_path)
         if sort_direction is None:
             yield from generator
@@ -60,13 +120,24 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
         optimized_source = self.get_optimized_path(source)
         optimized_destination = self.get_optimized_path(destination)
         super().move(optimized_source, optimized_destination)
+        if (manifest := self.get_manifest()) is not None:
+            manifest.remove(os.path.normpath(source))
+            manifest.add(os.path.normpath(destination))
 
     def get_mtime(self, file_path):
         return super().get_mtime(self.get_optimized_path(file_path))
 
     def _list_directory_generator(self, directory_path):
         directory_path = self._get_absolute_path(directory_path)
+        manifest_file_paths = set()
+        if manifest_filename := self.manifest_filename:
+            manifest_file_path = str(self.base_path / manifest_filename)
+            manifest_file_paths = {manifest_file_path, manifest_file_path + '.tmp'}
+
         for dir_path, _, filenames in os.walk(directory_path):
+            filenames = [
+                filename for filename in filenames if os.path.join(dir_path, filename) not in manifest_file_paths
+            ]
             # TODO(dmu) HIGH: Refactor: PathOptimizedFileSystemStorage should know nothing about compression
             original_filenames = map(strip_compression_extension, filenames)
             unique_filenames = set(original_filenames)  # remove duplicated files after strip
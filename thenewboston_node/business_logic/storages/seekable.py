@@ -0,0 +1,192 @@
+"""
+Seekable compression container.
+
+Data is split into frames that are compressed independently, so a reader can decompress only the frames that hold
+the requested byte range. For messagepack data (block chunks) frames are aligned to record boundaries and contain
+`frame_size` records each, otherwise data is split into frames of `frame_size` kilobytes.
+
+Layout::
+
+    <frame 0>...<frame N-1><frame table><frame table length: 4 bytes, big endian><magic: 8 bytes>
+
+Frame table is a messagepack array `[codec, is_record_aligned, uncompressed_offsets, compressed_offsets]` where
+offsets lists contain N + 1 items (the last one is the total size).
+"""
+import struct
+from bisect import bisect_right
+from typing import Callable, Generator, Optional
+
+import msgpack
+
+MAGIC = b'TNBSEEK1'
+TRAILER_FORMAT = '>I'
+TRAILER_LENGTH = struct.calcsize(TRAILER_FORMAT) + len(MAGIC)
+
+DEFAULT_FRAME_SIZE = 16
+DEFAULT_CODEC = 'gz'
+
+
+class InvalidSeekableDataError(ValueError):
+    pass
+
+
+def get_record_offsets(binary_data: bytes) -> list[int]:
+    """
+    Return offsets of messagepack records in `binary_data` followed by the length of the data
+    """
+    unpacker = msgpack.Unpacker()
+    unpacker.feed(binary_data)
+
+    offsets = [0]
+    while True:
+        try:
+            unpacker.skip()
+        except msgpack.OutOfData:
+            break
+
+        offsets.append(unpacker.tell())
+
+    return offsets
+
+
+def get_frame_offsets(binary_data: bytes, frame_size) -> tuple[list[int], bool]:
+    try:
+        record_offsets = get_record_offsets(binary_data)
+    except Exception:
+        record_offsets = None
+
+    data_length = len(binary_data)
+    if record_offsets and record_offsets[-1] == data_length:
+        offsets = record_offsets[::frame_size]
+        is_record_aligned = True
+    else:
+        offsets = list(range(0, data_length, frame_size * 1024))
+        is_record_aligned = False
+
+    if offsets[-1] != data_length:
+        offsets.append(data_length)
+
+    return offsets, is_record_aligned
+
+
+def get_codec_function(codec, is_compression):
+    # Imported here to avoid circular imports: seekable container is registered as a compressor itself
+    from .file_system import COMPRESSION_FUNCTIONS, DECOMPRESSION_FUNCTIONS
+
+    functions = COMPRESSION_FUNCTIONS if is_compression else DECOMPRESSION_FUNCTIONS
+    function = functions.get(codec)
+    if function is None or getattr(function, 'is_seekable', False):
+        raise InvalidSeekableDataError(f'Unsupported seekable container codec: {codec}')
+
+    return function
+
+
+def compress(binary_data: bytes, frame_size=DEFAULT_FRAME_SIZE, codec=DEFAULT_CODEC) -> bytes:
+    compress_function = get_codec_function(codec, is_compression=True)
+    uncompressed_offsets, is_record_aligned = get_frame_offsets(binary_data, frame_size)
+
+    frames = []
+    compressed_offsets = [0]
+    for start, end in zip(uncompressed_offsets, uncompressed_offsets[1:]):
+        frame = compress_function(binary_data[start:end])
+        frames.append(frame)
+        compressed_offsets.append(compressed_offsets[-1] + len(frame))
+
+    frame_table = msgpack.packb([codec, is_record_aligned, uncompressed_offsets, compressed_offsets])
+    return b''.join(frames) + frame_table + struct.pack(TRAILER_FORMAT, len(frame_table)) + MAGIC
+
+
+def decompress(binary_data: bytes) -> bytes:
+    reader = SeekableReader.from_binary_data(binary_data)
+    return b''.join(reader.yield_frames())
+
+
+compress.is_seekable = decompress.is_seekable = True  # type: ignore
+
+
+class SeekableReader:
+    """
+    Read uncompressed ranges of a seekable container with `read_range(start, end)` and `read_tail(length)`
+    callables that return compressed container bytes
+    """
+
+    def __init__(self, read_range: Callable[[int, int], bytes], read_tail: Callable[[int], bytes]):
+        self._read_range = read_range
+        self._read_tail = read_tail
+        self._frame_table: Optional[tuple] = None
+
+    @classmethod
+    def from_binary_data(cls, binary_data: bytes):
+        return cls(lambda start, end: binary_data[start:end], lambda length: binary_data[-length:])
+
+    @classmethod
+    def from_file_object(cls, file_object):
+
+        def read_range(start, end):
+            file_object.seek(start)
+            return file_object.read(end - start)
+
+        def read_tail(length):
+            file_object.seek(-length, 2)
+            return file_object.read(length)
+
+        return cls(read_range, read_tail)
+
+    @property
+    def frame_table(self):
+        if (frame_table := self._frame_table) is None:
+            trailer = self._read_tail(TRAILER_LENGTH)
+            if len(trailer) != TRAILER_LENGTH or not trailer.endswith(MAGIC):
+                raise InvalidSeekableDataError('Seekable container magic is not found')
+
+            frame_table_length = struct.unpack(TRAILER_FORMAT, trailer[:-len(MAGIC)])[0]
+            frame_table_data = self._read_tail(TRAILER_LENGTH + frame_table_length)[:frame_table_length]
+            codec, is_record_aligned, uncompressed_offsets, compressed_offsets = msgpack.unpackb(frame_table_data)
+            decompress_function = get_codec_function(codec, is_compression=False)
+            self._frame_table = frame_table = (
+                decompress_function, is_record_aligned, uncompressed_offsets, compressed_offsets
+            )
+
+        return frame_table
+
+    @property
+    def is_record_aligned(self) -> bool:
+        return self.frame_table[1]
+
+    @property
+    def uncompressed_size(self) -> int:
+        return self.frame_table[2][-1]
+
+    @property
+    def frames_count(self) -> int:
+        return len(self.frame_table[2]) - 1
+
+    def read_frame(self, frame_number) -> bytes:
+        decompress_function, _, _, compressed_offsets = self.frame_table
+        compressed_frame = self._read_range(compressed_offsets[frame_number], compressed_offsets[frame_number + 1])
+        return decompress_function(compressed_frame)
+
+    def read(self, start: int, end: int) -> bytes:
+        """
+        Return uncompressed data from `start` to `end` (exclusive) decompressing only frames that hold it
+        """
+        uncompressed_offsets = self.frame_table[2]
+        end = min(end, uncompressed_offsets[-1])
+        if start >= end:
+            return b''
+
+        first_frame_number = bisect_right(uncompressed_offsets, start) - 1
+        last_frame_number = bisect_right(uncompressed_offsets, end - 1) - 1
+
+        data = b''.join(self.read_frame(number) for number in range(first_frame_number, last_frame_number + 1))
+        data_offset = uncompressed_offsets[first_frame_number]
+        return data[start - data_offset:end - data_offset]
+
+    def yield_frames(self, direction=1) -> Generator[bytes, None, None]:
+        assert direction in (1, -1)
+        frame_numbers = range(self.frames_count)
+        if direction == -1:
+            frame_numbers = reversed(frame_numbers)  # type: ignore
+
+        for frame_number in frame_numbers:
+            yield self.read_frame(frame_number)
@@ -1,8 +1,13 @@
+from collections import Counter
+from unittest.mock import patch
+
 import pytest
 
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
 from thenewboston_node.business_logic.exceptions import ValidationError
-from thenewboston_node.business_logic.models import Block, NodeDeclarationSignedChangeRequest
+from thenewboston_node.business_logic.models import (
+    Block, CoinTransferSignedChangeRequest, NodeDeclarationSignedChangeRequest
+)
 from thenewboston_node.core.utils.cryptography import KeyPair, derive_public_key
 
 
@@ -189,3 +194,37 @@ def test_can_add_node_declaration_block(
     assert blockchain.get_node_by_identifier(user_account) == request1.message.node
     blockchain.snapshot_blockchain_state()
     assert blockchain.get_last_blockchain_state().get_node(user_account) == request1.message.node
+
+
+@pytest.mark.parametrize('blockchain_argument_name', ('memory_blockchain', 'file_blockchain'))
+def test_add_block_from_signed_change_request_reads_account_states_once(
+    memory_blockchain: BlockchainBase,
+    file_blockchain: BlockchainBase,
+    treasury_account_key_pair: KeyPair,
+    user_account_key_pair: KeyPair,
+    primary_validator_key_pair: KeyPair,
+    preferred_node,
+    blockchain_argument_name,
+):
+    blockchain: BlockchainBase = locals()[blockchain_argument_name]
+    user_account = user_account_key_pair.public
+
+    signed_change_request = CoinTransferSignedChangeRequest.create_from_main_transaction(
+        blockchain=blockchain,
+        recipient=user_account,
+        amount=30,
+        signing_key=treasury_account_key_pair.private,
+        node=preferred_node,
+    )
+    with patch.object(
+        blockchain,
+        'get_account_state_attribute_value',
+        wraps=blockchain.get_account_state_attribute_value,
+    ) as get_account_state_attribute_value_mock:
+        blockchain.add_block_from_signed_change_request(signed_change_request, primary_validator_key_pair.private)
+
+    assert blockchain.get_account_current_balance(user_account) == 30
+    # Each account state attribute is read once for both block creation and validation
+    reads = Counter(call.args[:2] for call in get_account_state_attribute_value_mock.call_args_list)
+    assert reads
+    assert set(reads.values()) == {1}
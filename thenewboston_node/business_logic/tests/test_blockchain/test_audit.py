@@ -0,0 +1,57 @@
+import json
+import os.path
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import Block
+from thenewboston_node.business_logic.tests.mocks.utils import patch_blockchain_states, patch_blocks
+
+
+def test_audit_checks_blockchain_states_and_reports_progress(file_blockchain_with_five_block_chunks, tmpdir):
+    blockchain = file_blockchain_with_five_block_chunks
+    checkpoint_file_path = os.path.join(tmpdir, 'audit-checkpoint.json')
+    progress = []
+
+    with patch.object(blockchain, 'generate_blockchain_state') as generate_blockchain_state_mock:
+        blockchain.audit(checkpoint_file_path=checkpoint_file_path, progress_callback=progress.append)
+
+    # Account states are replayed instead of being generated for every blockchain state
+    generate_blockchain_state_mock.assert_not_called()
+    # Batches of blocks end at blockchain states
+    assert progress == [2, 5, 8, 11, 13]
+
+    last_blockchain_state = blockchain.get_last_blockchain_state()
+    with open(checkpoint_file_path) as fo:
+        assert json.load(fo) == {
+            'last_block_number': 11,
+            'next_block_identifier': last_blockchain_state.next_block_identifier,
+        }
+
+
+def test_audit_resumes_from_checkpoint(file_blockchain_with_five_block_chunks, tmpdir):
+    blockchain = file_blockchain_with_five_block_chunks
+    checkpoint_file_path = os.path.join(tmpdir, 'audit-checkpoint.json')
+    blockchain.audit(checkpoint_file_path=checkpoint_file_path)
+
+    progress = []
+    with patch.object(Block, 'validate', autospec=True, side_effect=Block.validate) as validate_mock:
+        blockchain.audit(checkpoint_file_path=checkpoint_file_path, progress_callback=progress.append)
+
+    assert progress == [13]
+    assert [call.args[0].get_block_number() for call in validate_mock.call_args_list] == [12, 13]
+
+
+def test_audit_detects_balance_mismatch(blockchain_base, blockchain_genesis_state, block_0, user_account):
+    with patch_blocks(blockchain_base, [block_0]):
+        blockchain_state_0 = blockchain_base.generate_blockchain_state()
+        blockchain_state_0.account_states[user_account].balance = 999
+
+        with patch_blockchain_states(blockchain_base, [blockchain_genesis_state, blockchain_state_0]):
+            with patch.object(blockchain_base, 'yield_blocks_from', return_value=iter([block_0])):
+                with pytest.raises(
+                    ValidationError,
+                    match=f'Expected 99 balance value, but got 999 balance value for account {user_account}'
+                ):
+                    blockchain_base.audit()
@@ -176,3 +176,48 @@ def test_can_get_nodes_from_complex_blockchain(
     assert set(blockchain.yield_nodes(block_number=1)) == {node2_old, node1} | initial_nodes
     assert set(blockchain.yield_nodes(block_number=0)) == {node1} | initial_nodes
     assert set(blockchain.yield_nodes(block_number=-1)) == initial_nodes
+
+
+def yield_nodes_from_account_states(blockchain):
+    known_accounts = set()
+    for account_number, account_state in blockchain.yield_account_states():
+        if account_state.node and account_number not in known_accounts:
+            known_accounts.add(account_number)
+            yield account_state.node
+
+
+@pytest.mark.parametrize('blockchain_argument_name', ('memory_blockchain', 'file_blockchain'))
+def test_node_registry_is_updated_with_blocks(
+    file_blockchain: BlockchainBase, memory_blockchain: BlockchainBase, blockchain_argument_name,
+    primary_validator_key_pair
+):
+    blockchain: BlockchainBase = locals()[blockchain_argument_name]
+    signing_key = primary_validator_key_pair.private
+    key_pair1 = generate_key_pair()
+    key_pair2 = generate_key_pair()
+
+    initial_nodes = list(blockchain.yield_nodes())
+    assert blockchain.get_nodes_count() == len(initial_nodes)
+
+    nodes = []
+    for key_pair in (key_pair1, key_pair2, key_pair1):
+        request = NodeDeclarationSignedChangeRequest.create(
+            network_addresses=[f'http://{len(nodes)}.non-existing-domain:8555/'],
+            fee_amount=3,
+            signing_key=key_pair.private
+        )
+        nodes.append(request.message.node)
+        blockchain.add_block(Block.create_from_signed_change_request(blockchain, request, signing_key))
+
+        assert list(blockchain.yield_nodes()) == list(yield_nodes_from_account_states(blockchain))
+
+    # Redeclared node goes first
+    expected_nodes = [nodes[2], nodes[1]] + initial_nodes
+    assert list(blockchain.yield_nodes()) == expected_nodes
+    assert blockchain.get_nodes_count() == len(expected_nodes)
+    assert list(blockchain.yield_nodes_slice(slice(1, 3))) == expected_nodes[1:3]
+    assert blockchain.get_node_registry().get_declared_block_number(key_pair1.public) == 2
+
+    blockchain.snapshot_blockchain_state()
+    assert list(blockchain.yield_nodes()) == list(yield_nodes_from_account_states(blockchain))
+    assert blockchain.get_nodes_count() == len(expected_nodes)
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
+from thenewboston_node.business_logic.blockchain.base.pv_schedule_index import PrimaryValidatorScheduleIndex
 from thenewboston_node.business_logic.models import (
     Block, NodeDeclarationSignedChangeRequest, PrimaryValidatorScheduleSignedChangeRequest
 )
@@ -152,3 +155,40 @@ def test_can_get_overridden_pv(
     assert blockchain.get_primary_validator(10) == pv1
     assert blockchain.get_primary_validator(99) == pv1
     assert blockchain.get_primary_validator(200) is None
+
+
+@pytest.mark.parametrize('blockchain_argument_name', ('memory_blockchain', 'file_blockchain'))
+def test_pv_schedule_index_is_built_once_per_blockchain_state(
+    file_blockchain: BlockchainBase, memory_blockchain: BlockchainBase, primary_validator_key_pair,
+    user_account_key_pair, blockchain_argument_name
+):
+    blockchain: BlockchainBase = locals()[blockchain_argument_name]
+
+    with patch.object(
+        PrimaryValidatorScheduleIndex,
+        '__init__',
+        autospec=True,
+        side_effect=PrimaryValidatorScheduleIndex.__init__,
+    ) as index_init_mock:
+        pv1 = blockchain.get_primary_validator()
+        assert pv1 is not None
+
+        signing_key = user_account_key_pair.private
+        nd_request = NodeDeclarationSignedChangeRequest.create(
+            network_addresses=['http://new-node.non-existing.domain:8555/'], fee_amount=3, signing_key=signing_key
+        )
+        block = Block.create_from_signed_change_request(blockchain, nd_request, primary_validator_key_pair.private)
+        blockchain.add_block(block)
+
+        pvs_request = PrimaryValidatorScheduleSignedChangeRequest.create(200, 299, signing_key)
+        block = Block.create_from_signed_change_request(blockchain, pvs_request, primary_validator_key_pair.private)
+        blockchain.add_block(block)
+
+        assert blockchain.get_primary_validator(99) == pv1
+        assert blockchain.get_primary_validator(200) == nd_request.message.node
+        # The index built on blockchain validation is reused and updated with added blocks
+        index_init_mock.assert_not_called()
+
+        blockchain.snapshot_blockchain_state()
+        assert blockchain.get_primary_validator(200) == nd_request.message.node
+        index_init_mock.assert_called_once()
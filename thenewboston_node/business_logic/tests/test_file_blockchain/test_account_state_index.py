@@ -0,0 +1,47 @@
+import os.path
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.blockchain.base.account_state import AccountStateMixin
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+
+
+def test_account_state_index_matches_blocks_traversal(file_blockchain_with_five_block_chunks):
+    blockchain = file_blockchain_with_five_block_chunks
+    accounts = set(blockchain.yield_known_accounts())
+    accounts.add('0' * 64)  # unknown account
+
+    for block_number in range(-1, blockchain.get_last_block_number() + 1):
+        for account in accounts:
+            for attribute in ('balance', 'balance_lock', 'node', 'primary_validator_schedule'):
+                expected = AccountStateMixin.get_account_state_attribute_value(
+                    blockchain, account, attribute, block_number
+                )
+                assert blockchain.get_account_state_attribute_value(account, attribute, block_number) == expected
+
+
+def test_account_state_index_is_persisted(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    index_file_path = blockchain.get_account_state_index().file_path
+    assert os.path.isfile(index_file_path)
+
+    accounts = list(blockchain.yield_known_accounts())
+    expected = {account: blockchain.get_account_current_balance(account) for account in accounts}
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    with patch.object(other_blockchain, '_rebuild_account_state_index') as rebuild_mock:
+        assert {account: other_blockchain.get_account_current_balance(account) for account in accounts} == expected
+
+    rebuild_mock.assert_not_called()
+    assert other_blockchain.get_number_of_accounts() == len(accounts)
+
+
+def test_account_state_index_is_rebuilt(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    accounts = list(blockchain.yield_known_accounts())
+    expected = {account: blockchain.get_account_current_balance(account) for account in accounts}
+
+    blockchain.get_account_state_index().remove()
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert {account: other_blockchain.get_account_current_balance(account) for account in accounts} == expected
+    assert os.path.isfile(other_blockchain.get_account_state_index().file_path)
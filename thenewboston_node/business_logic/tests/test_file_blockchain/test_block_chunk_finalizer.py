@@ -0,0 +1,79 @@
+import os
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.blockchain.file_blockchain.block_chunk.finalizer import (
+    BackgroundBlockChunkFinalizer
+)
+from thenewboston_node.business_logic.tests.factories import add_blocks
+
+
+def test_block_chunks_are_finalized_in_background(file_blockchain):
+    blockchain = file_blockchain
+    with patch.object(blockchain, 'snapshot_period_in_blocks', 3), \
+            patch.object(blockchain, '_background_block_chunk_finalization', True):
+        with patch.object(BackgroundBlockChunkFinalizer, 'schedule') as schedule_mock:
+            add_blocks(
+                blockchain,
+                5,
+                blockchain._test_treasury_account_key_pair.private,
+                signing_key=blockchain._test_primary_validator_key_pair.private
+            )
+
+        filename = '00000000000000000000-00000000000000000002-block-chunk.msgpack'
+        schedule_mock.assert_called_with(filename)
+
+        storage = blockchain.get_block_chunk_storage()
+        assert not storage.is_finalized(filename)
+        assert storage.get_optimized_absolute_actual_path(filename).endswith('.msgpack')
+
+        # Not yet compressed block chunk is readable
+        expected_blocks = list(blockchain.yield_blocks())
+        assert [block.get_block_number() for block in expected_blocks] == list(range(5))
+        blockchain.clear_caches()
+        assert blockchain.get_block_by_number(1) == expected_blocks[1]
+
+        # Interrupted finalization is resumed
+        with blockchain.file_lock:
+            blockchain.finalize_all_block_chunks()
+        blockchain.wait_block_chunk_finalization()
+
+    assert storage.is_finalized(filename)
+    assert storage.get_optimized_absolute_actual_path(filename).endswith('.msgpack.gz')
+    blockchain.clear_caches()
+    blocks = list(blockchain.yield_blocks())
+    assert [block.message for block in blocks] == [block.message for block in expected_blocks]
+
+
+def test_block_chunk_being_finalized_by_another_process_is_skipped(file_blockchain):
+    blockchain = file_blockchain
+    with patch.object(blockchain, 'snapshot_period_in_blocks', 3), \
+            patch.object(blockchain, '_background_block_chunk_finalization', True):
+        with patch.object(BackgroundBlockChunkFinalizer, 'schedule'):
+            add_blocks(
+                blockchain,
+                5,
+                blockchain._test_treasury_account_key_pair.private,
+                signing_key=blockchain._test_primary_validator_key_pair.private
+            )
+
+        filename = '00000000000000000000-00000000000000000002-block-chunk.msgpack'
+        storage = blockchain.get_block_chunk_storage()
+        finalizer = blockchain.get_block_chunk_finalizer()
+
+        # File lock held by another lock instance is what another process holding it looks like
+        with finalizer.get_lock(filename):
+            finalizer.schedule(filename)
+            assert not finalizer.is_pending(filename)
+
+            with patch.object(finalizer, '_is_locked', return_value=False):
+                finalizer.schedule(filename)
+            finalizer.wait()
+
+        assert not storage.is_finalized(filename)
+
+        finalizer.schedule(filename)
+        blockchain.close()
+
+    assert storage.is_finalized(filename)
+    assert finalizer._executor is None
+    assert not os.listdir(blockchain._block_chunk_finalization_lock_directory)
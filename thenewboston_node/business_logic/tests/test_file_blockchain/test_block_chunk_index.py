@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.models import Block
+from thenewboston_node.business_logic.tests.factories import add_blocks
+
+
+def test_finalized_block_chunks_are_indexed(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    block_chunk_index = blockchain.get_block_chunk_index(
+        '00000000000000000003-00000000000000000005-block-chunk.msgpack'
+    )
+    assert block_chunk_index.start_block_number == 3
+    assert block_chunk_index.end_block_number == 5
+    assert len(block_chunk_index.offsets) == 4
+
+    assert blockchain.get_block_chunk_index('00000000000000000006-xxxxxxxxxxxxxxxxxxxx-block-chunk.msgpack') is None
+
+
+def test_get_block_by_number_decodes_one_block(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    expected_blocks = list(blockchain.yield_blocks())
+    blockchain.clear_caches()
+
+    with patch.object(Block, 'from_compact_dict', wraps=Block.from_compact_dict) as from_compact_dict_mock:
+        block = blockchain.get_block_by_number(4)
+
+    assert from_compact_dict_mock.call_count == 1
+    assert block == expected_blocks[4]
+    assert block.meta['chunk_start_block_number'] == 3
+    assert block.meta['chunk_end_block_number'] == 5
+
+
+def test_indexed_and_not_indexed_block_chunks_yield_same_blocks(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    blockchain.clear_caches()
+    indexed_blocks = list(blockchain.yield_blocks())
+    indexed_blocks_reversed = list(blockchain.yield_blocks_reversed())
+    indexed_blocks_from = list(blockchain.yield_blocks_from(4))
+
+    blockchain.get_block_chunk_index_storage().clear()
+    blockchain.clear_caches()
+    assert blockchain.get_block_chunk_index('00000000000000000003-00000000000000000005-block-chunk.msgpack') is None
+
+    assert list(blockchain.yield_blocks()) == indexed_blocks
+    assert list(blockchain.yield_blocks_reversed()) == indexed_blocks_reversed
+    assert list(blockchain.yield_blocks_from(4)) == indexed_blocks_from
+    assert [block.get_block_number() for block in indexed_blocks_reversed] == list(range(7, -1, -1))
+
+
+def test_can_read_blocks_from_seekable_block_chunks(file_blockchain):
+    blockchain = file_blockchain
+    with patch.object(blockchain, 'snapshot_period_in_blocks',
+                      3), patch.object(blockchain.get_block_chunk_storage(), 'compressors', ('seekable',)):
+        add_blocks(
+            blockchain,
+            5,
+            blockchain._test_treasury_account_key_pair.private,
+            signing_key=blockchain._test_primary_validator_key_pair.private
+        )
+
+    block_chunk_storage = blockchain.get_block_chunk_storage()
+    filename = '00000000000000000000-00000000000000000002-block-chunk.msgpack'
+    assert block_chunk_storage.get_optimized_absolute_actual_path(filename).endswith('.seekable')
+
+    expected_blocks = list(blockchain.yield_blocks())
+    blockchain.clear_caches()
+    assert blockchain.get_block_by_number(1) == expected_blocks[1]
+    assert list(blockchain.yield_blocks_reversed()) == expected_blocks[::-1]
+
+
+def test_get_block_by_number_bisects_block_chunk_filename_index(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    expected_blocks = list(blockchain.yield_blocks())
+
+    for block_number, expected_block in enumerate(expected_blocks):
+        blockchain.clear_caches()
+        blockchain.get_block_chunk_filename_index()
+        with patch.object(blockchain, '_yield_block_chunk_filenames') as yield_block_chunk_filenames_mock:
+            assert blockchain.get_block_by_number(block_number) == expected_block
+
+        yield_block_chunk_filenames_mock.assert_not_called()
+
+    assert blockchain.get_block_by_number(len(expected_blocks)) is None
+    assert blockchain.get_block_by_number(-1) is None
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+import msgpack
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.tests.factories import add_blocks
+
+
+def test_blockchain_states_are_stored_as_deltas(file_blockchain, treasury_account_key_pair):
+    blockchain = file_blockchain
+    with patch.object(blockchain, '_blockchain_state_max_delta_depth', 2), \
+            patch.object(blockchain, 'snapshot_period_in_blocks', 2):
+        add_blocks(blockchain, 10, treasury_account_key_pair.private)
+
+    last_block_numbers, filenames = blockchain.get_blockchain_state_index()
+    assert last_block_numbers == [-1, 1, 3, 5, 7, 9]
+
+    # Deltas are named differently, so they are not taken for full blockchain states
+    assert [filename.endswith('-blockchain-state-delta.msgpack') for filename in filenames
+            ] == [False, True, True, False, True, True]
+
+    storage = blockchain.get_blockchain_state_storage()
+    unpacked = [msgpack.unpackb(storage.load(filename)) for filename in filenames]
+    assert [unpacked_item[:2] if isinstance(unpacked_item, list) else None for unpacked_item in unpacked
+            ] == [None, [-1, 1], [1, 2], None, [5, 1], [7, 2]]
+    # Only changed account states are stored in a delta
+    genesis_account_states = unpacked[0]['m']['a']
+    assert len(unpacked[1][2]['m']['a']) < len(genesis_account_states) + 4
+
+    expected_blockchain_states = list(blockchain.yield_blockchain_states())
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    actual_blockchain_states = list(other_blockchain.yield_blockchain_states())
+    assert [blockchain_state.meta['delta_depth'] for blockchain_state in actual_blockchain_states
+            ] == [0, 1, 2, 0, 1, 2]
+    for actual, expected in zip(actual_blockchain_states, expected_blockchain_states):
+        assert actual.to_messagepack() == expected.to_messagepack()
+
+    other_blockchain.validate()
+
+
+def test_generate_blockchain_state_does_not_change_previous_blockchain_state(
+    file_blockchain, treasury_account_key_pair
+):
+    blockchain = file_blockchain
+    treasury_account = treasury_account_key_pair.public
+    genesis_blockchain_state = blockchain.get_first_blockchain_state()
+    genesis_treasury_account_state = genesis_blockchain_state.get_account_state(treasury_account)
+    genesis_balance = genesis_treasury_account_state.balance
+
+    add_blocks(blockchain, 2, treasury_account_key_pair.private)
+    blockchain_state = blockchain.generate_blockchain_state()
+
+    assert blockchain_state.get_account_balance(treasury_account) < genesis_balance
+    assert genesis_treasury_account_state.balance == genesis_balance
+    assert genesis_blockchain_state.get_account_state(treasury_account) is genesis_treasury_account_state
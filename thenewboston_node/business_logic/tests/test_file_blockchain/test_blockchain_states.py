@@ -1,7 +1,9 @@
 import os.path
+from unittest.mock import patch
 
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
 from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.tests.factories import add_blocks
 from thenewboston_node.core.utils.cryptography import KeyPair
 
 
@@ -95,3 +97,44 @@ def test_blockchain_state_is_created_every_x_block(
             f'/0/0/0/0/0/0/0/0/0000000000000000000{block.message.block_number}-blockchain-state.msgpack'
         )
     )
+
+
+def test_get_blockchain_state_by_block_number_uses_index(file_blockchain_with_five_block_chunks):
+    blockchain = file_blockchain_with_five_block_chunks
+    assert blockchain.get_blockchain_state_index()[0] == [-1, 2, 5, 8, 11]
+
+    storage = blockchain.get_blockchain_state_storage()
+    with patch.object(storage, 'list_directory', side_effect=AssertionError('Must not be called')):
+        for block_number, inclusive, expected_last_block_number in (
+            (0, False, -1),
+            (0, True, -1),
+            (2, False, -1),
+            (2, True, 2),
+            (3, False, 2),
+            (11, True, 11),
+            (12, False, 11),
+            (100, True, 11),
+        ):
+            blockchain_state = blockchain.get_blockchain_state_by_block_number(block_number, inclusive=inclusive)
+            assert blockchain_state.last_block_number == expected_last_block_number
+
+        assert blockchain.get_blockchain_state_count() == 5
+        assert blockchain.get_first_blockchain_state().last_block_number == -1
+        assert blockchain.get_last_blockchain_state().last_block_number == 11
+
+
+def test_blockchain_state_index_reflects_changes_made_by_another_instance(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    reader_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert reader_blockchain.get_last_blockchain_state().last_block_number == 5
+
+    with patch.object(blockchain, 'snapshot_period_in_blocks', 3):
+        add_blocks(
+            blockchain,
+            1,
+            blockchain._test_treasury_account_key_pair.private,
+            signing_key=blockchain._test_primary_validator_key_pair.private
+        )
+
+    assert blockchain.get_last_blockchain_state().last_block_number == 8
+    assert reader_blockchain.get_last_blockchain_state().last_block_number == 8
@@ -0,0 +1,92 @@
+import os.path
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.blockchain.file_blockchain.block_chunk.base import BlockChunkFileBlockchainMixin
+from thenewboston_node.business_logic.tests.factories import add_blocks
+
+
+def test_head_points_to_last_block(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    last_block = next(blockchain.yield_blocks_reversed())
+
+    head = blockchain.get_up_to_date_head()
+    assert head is not None
+    assert os.path.isfile(head.file_path)
+    assert head.block_number == last_block.get_block_number()
+    assert head.block_hash == last_block.hash
+    assert head.block_timestamp == last_block.message.timestamp
+    assert head.chunk_filename == blockchain._get_last_block_chunk_file_path()
+
+    assert blockchain.get_next_block_number() == last_block.get_block_number() + 1
+    assert blockchain.get_next_block_identifier() == last_block.hash
+
+
+def test_head_is_used_without_reading_block_chunks(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    expected_next_block_number = blockchain.get_next_block_number()
+    expected_next_block_identifier = blockchain.get_next_block_identifier()
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert other_blockchain.get_up_to_date_head() is not None  # verified on first use
+
+    with patch.object(BlockChunkFileBlockchainMixin, '_yield_blocks_from_file') as yield_blocks_mock:
+        assert other_blockchain.get_next_block_number() == expected_next_block_number
+        assert other_blockchain.get_next_block_identifier() == expected_next_block_identifier
+
+    yield_blocks_mock.assert_not_called()
+
+
+def test_head_is_updated_by_another_instance(file_blockchain_with_three_block_chunks, treasury_account_key_pair):
+    blockchain = file_blockchain_with_three_block_chunks
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    next_block_number = other_blockchain.get_next_block_number()
+
+    add_blocks(blockchain, 2, treasury_account_key_pair.private)
+
+    assert other_blockchain.get_next_block_number() == next_block_number + 2
+    assert other_blockchain.get_next_block_identifier() == blockchain.get_last_block().hash
+
+
+def test_head_is_rebuilt_if_it_is_behind_blocks_on_disk(
+    file_blockchain_with_three_block_chunks, treasury_account_key_pair
+):
+    blockchain = file_blockchain_with_three_block_chunks
+    head = blockchain.get_head()
+    with open(head.file_path, 'rb') as fo:
+        stale_head = fo.read()
+
+    add_blocks(blockchain, 1, treasury_account_key_pair.private)
+    last_block = blockchain.get_last_block()
+
+    # Simulate a crash right after the block is appended, but before the head is written
+    with open(head.file_path, 'wb') as fo:
+        fo.write(stale_head)
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert other_blockchain.get_next_block_number() == last_block.get_block_number() + 1
+    assert other_blockchain.get_next_block_identifier() == last_block.hash
+
+    head = other_blockchain.get_up_to_date_head()
+    assert head.block_number == last_block.get_block_number()
+    assert head.block_hash == last_block.hash
+
+
+def test_head_is_created_for_blockchain_without_head(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    expected_next_block_number = blockchain.get_next_block_number()
+    os.remove(blockchain.get_head().file_path)
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert other_blockchain.get_next_block_number() == expected_next_block_number
+    assert os.path.isfile(other_blockchain.get_head().file_path)
+
+
+def test_head_is_removed_on_clear(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    head_file_path = blockchain.get_head().file_path
+    assert os.path.isfile(head_file_path)
+
+    blockchain.clear()
+    assert not os.path.exists(head_file_path)
+    assert blockchain.get_up_to_date_head() is None
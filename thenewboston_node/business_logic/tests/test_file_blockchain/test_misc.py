@@ -1,6 +1,8 @@
 import os.path
 from unittest.mock import patch
 
+import pytest
+
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
 from thenewboston_node.business_logic.blockchain.file_blockchain.block_chunk.meta import get_block_chunk_filename_meta
 from thenewboston_node.business_logic.blockchain.file_blockchain.blockchain_state.meta import (
@@ -33,21 +35,29 @@ def test_get_block_chunk_filename_meta():
 
 
 def test_get_blockchain_filename_meta():
-    assert get_blockchain_state_filename_meta(
-        filename='0000012-blockchain-state.msgpack'
-    ) == (None, None, None, '0000012-blockchain-state.msgpack', '0000012-blockchain-state.msgpack', 12, None, None)
-    assert get_blockchain_state_filename_meta(
-        filename='000000!-blockchain-state.msgpack'
-    ) == (None, None, None, '000000!-blockchain-state.msgpack', '000000!-blockchain-state.msgpack', None, None, None)
-    assert get_blockchain_state_filename_meta(
-        filename='0000001-blockchain-state.msgpack.xz'
-    ) == (None, None, None, '0000001-blockchain-state.msgpack.xz', '0000001-blockchain-state.msgpack', 1, 'xz', None)
+    assert get_blockchain_state_filename_meta(filename='0000012-blockchain-state.msgpack') == (
+        None, None, None, '0000012-blockchain-state.msgpack', '0000012-blockchain-state.msgpack', 12, None, False, None
+    )
+    assert get_blockchain_state_filename_meta(filename='000000!-blockchain-state.msgpack') == (
+        None, None, None, '000000!-blockchain-state.msgpack', '000000!-blockchain-state.msgpack', None, None, False,
+        None
+    )
+    assert get_blockchain_state_filename_meta(filename='0000001-blockchain-state.msgpack.xz') == (
+        None, None, None, '0000001-blockchain-state.msgpack.xz', '0000001-blockchain-state.msgpack', 1, 'xz', False,
+        None
+    )
     assert get_blockchain_state_filename_meta(filename='0000002-blockchain-state.msgpack.bz2') == (
-        None, None, None, '0000002-blockchain-state.msgpack.bz2', '0000002-blockchain-state.msgpack', 2, 'bz2', None
+        None, None, None, '0000002-blockchain-state.msgpack.bz2', '0000002-blockchain-state.msgpack', 2, 'bz2', False,
+        None
+    )
+    assert get_blockchain_state_filename_meta(filename='0000003-blockchain-state.msgpack.gz') == (
+        None, None, None, '0000003-blockchain-state.msgpack.gz', '0000003-blockchain-state.msgpack', 3, 'gz', False,
+        None
+    )
+    assert get_blockchain_state_filename_meta(filename='0000004-blockchain-state-delta.msgpack.gz') == (
+        None, None, None, '0000004-blockchain-state-delta.msgpack.gz', '0000004-blockchain-state-delta.msgpack', 4,
+        'gz', True, None
     )
-    assert get_blockchain_state_filename_meta(
-        filename='0000003-blockchain-state.msgpack.gz'
-    ) == (None, None, None, '0000003-blockchain-state.msgpack.gz', '0000003-blockchain-state.msgpack', 3, 'gz', None)
     assert get_blockchain_state_filename_meta(filename='000aaaa-blockchain-state.msgpack') is None
     assert get_blockchain_state_filename_meta(filename='0000012-aaa.msgpack') is None
     assert get_blockchain_state_filename_meta(filename='0000012-blockchain-state.msgpack.zip') is None
@@ -122,3 +132,10 @@ def test_file_blockchain_blocks_contain_metadata(file_blockchain: FileBlockchain
         block_meta = block.meta
         del block_meta['chunk_compression']  # type: ignore
         assert block_meta == expected_meta
+
+
+@pytest.mark.parametrize('storage_kwargs_name', ('blockchain_state_storage_kwargs', 'block_chunk_storage_kwargs'))
+def test_zstd_dictionary_is_rejected_for_served_storages(blockchain_directory, storage_kwargs_name):
+    kwargs = {storage_kwargs_name: {'zstd_dictionary_path': '/tmp/dictionary'}}
+    with pytest.raises(ValueError, match=f'{storage_kwargs_name} must not contain zstd_dictionary_path'):
+        FileBlockchain(base_directory=blockchain_directory, **kwargs)
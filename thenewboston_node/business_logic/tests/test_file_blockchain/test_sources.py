@@ -1,12 +1,19 @@
+import bz2
+import lzma
 from contextlib import closing
 from gzip import compress
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from urllib.request import urlopen
 
+import lz4.frame
+import pytest
+import requests
+
 from thenewboston_node.business_logic.blockchain.file_blockchain.sources import (
     BinaryDataBlockSource, BinaryDataStreamBlockSource, FileBlockSource, URLBlockSource
 )
+from thenewboston_node.business_logic.storages import seekable
 from thenewboston_node.business_logic.tests.baker_factories import make_coin_transfer_block
 
 
@@ -51,6 +58,10 @@ def test_can_get_blocks_from_binary_data_stream_block_source():
     blocks = tuple(source)
     assert blocks == (block1, block2)
 
+    source = BinaryDataStreamBlockSource(BytesIO(lz4.frame.compress(binary_data)), compressor='lz4')
+    blocks = tuple(source)
+    assert blocks == (block1, block2)
+
 
 def test_can_get_blocks_from_file_block_source():
     block1 = make_coin_transfer_block(meta=None)
@@ -119,3 +130,112 @@ def test_can_get_blocks_from_url_block_source(outer_web_mock):
     with closing(URLBlockSource(url_compressed)) as source:
         blocks = tuple(source)
         assert blocks == (block1, block2)
+
+
+def test_can_get_blocks_from_seekable_compressed_sources(outer_web_mock):
+    blocks = tuple(make_coin_transfer_block(meta=None) for _ in range(5))
+    compressed_binary_data = seekable.compress(b''.join(block.to_messagepack() for block in blocks), frame_size=2)
+
+    source = BinaryDataBlockSource(compressed_binary_data, compressor='seekable')
+    assert tuple(source) == blocks
+
+    source = BinaryDataBlockSource(compressed_binary_data, direction=-1, compressor='seekable')
+    assert tuple(source) == blocks[::-1]
+
+    with NamedTemporaryFile(suffix='.seekable') as fo:
+        fo.write(compressed_binary_data)
+        fo.flush()
+        with closing(FileBlockSource(fo.name, direction=-1)) as source:
+            assert tuple(source) == blocks[::-1]
+
+    url = (
+        'http://example.com/blockchain/blockchain-chunks'
+        '/0/0/0/0/0/0/0/0/000000000012-000000000016-block-chunk.msgpack.seekable'
+    )
+    requested_ranges = []
+
+    def serve_range(request, uri, response_headers):
+        range_header = request.headers['Range']
+        requested_ranges.append(range_header)
+        start, end = range_header.removeprefix('bytes=').split('-')
+        if start:
+            return 206, response_headers, compressed_binary_data[int(start):int(end) + 1]
+
+        return 206, response_headers, compressed_binary_data[-int(end):]
+
+    outer_web_mock.register_uri(outer_web_mock.GET, url, body=serve_range)
+    with closing(URLBlockSource(url, direction=-1)) as source:
+        assert next(source) == blocks[-1]
+
+    # Frame table and the last frame are downloaded
+    assert len(requested_ranges) == 3
+
+
+def test_can_get_blocks_from_url_block_source_with_session(outer_web_mock):
+    blocks = tuple(make_coin_transfer_block(meta=None) for _ in range(2))
+    compressed_binary_data = compress(b''.join(block.to_messagepack() for block in blocks))
+    url = (
+        'http://example.com/blockchain/blockchain-chunks'
+        '/0/0/0/0/0/0/0/0/000000000012-000000000013-block-chunk.msgpack.gz'
+    )
+    # Body must not be decoded according to Content-Encoding, because decompression is done by the source
+    outer_web_mock.register_uri(
+        outer_web_mock.GET, url, body=compressed_binary_data, adding_headers={'Content-Encoding': 'gzip'}
+    )
+
+    with requests.Session() as session:
+        with closing(URLBlockSource(url, session=session, timeout=5)) as source:
+            assert tuple(source) == blocks
+
+        with closing(URLBlockSource(url, direction=-1, session=session)) as source:
+            assert tuple(source) == blocks[::-1]
+
+
+class ReadSizeRecordingBytesIO(BytesIO):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        return super().read(size)
+
+
+@pytest.mark.parametrize(
+    'compressor,compress_function', (
+        (None, lambda data: data),
+        ('gz', compress),
+        ('bz2', bz2.compress),
+        ('xz', lzma.compress),
+    )
+)
+def test_binary_data_stream_block_source_yields_blocks_as_data_arrives(compressor, compress_function):
+    blocks = tuple(make_coin_transfer_block(meta=None) for _ in range(20))
+    compressed_binary_data = compress_function(b''.join(block.to_messagepack() for block in blocks))
+
+    stream = ReadSizeRecordingBytesIO(compressed_binary_data)
+    source = BinaryDataStreamBlockSource(stream, read_chunk_size=64, compressor=compressor)
+    assert next(source) == blocks[0]
+    if compressor != 'bz2':  # bz2 decompresses data by (large) blocks
+        assert stream.tell() < len(compressed_binary_data)
+
+    assert (blocks[0],) + tuple(source) == blocks
+    assert set(stream.read_sizes) == {64}
+
+
+def test_binary_data_stream_block_source_reads_concatenated_compressed_streams():
+    blocks = tuple(make_coin_transfer_block(meta=None) for _ in range(4))
+    compressed_binary_data = b''.join(compress(block.to_messagepack()) for block in blocks)
+
+    source = BinaryDataStreamBlockSource(BytesIO(compressed_binary_data), read_chunk_size=16, compressor='gz')
+    assert tuple(source) == blocks
+
+
+def test_binary_data_stream_block_source_raises_error_on_truncated_compressed_data():
+    blocks = tuple(make_coin_transfer_block(meta=None) for _ in range(4))
+    compressed_binary_data = compress(b''.join(block.to_messagepack() for block in blocks))
+
+    source = BinaryDataStreamBlockSource(BytesIO(compressed_binary_data[:-10]), read_chunk_size=16, compressor='gz')
+    with pytest.raises(EOFError):
+        tuple(source)
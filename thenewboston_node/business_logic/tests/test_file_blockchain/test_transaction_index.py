@@ -0,0 +1,61 @@
+import os.path
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.blockchain.base.account_state import AccountStateMixin
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+
+
+def test_transaction_index_matches_blocks_traversal(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    accounts = set(blockchain.yield_known_accounts())
+    accounts.add('0' * 64)  # unknown account
+
+    for account in accounts:
+        for is_reversed in (False, True):
+            # Reversed transactions are in reversed order of blocks, but in the original order within a block
+            expected = list(AccountStateMixin.yield_transactions(blockchain, account, is_reversed=is_reversed))
+            assert list(blockchain.yield_transactions(account, is_reversed=is_reversed)) == expected
+            assert list(blockchain.yield_transactions_slice(account, slice(1, 4),
+                                                            is_reversed=is_reversed)) == expected[1:4]
+
+
+def test_transaction_index_is_persisted(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    index_file_path = blockchain.get_transaction_index().file_path
+    assert os.path.isfile(index_file_path)
+
+    accounts = list(blockchain.yield_known_accounts())
+    expected = {account: list(blockchain.yield_transactions(account)) for account in accounts}
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    with patch.object(other_blockchain, '_rebuild_transaction_index') as rebuild_mock:
+        assert {account: list(other_blockchain.yield_transactions(account)) for account in accounts} == expected
+
+    rebuild_mock.assert_not_called()
+
+
+def test_transaction_index_is_rebuilt(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    accounts = list(blockchain.yield_known_accounts())
+    expected = {account: list(blockchain.yield_transactions(account)) for account in accounts}
+
+    blockchain.get_transaction_index().remove()
+
+    other_blockchain = FileBlockchain(base_directory=blockchain.get_base_directory())
+    assert {account: list(other_blockchain.yield_transactions(account)) for account in accounts} == expected
+    assert os.path.isfile(other_blockchain.get_transaction_index().file_path)
+
+
+def test_transaction_index_is_not_rebuilt_for_incomplete_blockchain(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    blockchain.get_transaction_index().remove()
+    blocks = list(blockchain.yield_blocks())[1:]  # the first block is missing
+
+    with patch.object(blockchain, 'yield_blocks', side_effect=lambda: iter(blocks)) as yield_blocks_mock:
+        assert blockchain.get_up_to_date_transaction_index() is None
+        assert blockchain.get_up_to_date_transaction_index() is None
+
+    yield_blocks_mock.assert_called_once_with()
+
+    blockchain.clear_caches()
+    assert blockchain.get_up_to_date_transaction_index() is not None
@@ -1,5 +1,12 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.base import validation
 from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.tests.factories import add_blocks
 from thenewboston_node.core.utils.cryptography import KeyPair
 
 
@@ -51,3 +58,22 @@ def test_can_validate_blockchain(
     blockchain.add_block(block2)
     blockchain.snapshot_blockchain_state()
     blockchain.validate(is_partial_allowed=False)
+
+
+@pytest.mark.parametrize('batch_size_in_blocks', (1, 2, 1000))
+def test_validate_blocks_reports_first_invalid_signature(
+    memory_blockchain, treasury_account_key_pair, primary_validator_key_pair, batch_size_in_blocks
+):
+    blockchain = memory_blockchain
+    blockchain._test_primary_validator_key_pair = primary_validator_key_pair
+    add_blocks(blockchain, 4, treasury_account_key_pair.private)
+    blockchain.validate_blocks()
+
+    blocks = blockchain.blocks
+    # Signature error of block 1 must be reported even though block 3 has an error of other kind
+    blocks[1].signature = blocks[0].signature
+    blocks[3].message.block_identifier = '0' * 64
+
+    with patch.object(validation, 'SIGNATURE_VERIFICATION_BATCH_SIZE_IN_BLOCKS', batch_size_in_blocks):
+        with pytest.raises(ValidationError, match='Message signature is invalid'):
+            blockchain.validate_blocks()
@@ -1,8 +1,10 @@
 import copy
+from unittest.mock import patch
 
 import pytest
 
 from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import Block, BlockMessage
 
 
 def test_validate_updated_account_states(memory_blockchain, block_message):
@@ -104,3 +106,45 @@ def test_validate_updated_account_states(memory_blockchain, block_message):
         ValidationError, match=r'Block message recipient account [0-9a-f]{64} balance must be equal to \d+'
     ):
         block_message_copy.validate_updated_account_states(memory_blockchain)
+
+
+def test_frozen_block_message_is_normalized_once(block_message):
+    expected_normalized = block_message.get_normalized_for_cryptography()
+    expected_hash = block_message.get_hash()
+
+    with patch.object(
+        BlockMessage, 'normalize_for_cryptography', autospec=True, side_effect=lambda self: expected_normalized
+    ) as normalize_mock:
+        with block_message.frozen():
+            assert block_message.get_normalized_for_cryptography() == expected_normalized
+            assert block_message.get_hash() == expected_hash
+            with block_message.frozen():
+                assert block_message.get_hash() == expected_hash
+            assert block_message.is_frozen()
+            assert not copy.deepcopy(block_message).is_frozen()
+
+            assert normalize_mock.call_count == 1
+
+            # Setting an attribute invalidates the cache
+            block_message.block_number = block_message.block_number
+            block_message.get_hash()
+            assert normalize_mock.call_count == 2
+
+        assert not block_message.is_frozen()
+        block_message.get_hash()
+        block_message.get_hash()
+        assert normalize_mock.call_count == 4
+
+
+def test_block_validation_normalizes_block_message_once(
+    memory_blockchain, sample_signed_change_request, primary_validator_key_pair
+):
+    request = sample_signed_change_request
+    block = Block.create_from_signed_change_request(memory_blockchain, request, primary_validator_key_pair.private)
+
+    normalize = BlockMessage.normalize_for_cryptography
+    with patch.object(BlockMessage, 'normalize_for_cryptography', autospec=True, side_effect=normalize) as mock:
+        block.validate(memory_blockchain)
+
+    assert mock.call_count == 1
+    assert not block.message.is_frozen()
@@ -0,0 +1,101 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import msgpack
+import pytest
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import Block, BlockchainState
+from thenewboston_node.business_logic.models.block_message import BlockMessage
+from thenewboston_node.business_logic.models.constants import BlockType
+from thenewboston_node.business_logic.models.mixins.compactable import CompactableMixin
+from thenewboston_node.business_logic.tests import baker_factories
+from thenewboston_node.core.utils import baker
+from thenewboston_node.core.utils.misc import coerce_from_json_type
+
+
+def assert_compact_codec_matches_generic(instance):
+    with patch.object(CompactableMixin, 'to_compact_dict_generic') as to_compact_dict_generic_mock:
+        compact_dict = instance.to_compact_dict()
+
+    to_compact_dict_generic_mock.assert_not_called()
+    assert msgpack.packb(compact_dict) == msgpack.packb(instance.to_compact_dict_generic())
+
+    class_ = type(instance)
+    with patch.object(CompactableMixin, 'from_compact_dict_generic') as from_compact_dict_generic_mock:
+        deserialized = class_.from_compact_dict(compact_dict)
+
+    from_compact_dict_generic_mock.assert_not_called()
+    assert deserialized == class_.from_compact_dict_generic(compact_dict)
+    assert msgpack.packb(deserialized.to_compact_dict_generic()) == msgpack.packb(compact_dict)
+
+
+@pytest.mark.parametrize('block_type', [block_type.value for block_type in BlockType])
+def test_compact_codec_matches_generic_for_block(block_type):
+    for _ in range(5):
+        assert_compact_codec_matches_generic(baker_factories.make_block(block_type))
+
+
+def test_compact_codec_matches_generic_for_blockchain_state(blockchain_genesis_state):
+    assert_compact_codec_matches_generic(blockchain_genesis_state)
+    for _ in range(5):
+        assert_compact_codec_matches_generic(baker.make(BlockchainState))
+
+
+def test_compact_codec_matches_generic_for_blockchain(file_blockchain_with_three_block_chunks):
+    blockchain = file_blockchain_with_three_block_chunks
+    for block in blockchain.yield_blocks():
+        block.meta = None
+        assert_compact_codec_matches_generic(block)
+
+    for blockchain_state in blockchain.yield_blockchain_states():
+        blockchain_state.meta = None
+        assert_compact_codec_matches_generic(blockchain_state)
+
+
+def test_compact_codec_falls_back_to_generic_for_invalid_data():
+    compact_dict = baker_factories.make_block(BlockType.COIN_TRANSFER.value).to_compact_dict()
+    compact_dict['unknown'] = 1
+
+    with pytest.raises(KeyError, match='unknown'):
+        Block.from_compact_dict_generic(compact_dict)
+
+    with pytest.raises(KeyError, match='unknown'):
+        Block.from_compact_dict(compact_dict)
+
+    del compact_dict['unknown']
+    compact_dict['m']['bt'] = 'unknown'
+    with pytest.raises(ValidationError, match='Block type must be one of'):
+        Block.from_compact_dict(compact_dict)
+
+
+def test_compact_codec_coerces_scalars():
+    compact_dict = baker_factories.make_block(BlockType.COIN_TRANSFER.value).to_compact_dict()
+
+    with patch(
+        'thenewboston_node.business_logic.models.mixins.compactable.coerce_from_json_type',
+        side_effect=coerce_from_json_type
+    ) as coerce_from_json_type_mock:
+        Block.from_compact_dict(compact_dict)
+
+    coerced_types = {call.args[1] for call in coerce_from_json_type_mock.call_args_list}
+    assert {datetime, int, str} <= coerced_types
+
+
+def test_compact_codec_does_not_fall_back_to_generic_for_unexpected_errors():
+    block = baker_factories.make_block(BlockType.COIN_TRANSFER.value)
+    compact_dict = block.to_compact_dict()
+
+    with patch.object(CompactableMixin, 'from_compact_dict_generic') as from_compact_dict_generic_mock:
+        with patch.object(BlockMessage, 'fix_compact_kwargs', side_effect=RuntimeError('Unexpected')):
+            with pytest.raises(RuntimeError, match='Unexpected'):
+                Block.from_compact_dict(compact_dict)
+
+    from_compact_dict_generic_mock.assert_not_called()
+
+    with patch.object(CompactableMixin, 'to_compact_dict_generic') as to_compact_dict_generic_mock:
+        with patch.object(BlockMessage, 'fix_compact_dict', side_effect=RuntimeError('Unexpected')):
+            with pytest.raises(RuntimeError, match='Unexpected'):
+                block.to_compact_dict()
+
+    to_compact_dict_generic_mock.assert_not_called()
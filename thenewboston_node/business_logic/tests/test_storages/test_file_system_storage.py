@@ -1,13 +1,20 @@
+import gzip
 import os.path
+from unittest.mock import Mock, patch
 
+import msgpack
 import pytest
+import zstandard
 
 from thenewboston_node.business_logic import exceptions
-from thenewboston_node.business_logic.storages.file_system import FileSystemStorage
+from thenewboston_node.business_logic.storages import file_system
+from thenewboston_node.business_logic.storages.file_system import (
+    DECOMPRESSION_FUNCTIONS, FileSystemStorage, train_zstd_dictionary
+)
 from thenewboston_node.business_logic.tests.test_storages.utils import compress, decompress
 
 
-@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz', 'zst', 'lz4'))
 def test_can_load_compressed_file(blockchain_path, compression, compressible_data):
     fss = FileSystemStorage(blockchain_path)
     compressed_path = blockchain_path / f'file.txt.{compression}'
@@ -39,7 +46,7 @@ def test_no_compression_file_storage_saves_raw_files(blockchain_path, compressib
     assert file_path.read_bytes() == compressible_data
 
 
-@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz', 'zst', 'lz4'))
 def test_finalized_data_is_compressed(blockchain_path, compression, compressible_data):
     fss = FileSystemStorage(blockchain_path, compressors=(compression,))
     file_path = blockchain_path / f'file.txt.{compression}'
@@ -50,6 +57,23 @@ def test_finalized_data_is_compressed(blockchain_path, compression, compressible
     assert decompressed_data == compressible_data
 
 
+@pytest.mark.parametrize('is_final_save', (True, False))
+def test_compressed_file_is_written_atomically(blockchain_path, compressible_data, is_final_save):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz',), use_atomic_write=False)
+    if not is_final_save:
+        fss.save('file.txt', compressible_data)
+
+    with patch.object(file_system, 'atomic_write_append', wraps=file_system.atomic_write_append) as atomic_write_mock:
+        if is_final_save:
+            fss.save('file.txt', compressible_data, is_final=True)
+        else:
+            fss.finalize('file.txt')
+
+    atomic_write_mock.assert_called_once_with(blockchain_path / 'file.txt.gz', mode='wb', dir=fss.temp_dir)
+    assert not (blockchain_path / 'file.txt').exists()
+    assert fss.load('file.txt') == compressible_data
+
+
 @pytest.mark.parametrize('is_final', (True, False))
 def test_save_to_compressed_finalized_file_raises_error(
     blockchain_path, compressible_data, incompressible_data, is_final
@@ -144,3 +168,123 @@ def test_cannot_use_absolute_path(blockchain_path, compressible_data):
 
     with pytest.raises(ValueError):
         fss.save(file_path, compressible_data)
+
+
+@pytest.mark.parametrize('compressors', ((), ('gz',), ('seekable',)))
+def test_can_load_range(blockchain_path, compressors):
+    fss = FileSystemStorage(blockchain_path, compressors=compressors)
+    binary_data = b'A' * 1000 + b'0123456789' + b'B' * 1000
+
+    fss.save('file.txt', binary_data, is_final=True)
+
+    assert fss.load_range('file.txt', 1000, 1010) == b'0123456789'
+    assert fss.load_range('file.txt', 0, 3) == b'AAA'
+
+
+def test_seekable_load_range_decompresses_only_required_frames(blockchain_path):
+    fss = FileSystemStorage(blockchain_path, compressors=('seekable',), seekable_frame_size=2)
+    records = [msgpack.packb({'number': number, 'data': 'X' * 100}) for number in range(10)]
+    binary_data = b''.join(records)
+
+    fss.save('file.msgpack', binary_data, is_final=True)
+    assert os.path.isfile(blockchain_path / 'file.msgpack.seekable')
+    assert fss.load('file.msgpack') == binary_data
+
+    start = len(b''.join(records[:5]))
+    decompress_mock = Mock(wraps=gzip.decompress)
+    with patch.dict(DECOMPRESSION_FUNCTIONS, {'gz': decompress_mock}):
+        assert fss.load_range('file.msgpack', start, start + len(records[5])) == records[5]
+
+    decompress_mock.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'compression_policy, expected_compressor', (
+        ('smallest', 'xz'),
+        ('fastest', 'gz'),
+        ('time_budget', 'gz'),
+    )
+)
+def test_compression_policy(blockchain_path, compression_policy, expected_compressor):
+    fss = FileSystemStorage(
+        blockchain_path,
+        compressors=('xz', 'gz'),
+        compression_policy=compression_policy,
+        compression_time_budget=0,
+    )
+    binary_data = b''.join(msgpack.packb({'number': number, 'data': 'X' * number}) for number in range(500))
+
+    fss.save('file.msgpack', binary_data, is_final=True)
+
+    assert fss.get_actual_file_path('file.msgpack').endswith('.' + expected_compressor)
+    assert fss.load('file.msgpack') == binary_data
+
+
+def test_time_budget_compression_policy_skips_slow_compressors(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('xz', 'bz2', 'gz'), compression_policy='time_budget')
+    fss._compression_speeds['bz2'] = 1  # byte per second
+
+    _, compressor = fss._get_best_compression(compressible_data)
+
+    assert compressor != 'bz2'
+    assert fss._compression_speeds['bz2'] == 1  # bz2 compression was not tried
+
+
+def test_unsupported_compressor_is_rejected(blockchain_path):
+    with pytest.raises(ValueError, match='Unsupported compressors: unknown'):
+        FileSystemStorage(blockchain_path, compressors=('gz', 'unknown'))
+
+    with pytest.raises(ValueError, match='Unsupported compression policy'):
+        FileSystemStorage(blockchain_path, compression_policy='unknown')
+
+
+def test_can_use_zstd_dictionary(blockchain_path):
+    samples = [msgpack.packb({'number': number, 'data': 'X' * (number % 10)}) for number in range(1000)]
+    dictionary_path = blockchain_path / 'dictionary'
+    blockchain_path.mkdir(parents=True, exist_ok=True)
+    dictionary_path.write_bytes(train_zstd_dictionary(samples, dictionary_size=1024))
+
+    data = b''.join(samples[:100])
+    fss = FileSystemStorage(blockchain_path, compressors=('zst',), zstd_dictionary_path=dictionary_path)
+    fss.save('file.msgpack', data, is_final=True)
+
+    actual_file_path = fss.get_actual_file_path('file.msgpack')
+    assert actual_file_path.endswith('.zst')
+    with open(actual_file_path, 'rb') as fo:
+        assert zstandard.get_frame_parameters(fo.read()).dict_id == fss.zstd_dictionary.dict_id()
+
+    assert fss.load('file.msgpack') == data
+
+    # Dictionaries are registered per storage
+    another_fss = FileSystemStorage(blockchain_path, compressors=('zst',))
+    with pytest.raises(ValueError, match='Unknown zstd dictionary'):
+        another_fss.load('file.msgpack')
+
+    another_fss.register_zstd_dictionary(dictionary_path.read_bytes())
+    assert another_fss.load('file.msgpack') == data
+
+
+def test_can_compress_in_parallel(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz', 'bz2', 'xz'), compression_workers=2)
+    compressed_path = blockchain_path / 'file.txt.gz'
+
+    fss.save('file.txt', binary_data=compressible_data, is_final=True)
+
+    assert compressed_path.exists()
+    assert fss.load('file.txt') == compressible_data
+
+
+def test_close_shuts_down_compression_executor(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('gz', 'bz2'), compression_workers=2)
+    fss.save('file.txt', binary_data=compressible_data, is_final=True)
+    executor = fss.get_compression_executor()
+
+    fss.close()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(len, compressible_data)
+
+    # Storage can still be used after closing
+    fss.save('another-file.txt', binary_data=compressible_data, is_final=True)
+    assert fss.get_compression_executor() is not executor
+    fss.close()
@@ -0,0 +1,160 @@
+import os
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.storages import file_system, journal
+from thenewboston_node.business_logic.storages.file_system import FileSystemStorage
+
+
+def make_journaled_storage(blockchain_path):
+    return FileSystemStorage(blockchain_path / 'data', compressors=(), journal_directory=blockchain_path / 'journals')
+
+
+def test_journaled_append_does_not_rewrite_file(blockchain_path):
+    fss = make_journaled_storage(blockchain_path)
+
+    with patch.object(file_system, 'atomic_write_append') as atomic_write_append_mock:
+        fss.append('file.bin', b'record1')
+        fss.append('file.bin', b'record2')
+
+    atomic_write_append_mock.assert_not_called()
+    assert fss.load('file.bin') == b'record1record2'
+    assert os.path.getsize(blockchain_path / 'journals' / 'file.bin.journal') == 32
+
+
+def test_torn_record_is_truncated_on_open(blockchain_path):
+    fss = make_journaled_storage(blockchain_path)
+    fss.append('file.bin', b'record1')
+
+    # Simulate a crash after writing a part of a record, but before writing the journal entry
+    with open(blockchain_path / 'data' / 'file.bin', 'ab') as fo:
+        fo.write(b'rec')
+
+    other_fss = make_journaled_storage(blockchain_path)
+    assert other_fss.load('file.bin') == b'record1'
+    other_fss.append('file.bin', b'record2')
+    assert other_fss.load('file.bin') == b'record1record2'
+
+
+def test_torn_first_record_is_truncated_on_open(blockchain_path):
+    fss = make_journaled_storage(blockchain_path)
+
+    def write_part(fd, binary_data):
+        os.write(fd, binary_data[:3])
+        raise OSError('Simulated crash')
+
+    with patch.object(journal, 'write_all', side_effect=write_part):
+        with pytest.raises(OSError, match='Simulated crash'):
+            fss.append('file.bin', b'record1')
+
+    assert os.path.getsize(blockchain_path / 'data' / 'file.bin') == 3
+
+    make_journaled_storage(blockchain_path)
+    assert os.path.getsize(blockchain_path / 'data' / 'file.bin') == 0
+
+
+def test_corrupted_record_is_truncated_on_open(blockchain_path):
+    fss = make_journaled_storage(blockchain_path)
+    fss.append('file.bin', b'record1')
+    fss.append('file.bin', b'record2')
+
+    # Simulate a crash when journal entry is written, but data is not (zero filled by file system)
+    with open(blockchain_path / 'data' / 'file.bin', 'r+b') as fo:
+        fo.seek(7)
+        fo.write(b'\x00' * 7)
+
+    other_fss = make_journaled_storage(blockchain_path)
+    assert other_fss.load('file.bin') == b'record1'
+    other_fss.append('file.bin', b'record3')
+    assert other_fss.load('file.bin') == b'record1record3'
+    assert os.path.getsize(blockchain_path / 'journals' / 'file.bin.journal') == 32
+
+
+def test_not_journaled_file_is_trusted(blockchain_path):
+    FileSystemStorage(blockchain_path / 'data', compressors=()).append('file.bin', b'record1')
+
+    fss = make_journaled_storage(blockchain_path)
+    fss.append('file.bin', b'record2')
+    assert fss.load('file.bin') == b'record1record2'
+
+
+def test_journal_is_removed_on_finalization(blockchain_path):
+    fss = make_journaled_storage(blockchain_path)
+    fss.append('file.bin', b'record1')
+    fss.move('file.bin', 'moved.bin')
+    fss.finalize('moved.bin')
+
+    assert not os.path.exists(blockchain_path / 'journals' / 'file.bin.journal')
+    assert fss.is_finalized('moved.bin')
+    assert fss.load('moved.bin') == b'record1'
+
+
+@pytest.mark.parametrize(
+    'durability, expected_fsyncs_after_appends, expected_fsyncs_after_finalization', (
+        ('none', 0, 0),
+        ('block', 9, 11),
+        ('group', 4, 6),
+        ('chunk', 0, 2),
+    )
+)
+def test_durability(blockchain_path, durability, expected_fsyncs_after_appends, expected_fsyncs_after_finalization):
+    fss = FileSystemStorage(
+        blockchain_path / 'data',
+        compressors=(),
+        journal_directory=blockchain_path / 'journals',
+        durability=durability,
+        group_commit_blocks=2,
+        group_commit_interval_ms=3600 * 1000,
+    )
+    with patch('os.fsync') as fsync_mock:
+        for record in (b'record1', b'record2', b'record3'):
+            fss.append('file.bin', record)
+
+        # group: data file, journal and their directories are synced after the second append
+        assert fsync_mock.call_count == expected_fsyncs_after_appends
+
+        fss.finalize('file.bin')
+        assert fsync_mock.call_count == expected_fsyncs_after_finalization
+
+
+def test_group_is_synced_by_timer(blockchain_path):
+    fss = FileSystemStorage(
+        blockchain_path / 'data',
+        compressors=(),
+        journal_directory=blockchain_path / 'journals',
+        durability='group',
+        group_commit_blocks=100,
+        group_commit_interval_ms=200,
+    )
+    with patch.object(fss, 'sync', wraps=fss.sync) as sync_mock:
+        fss.append('file.bin', b'record1')
+        sync_mock.assert_not_called()
+        for _ in range(100):
+            if sync_mock.called:
+                break
+            sleep(0.05)
+
+    sync_mock.assert_called_once_with()
+    assert fss._sync_timer is None
+
+
+def test_close_syncs_appended_data(blockchain_path):
+    fss = FileSystemStorage(
+        blockchain_path / 'data',
+        compressors=(),
+        journal_directory=blockchain_path / 'journals',
+        durability='chunk',
+    )
+    fss.append('file.bin', b'record1')
+    with patch('os.fsync') as fsync_mock:
+        fss.close()
+
+    # data file, journal and their directories
+    assert fsync_mock.call_count == 4
+
+
+def test_unsupported_durability_is_rejected(blockchain_path):
+    with pytest.raises(ValueError, match='Unsupported durability'):
+        FileSystemStorage(blockchain_path, durability='unknown')
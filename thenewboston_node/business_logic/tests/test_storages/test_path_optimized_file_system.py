@@ -272,3 +272,60 @@ def test_move(blockchain_path):
     assert os.path.isfile(str(blockchain_path / 'f/i/l/e/2/file2.txt'))
     assert not os.path.isfile(str(blockchain_path / 'f/i/l/e/1/file1.txt'))
     assert storage.load(destination) == b'AAA'
+
+
+def test_list_directory_uses_manifest(blockchain_path):
+    fss = PathOptimizedFileSystemStorage(blockchain_path, compressors=('gz',), manifest_filename='.manifest.msgpack')
+    fss.save('a.txt', b'AAAAAAAAAA', is_final=True)
+    fss.append('c.txt', b'C')
+    fss.save('b.txt', b'B')
+    fss.move('b.txt', 'd.txt')
+
+    other_fss = PathOptimizedFileSystemStorage(blockchain_path, manifest_filename='.manifest.msgpack')
+    assert list(other_fss.list_directory()) == ['a.txt', 'c.txt', 'd.txt']
+
+    fss.save('e.txt', b'E')
+    with patch('os.walk', side_effect=AssertionError('Directory tree should not be walked')):
+        assert list(fss.list_directory(sort_direction=-1)) == ['e.txt', 'd.txt', 'c.txt', 'a.txt']
+        assert list(other_fss.list_directory()) == ['a.txt', 'c.txt', 'd.txt', 'e.txt']
+
+
+def test_manifest_is_reconciled_with_directory(blockchain_path):
+    fss = PathOptimizedFileSystemStorage(blockchain_path, manifest_filename='.manifest.msgpack')
+    fss.save('a.txt', b'A')
+
+    # File is created bypassing the storage
+    mkdir_and_touch(fss.get_optimized_absolute_actual_path('b.txt'))
+
+    assert list(fss.list_directory()) == ['a.txt']
+
+    other_fss = PathOptimizedFileSystemStorage(blockchain_path, manifest_filename='.manifest.msgpack')
+    assert list(other_fss.list_directory()) == ['a.txt', 'b.txt']
+
+
+def test_manifest_is_created_on_first_save(blockchain_path):
+    fss = PathOptimizedFileSystemStorage(blockchain_path, manifest_filename='.manifest.msgpack')
+    assert not fss.get_manifest().exists()
+
+    fss.save('a.txt', b'A')
+    assert fss.get_manifest().exists()
+    with patch('os.walk', side_effect=AssertionError('Directory tree should not be walked')):
+        assert list(fss.list_directory()) == ['a.txt']
+
+
+def test_manifest_listing_is_not_affected_by_changes_while_consumed(blockchain_path):
+    fss = PathOptimizedFileSystemStorage(blockchain_path, manifest_filename='.manifest.msgpack')
+    fss.save('a.txt', b'A')
+    fss.save('dir/b.txt', b'B')
+    fss.save('c.txt', b'C')
+
+    with patch('os.walk', side_effect=AssertionError('Directory tree should not be walked')):
+        assert list(fss.list_directory('dir')) == ['dir/b.txt']
+
+        names = fss.list_directory(sort_direction=-1)
+        assert next(names) == 'c.txt'
+        fss.save('b.txt', b'B')
+        fss.move('a.txt', 'd.txt')
+        assert list(names) == ['a.txt']
+
+        assert list(fss.list_directory()) == ['b.txt', 'c.txt', 'd.txt']
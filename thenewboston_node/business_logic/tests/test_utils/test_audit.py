@@ -0,0 +1,69 @@
+import json
+import os.path
+from datetime import timedelta
+
+import pytest
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import Block
+from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FUNCTIONS, get_compressor_from_location
+from thenewboston_node.business_logic.utils.audit import audit_in_parallel, yield_segments
+
+FILE_BLOCKCHAIN_CLASS = 'thenewboston_node.business_logic.blockchain.file_blockchain.FileBlockchain'
+
+
+def test_yield_segments(file_blockchain_with_five_block_chunks):
+    blockchain = file_blockchain_with_five_block_chunks
+
+    assert list(yield_segments(blockchain, -1)) == [(-1, 2), (2, 5), (5, 8), (8, 11), (11, None)]
+    assert list(yield_segments(blockchain, 8)) == [(8, 11), (11, None)]
+
+
+def test_audit_in_parallel(file_blockchain_with_five_block_chunks, tmpdir):
+    blockchain = file_blockchain_with_five_block_chunks
+    checkpoint_file_path = os.path.join(tmpdir, 'audit-checkpoint.json')
+    progress = []
+
+    audit_in_parallel(
+        FILE_BLOCKCHAIN_CLASS, {'base_directory': blockchain.get_base_directory()},
+        2,
+        checkpoint_file_path=checkpoint_file_path,
+        progress_callback=progress.append
+    )
+
+    assert progress == [2, 5, 8, 11, 13]
+    with open(checkpoint_file_path) as fo:
+        assert json.load(fo) == {
+            'last_block_number': 11,
+            'next_block_identifier': blockchain.get_last_blockchain_state().next_block_identifier,
+        }
+
+    # Serial audit resumes from the checkpoint written by parallel audit
+    progress = []
+    blockchain.audit(checkpoint_file_path=checkpoint_file_path, progress_callback=progress.append)
+    assert progress == [13]
+
+
+def test_audit_in_parallel_reports_invalid_segment(file_blockchain_with_five_block_chunks):
+    blockchain = file_blockchain_with_five_block_chunks
+    blocks = [Block.from_messagepack(block.to_messagepack()) for block in blockchain.yield_blocks_slice(3, 5)]
+    blocks[1].message.timestamp += timedelta(seconds=1)
+
+    # Replace block chunk file content with the tampered blocks compressed the same way
+    storage = blockchain.get_block_chunk_storage()
+    actual_file_path = storage.get_optimized_absolute_actual_path(
+        '00000000000000000003-00000000000000000005-block-chunk.msgpack'
+    )
+    binary_data = b''.join(block.to_messagepack() for block in blocks)
+    compressor = get_compressor_from_location(actual_file_path)
+    os.chmod(actual_file_path, 0o644)
+    with open(actual_file_path, 'wb') as fo:
+        fo.write(COMPRESSION_FUNCTIONS[compressor](binary_data) if compressor else binary_data)
+
+    with pytest.raises(ValidationError) as exc_info:
+        audit_in_parallel(FILE_BLOCKCHAIN_CLASS, {'base_directory': blockchain.get_base_directory()}, 2)
+
+    message = str(exc_info.value)
+    assert message.startswith('Segment after block number 2 up to block number 5: ')
+    assert 'block number 4' in message
+    assert 'Block hash must be equal to' in message
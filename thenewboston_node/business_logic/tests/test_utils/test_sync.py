@@ -0,0 +1,192 @@
+import os.path
+import re
+from collections import Counter
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.models import Block
+from thenewboston_node.business_logic.storages.file_system import COMPRESSION_FUNCTIONS, get_compressor_from_location
+from thenewboston_node.business_logic.tests.base import (
+    as_primary_validator, assert_blockchain_content, assert_iter_equal_except_meta, force_file_blockchain
+)
+from thenewboston_node.business_logic.tests.factories import add_blocks
+from thenewboston_node.business_logic.utils.sync import sync_from_network
+from thenewboston_node.core.clients.node import NodeClient
+
+PEER_NETWORK_ADDRESS = 'http://peer.non-existing-domain:8555/'
+
+
+def register_block_chunks(blockchain, outer_web_mock, network_address):
+    for block_chunk_meta in blockchain.yield_block_chunks_meta():
+        with open(block_chunk_meta.absolute_file_path, 'rb') as fo:
+            outer_web_mock.register_uri(
+                outer_web_mock.GET,
+                f'{network_address}blockchain/{block_chunk_meta.blockchain_root_relative_file_path}',
+                body=fo.read(),
+                adding_headers={'Content-Type': 'application/octet-stream'}
+            )
+
+
+def register_not_found(outer_web_mock, network_address):
+    outer_web_mock.register_uri(
+        outer_web_mock.GET, re.compile(re.escape(f'{network_address}blockchain/') + '.*'), status=404
+    )
+
+
+def get_downloads(outer_web_mock):
+    return Counter((request.headers['Host'], request.path) for request in outer_web_mock.latest_requests())
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_downloads_block_chunks_from_all_peers(
+    file_blockchain_with_five_block_chunks, blockchain_directory2, outer_web_mock, pv_network_address
+):
+    source = file_blockchain_with_five_block_chunks
+    target = FileBlockchain(base_directory=blockchain_directory2)
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator():
+        register_not_found(outer_web_mock, 'http://testserver/')
+        register_block_chunks(source, outer_web_mock, PEER_NETWORK_ADDRESS)
+        network_address = sync_from_network(
+            target, ['http://testserver/', PEER_NETWORK_ADDRESS], max_workers=2, full_history=True
+        )
+
+    assert network_address == 'http://testserver/'
+    assert_blockchain_content(target, (-1,), tuple(range(14)))
+    assert_iter_equal_except_meta(source.yield_blocks(), target.yield_blocks())
+
+    downloads = get_downloads(outer_web_mock)
+    for block_chunk_meta in source.yield_block_chunks_meta():
+        path = f'/blockchain/{block_chunk_meta.blockchain_root_relative_file_path}'
+        # Every block chunk is downloaded from the peer exactly once
+        assert downloads[('peer.non-existing-domain:8555', path)] == 1
+        assert downloads[('pv.non-existing-domain:8555', path)] == 0
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_resumes_and_fails_over_to_block_chunk_urls(
+    file_blockchain_with_five_block_chunks, blockchain_directory2, outer_web_mock, pv_network_address
+):
+    source = file_blockchain_with_five_block_chunks
+    target = FileBlockchain(base_directory=blockchain_directory2)
+    target.add_blockchain_state(source.get_first_blockchain_state())
+    for block in source.yield_blocks_slice(0, 3):
+        target.add_block(block)
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator():
+        register_not_found(outer_web_mock, 'http://testserver/')
+        register_not_found(outer_web_mock, PEER_NETWORK_ADDRESS)
+        sync_from_network(target, ['http://testserver/', PEER_NETWORK_ADDRESS], full_history=True)
+
+    assert_blockchain_content(target, (-1,), tuple(range(14)))
+    assert_iter_equal_except_meta(source.yield_blocks(), target.yield_blocks())
+
+    downloads = get_downloads(outer_web_mock)
+    assert sorted(path for (host, path), count in downloads.items() if host == 'pv.non-existing-domain:8555') == [
+        '/blockchain/block-chunks/0/0/0/0/0/0/0/0/00000000000000000003-00000000000000000005-block-chunk.msgpack.gz',
+        '/blockchain/block-chunks/0/0/0/0/0/0/0/0/00000000000000000006-00000000000000000008-block-chunk.msgpack.gz',
+        '/blockchain/block-chunks/0/0/0/0/0/0/0/0/00000000000000000009-00000000000000000011-block-chunk.msgpack.gz',
+        '/blockchain/block-chunks/0/0/0/0/0/0/0/0/00000000000000000012-xxxxxxxxxxxxxxxxxxxx-block-chunk.msgpack',
+    ]
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_downloads_tampered_block_chunk_again(
+    file_blockchain_with_five_block_chunks, blockchain_directory2, outer_web_mock, pv_network_address
+):
+    source = file_blockchain_with_five_block_chunks
+    target = FileBlockchain(base_directory=blockchain_directory2)
+
+    block_chunk_meta = list(source.yield_block_chunks_meta())[1]
+    blocks = [Block.from_messagepack(block.to_messagepack()) for block in source.yield_blocks_slice(3, 5)]
+    blocks[1].message.timestamp += timedelta(seconds=1)
+    binary_data = b''.join(block.to_messagepack() for block in blocks)
+    compressor = get_compressor_from_location(block_chunk_meta.absolute_file_path)
+    tampered_path = f'blockchain/{block_chunk_meta.blockchain_root_relative_file_path}'
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator():
+        register_not_found(outer_web_mock, 'http://testserver/')
+        register_block_chunks(source, outer_web_mock, PEER_NETWORK_ADDRESS)
+        outer_web_mock.register_uri(
+            outer_web_mock.GET,
+            f'{PEER_NETWORK_ADDRESS}{tampered_path}',
+            body=COMPRESSION_FUNCTIONS[compressor](binary_data) if compressor else binary_data,
+            adding_headers={'Content-Type': 'application/octet-stream'}
+        )
+        sync_from_network(target, ['http://testserver/', PEER_NETWORK_ADDRESS], full_history=True)
+
+    assert_blockchain_content(target, (-1,), tuple(range(14)))
+    assert_iter_equal_except_meta(source.yield_blocks(), target.yield_blocks())
+
+    downloads = get_downloads(outer_web_mock)
+    assert downloads[('peer.non-existing-domain:8555', f'/{tampered_path}')] == 1
+    # The tampered block chunk is downloaded again from the node it is advertised by
+    assert downloads[('pv.non-existing-domain:8555', f'/{tampered_path}')] == 1
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_keeps_target_if_sync_from_newer_blockchain_state_fails(
+    file_blockchain_with_five_block_chunks, blockchain_directory2, outer_web_mock, pv_network_address
+):
+    source = file_blockchain_with_five_block_chunks
+    target = FileBlockchain(base_directory=blockchain_directory2)
+    target.add_blockchain_state(source.get_first_blockchain_state())
+    for block in source.yield_blocks_slice(0, 2):
+        target.add_block(block)
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator(), \
+            patch.object(NodeClient, 'read_block_chunk', side_effect=ConnectionError):
+        with pytest.raises(ConnectionError):
+            sync_from_network(target, ['http://testserver/'])
+
+    assert_blockchain_content(target, (-1,), (0, 1, 2))
+    assert_iter_equal_except_meta(source.yield_blocks_slice(0, 2), target.yield_blocks())
+    parent_directory, name = os.path.split(blockchain_directory2)
+    assert [item for item in os.listdir(parent_directory) if item.startswith(f'{name}.')] == []
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_starts_from_last_blockchain_state(
+    file_blockchain_with_five_block_chunks, blockchain_directory2, outer_web_mock, pv_network_address
+):
+    source = file_blockchain_with_five_block_chunks
+    target = FileBlockchain(base_directory=blockchain_directory2)
+    target.add_blockchain_state(source.get_first_blockchain_state())
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator():
+        sync_from_network(target, ['http://testserver/'])
+
+    source_last_blockchain_state = source.get_last_blockchain_state()
+    assert_iter_equal_except_meta((source_last_blockchain_state,), (target.get_last_blockchain_state(),))
+    assert target.get_blockchain_state_count() == 1
+    assert_iter_equal_except_meta(
+        source.yield_blocks_from(source_last_blockchain_state.last_block_number + 1), target.yield_blocks()
+    )
+
+
+@pytest.mark.usefixtures('node_mock_for_node_client')
+def test_sync_from_network_starts_from_last_full_blockchain_state(
+    file_blockchain, blockchain_directory2, outer_web_mock, pv_network_address, treasury_account_key_pair
+):
+    source = file_blockchain
+    with patch.object(source, '_blockchain_state_max_delta_depth', 2), \
+            patch.object(source, 'snapshot_period_in_blocks', 2):
+        add_blocks(source, 10, treasury_account_key_pair.private)
+
+    # Blockchain states 1, 3, 7 and 9 are stored as deltas
+    assert source.get_blockchain_state_index()[0] == [-1, 1, 3, 5, 7, 9]
+    assert source.get_full_blockchain_state_index()[0] == [-1, 5]
+
+    target = FileBlockchain(base_directory=blockchain_directory2)
+    target.add_blockchain_state(source.get_first_blockchain_state())
+
+    with force_file_blockchain(source, outer_web_mock, pv_network_address), as_primary_validator():
+        sync_from_network(target, ['http://testserver/'])
+
+    source_blockchain_state = source.get_blockchain_state_by_block_number(5, inclusive=True)
+    assert_iter_equal_except_meta((source_blockchain_state,), (target.get_last_blockchain_state(),))
+    assert_iter_equal_except_meta(source.yield_blocks_from(6), target.yield_blocks())
+    target.validate()
@@ -0,0 +1,106 @@
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Optional
+
+from thenewboston_node.business_logic.blockchain.base import BlockchainBase
+from thenewboston_node.business_logic.blockchain.base.audit import AuditCheckpoint
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.core.logging import validates
+
+logger = logging.getLogger(__name__)
+
+# Blockchain instances of worker processes (they are reused for all segments validated by a process)
+_worker_blockchains: dict[str, BlockchainBase] = {}
+
+
+def get_worker_blockchain(blockchain_class: str, blockchain_kwargs: dict[str, Any]) -> BlockchainBase:
+    key = repr((blockchain_class, sorted(blockchain_kwargs.items())))
+    blockchain = _worker_blockchains.get(key)
+    if blockchain is None:
+        blockchain = BlockchainBase.make_instance(blockchain_class, blockchain_kwargs)
+        _worker_blockchains[key] = blockchain
+
+    return blockchain
+
+
+def audit_segment(blockchain_class, blockchain_kwargs, start_block_number, end_block_number):
+    blockchain = get_worker_blockchain(blockchain_class, blockchain_kwargs)
+    try:
+        return blockchain.audit_segment(start_block_number, end_block_number)
+    except ValidationError as ex:
+        # Exceptions are passed to the parent process pickled by their args, so the segment and the validation
+        # context (which is logged in this process only) are put into the message
+        end = 'the last block' if end_block_number is None else f'block number {end_block_number}'
+        context = ''.join(f'{target}: ' for target in reversed(ex.targets))
+        raise ValidationError(f'Segment after block number {start_block_number} up to {end}: {context}{ex}') from ex
+
+
+def yield_segments(blockchain: BlockchainBase, start_block_number):
+    """
+    Yield `(start_block_number, end_block_number)` of segments between blockchain states (starting with
+    `start_block_number` one). The last segment ends with the last block (`end_block_number` is None)
+    """
+    for last_block_number in blockchain.yield_blockchain_state_last_block_numbers():
+        if last_block_number > start_block_number:
+            yield start_block_number, last_block_number
+            start_block_number = last_block_number
+
+    yield start_block_number, None
+
+
+@validates('BLOCKCHAIN (parallel audit)')
+def audit_in_parallel(
+    blockchain_class: str,
+    blockchain_kwargs: dict[str, Any],
+    jobs: int,
+    *,
+    is_partial_allowed: bool = True,
+    checkpoint_file_path: Optional[str] = None,
+    progress_callback=None
+):
+    """
+    Audit blockchain (see `BlockchainBase.audit()`) validating segments between blockchain states in `jobs`
+    processes. Every process makes its own blockchain instance of `blockchain_class` with `blockchain_kwargs`,
+    so they must reproduce the same blockchain in another process (as `FileBlockchain` kwargs do).
+
+    Segments are validated against their starting blockchain states, so hash links between segments (and
+    blockchain states being consistent with each other) are checked once segments are validated.
+    """
+    blockchain = BlockchainBase.make_instance(blockchain_class, blockchain_kwargs)
+    checkpoint = None if checkpoint_file_path is None else AuditCheckpoint(checkpoint_file_path)
+    start_blockchain_state = blockchain.get_audit_start_blockchain_state(is_partial_allowed, checkpoint)
+
+    def submit(segment):
+        return segment, executor.submit(audit_segment, blockchain_class, blockchain_kwargs, *segment)
+
+    expected_block_identifier = start_blockchain_state.next_block_identifier
+    segments_iter = yield_segments(blockchain, start_blockchain_state.last_block_number)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Not more than `2 * jobs` segments are queued to keep the pool busy without listing all segments upfront
+        futures = deque(map(submit, islice(segments_iter, jobs * 2)))
+        try:
+            while futures:
+                (start_block_number, end_block_number), future = futures.popleft()
+                start_block_identifier, last_block_number, next_block_identifier = future.result()
+                futures.extend(map(submit, islice(segments_iter, 1)))
+
+                with validates(f'segment boundary at block number {start_block_number}'):
+                    if start_block_identifier != expected_block_identifier:
+                        raise ValidationError(
+                            'Blockchain state next_block_identifier does not match previous segment last block hash'
+                        )
+
+                expected_block_identifier = next_block_identifier
+                if checkpoint and end_block_number is not None:
+                    checkpoint.write(end_block_number, next_block_identifier)
+
+                if progress_callback:
+                    progress_callback(last_block_number)
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+    blockchain.validate_has_declared_node()
+    blockchain.validate_has_pv_schedule()
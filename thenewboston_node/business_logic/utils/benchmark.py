@@ -0,0 +1,426 @@
+"""
+Benchmarks of blockchain hot paths. Results are plain JSON serializable dicts, so they can be stored and compared
+between commits (see `compare_benchmark_results()`).
+"""
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Optional
+
+from rest_framework.test import APIClient
+
+from thenewboston_node.business_logic.blockchain.base import BlockchainBase
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models import Block, CoinTransferSignedChangeRequest, Node
+from thenewboston_node.business_logic.models.node import RegularNode
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+from thenewboston_node.business_logic.utils.blockchain_state import BlockchainStateBuilder
+from thenewboston_node.core.utils.cryptography import KeyPair, derive_public_key, generate_key_pair
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+DEFAULT_REPEAT = 3
+DEFAULT_SNAPSHOT_PERIOD_IN_BLOCKS = 100
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+FIXTURE_META_FILENAME = 'benchmark-fixture.json'
+FILE_BLOCKCHAIN = 'file'
+MEMORY_BLOCKCHAIN = 'memory'
+
+# Primary validator schedule covers blocks added by benchmarks on top of fixture blocks
+EXTRA_SCHEDULED_BLOCKS = 1_000_000
+SAMPLE_ACCOUNTS_COUNT = 100
+BLOCKS_SLICE_SIZE = 100
+API_PAGE_SIZE = 20
+
+
+@dataclass
+class BenchmarkContext:
+    blockchain: BlockchainBase
+    treasury_key_pair: KeyPair
+    primary_validator_key_pair: KeyPair
+    repeat: int = DEFAULT_REPEAT
+    scratch_directory: Optional[str] = None
+    _scratch_blockchain: Optional[BlockchainBase] = field(default=None, repr=False)
+
+    def is_file_blockchain(self):
+        return isinstance(self.blockchain, FileBlockchain)
+
+    def get_scratch_blockchain(self) -> BlockchainBase:
+        """
+        Return blockchain that can be changed by a benchmark (file blockchain fixtures are kept intact to be reused)
+        """
+        if (scratch_blockchain := self._scratch_blockchain) is None:
+            blockchain = self.blockchain
+            if isinstance(blockchain, FileBlockchain):
+                assert self.scratch_directory
+                scratch_blockchain = FileBlockchain(
+                    base_directory=self.scratch_directory,
+                    snapshot_period_in_blocks=blockchain.snapshot_period_in_blocks,
+                    blockchain_state_signing_key=blockchain.blockchain_state_signing_key,
+                )
+                scratch_blockchain.copy_from(blockchain)
+            else:
+                scratch_blockchain = blockchain
+
+            self._scratch_blockchain = scratch_blockchain
+
+        return scratch_blockchain
+
+    def get_sample_accounts(self, count=SAMPLE_ACCOUNTS_COUNT):
+        accounts = sorted(self.blockchain.get_last_blockchain_state().account_states)
+        return random.Random(0).sample(accounts, min(count, len(accounts)))
+
+    def make_block(self, blockchain) -> Block:
+        signed_change_request = CoinTransferSignedChangeRequest.create_from_main_transaction(
+            blockchain=blockchain,
+            recipient=generate_key_pair().public,
+            amount=1,
+            signing_key=self.treasury_key_pair.private,
+            node=RegularNode(identifier=generate_key_pair().public, fee_amount=1, network_addresses=[]),
+        )
+        return Block.create_from_signed_change_request(
+            blockchain, signed_change_request, self.primary_validator_key_pair.private
+        )
+
+
+def measure(callable_, repeat=DEFAULT_REPEAT, operations=1, setup=None, teardown=None) -> dict:
+    """
+    Call `callable_` `repeat` times and return timings in seconds per operation (`setup` and `teardown` are not
+    timed)
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        start = perf_counter()
+        callable_()
+        timings.append((perf_counter() - start) / operations)
+
+        if teardown:
+            teardown()
+
+    return {
+        'operations': operations,
+        'timings': timings,
+        'min': min(timings),
+        'max': max(timings),
+        'mean': statistics.mean(timings),
+        'median': statistics.median(timings),
+    }
+
+
+def consume(iterable):
+    for _ in iterable:
+        pass
+
+
+def benchmark_get_account_balance(context: BenchmarkContext):
+    blockchain = context.blockchain
+    accounts = context.get_sample_accounts()
+    block_number = blockchain.get_last_block_number()
+
+    def run():
+        for account in accounts:
+            blockchain.get_account_balance(account, block_number)
+
+    return measure(run, repeat=context.repeat, operations=len(accounts))
+
+
+def benchmark_get_primary_validator(context: BenchmarkContext):
+    return measure(context.blockchain.get_primary_validator, repeat=context.repeat)
+
+
+def benchmark_yield_blocks_slice(context: BenchmarkContext):
+    blockchain = context.blockchain
+    from_block_number = max(blockchain.get_last_block_number() // 2, 0)
+    to_block_number = from_block_number + BLOCKS_SLICE_SIZE - 1
+
+    return measure(
+        lambda: consume(blockchain.yield_blocks_slice(from_block_number, to_block_number)),
+        repeat=context.repeat,
+    )
+
+
+def benchmark_generate_blockchain_state(context: BenchmarkContext):
+    return measure(context.blockchain.generate_blockchain_state, repeat=context.repeat)
+
+
+def benchmark_validate(context: BenchmarkContext):
+    return measure(context.blockchain.validate, repeat=context.repeat)
+
+
+def benchmark_audit(context: BenchmarkContext):
+    return measure(context.blockchain.audit, repeat=context.repeat)
+
+
+def benchmark_block_chunks_meta_api(context: BenchmarkContext):
+    return measure_api(context, f'/api/v1/block-chunks-meta/?limit={API_PAGE_SIZE}&ordering=-start_block_number')
+
+
+def benchmark_transactions_api(context: BenchmarkContext):
+    account = context.treasury_key_pair.public
+    return measure_api(
+        context, f'/api/v1/accounts/{account}/transactions/?limit={API_PAGE_SIZE}&ordering=-block_number'
+    )
+
+
+def measure_api(context: BenchmarkContext, url):
+    client = APIClient()
+
+    def run():
+        response = client.get(url)
+        assert response.status_code == 200, f'Unexpected response status code: {response.status_code}'
+
+    BlockchainBase.set_instance_cache(context.blockchain)
+    try:
+        return measure(run, repeat=context.repeat)
+    finally:
+        BlockchainBase.clear_instance_cache()
+
+
+def benchmark_add_block(context: BenchmarkContext):
+    blockchain = context.get_scratch_blockchain()
+    blocks = []
+
+    return measure(
+        lambda: blockchain.add_block(blocks.pop(), validate=True),
+        repeat=context.repeat,
+        setup=lambda: blocks.append(context.make_block(blockchain)),
+    )
+
+
+def benchmark_finalize_block_chunk(context: BenchmarkContext):
+    blockchain = context.get_scratch_blockchain()
+    assert isinstance(blockchain, FileBlockchain)
+    period = blockchain.snapshot_period_in_blocks
+
+    def setup():
+        # Fill the current block chunk without snapshotting (which finalizes block chunk as well)
+        blockchain.snapshot_period_in_blocks = None
+        try:
+            for _ in range(period):
+                blockchain.add_block(context.make_block(blockchain), validate=False)
+        finally:
+            blockchain.snapshot_period_in_blocks = period
+
+    def run():
+        with blockchain.file_lock:
+            blockchain.finalize_block_chunk(
+                blockchain.get_current_block_chunk_filename(), blockchain.get_last_block_number()
+            )
+
+    def teardown():
+        blockchain.add_blockchain_state(blockchain.generate_blockchain_state())
+
+    return measure(run, repeat=context.repeat, setup=setup, teardown=teardown)
+
+
+# name -> (benchmark, is file blockchain only); benchmarks changing blockchain go last, since memory blockchain is
+# changed in place
+BENCHMARKS: dict[str, tuple[Callable[[BenchmarkContext], dict], bool]] = {
+    'get_account_balance': (benchmark_get_account_balance, False),
+    'get_primary_validator': (benchmark_get_primary_validator, False),
+    'yield_blocks_slice': (benchmark_yield_blocks_slice, False),
+    'generate_blockchain_state': (benchmark_generate_blockchain_state, False),
+    'validate': (benchmark_validate, False),
+    'audit': (benchmark_audit, False),
+    'block_chunks_meta_api': (benchmark_block_chunks_meta_api, True),
+    'transactions_api': (benchmark_transactions_api, False),
+    'add_block': (benchmark_add_block, False),
+    'finalize_block_chunk': (benchmark_finalize_block_chunk, True),
+}
+
+
+def get_or_generate_file_blockchain_fixture(
+    base_directory,
+    size,
+    primary_validator_signing_key,
+    snapshot_period_in_blocks=DEFAULT_SNAPSHOT_PERIOD_IN_BLOCKS
+) -> tuple[FileBlockchain, KeyPair, KeyPair]:
+    """
+    Return file blockchain of `size` blocks of random transactions along with treasury and primary validator key
+    pairs. The blockchain is generated once and reused by later calls with the same arguments.
+    """
+    expected_meta = {
+        'size': size,
+        'snapshot_period_in_blocks': snapshot_period_in_blocks,
+        'primary_validator_signing_key': primary_validator_signing_key,
+    }
+    meta_file_path = os.path.join(base_directory, FIXTURE_META_FILENAME)
+    meta = None
+    if os.path.exists(meta_file_path):
+        with open(meta_file_path) as fo:
+            meta = json.load(fo)
+
+        if any(meta.get(key) != value for key, value in expected_meta.items()):
+            logger.warning('Benchmark fixture at %s does not match the requested parameters', base_directory)
+            meta = None
+
+    if meta is None:
+        if os.path.exists(base_directory):
+            shutil.rmtree(base_directory)
+
+        meta = dict(expected_meta, treasury_signing_key=generate_key_pair().private)
+
+    treasury_key_pair = make_key_pair(meta['treasury_signing_key'])
+    primary_validator_key_pair = make_key_pair(meta['primary_validator_signing_key'])
+    blockchain = FileBlockchain(
+        base_directory=base_directory,
+        snapshot_period_in_blocks=snapshot_period_in_blocks,
+        blockchain_state_signing_key=primary_validator_key_pair.private,
+    )
+
+    if not os.path.exists(meta_file_path):
+        logger.info('Generating benchmark fixture of %s blocks at %s', size, base_directory)
+        builder = BlockchainStateBuilder()
+        builder.set_treasury_account(treasury_key_pair.public)
+        builder.set_primary_validator(
+            Node(
+                identifier=primary_validator_key_pair.public,
+                network_addresses=['http://localhost:8555/'],
+                fee_amount=4,
+            ), 0, size + EXTRA_SCHEDULED_BLOCKS
+        )
+        blockchain.add_blockchain_state(builder.get_blockchain_state())
+        generate_blockchain(
+            blockchain,
+            size,
+            signing_key=primary_validator_key_pair.private,
+            validate=False,
+            treasury_account_key_pair=treasury_key_pair,
+        )
+
+        # Meta file is written last, so an interrupted generation is not reused
+        with open(meta_file_path, 'w') as fo:
+            json.dump(meta, fo)
+
+    return blockchain, treasury_key_pair, primary_validator_key_pair
+
+
+def make_key_pair(signing_key) -> KeyPair:
+    return KeyPair(derive_public_key(signing_key), signing_key)
+
+
+def make_memory_blockchain(source: BlockchainBase) -> MemoryBlockchain:
+    blockchain = MemoryBlockchain(
+        snapshot_period_in_blocks=source.snapshot_period_in_blocks,
+        blockchain_state_signing_key=source.blockchain_state_signing_key,
+    )
+    blockchain.add_blockchain_state(source.get_first_blockchain_state())
+    for block in source.yield_blocks():
+        blockchain.add_block(block, validate=False)
+
+    return blockchain
+
+
+def run_benchmarks(
+    fixtures_directory,
+    primary_validator_signing_key,
+    sizes=DEFAULT_SIZES,
+    blockchain_types=(FILE_BLOCKCHAIN, MEMORY_BLOCKCHAIN),
+    benchmark_names=None,
+    repeat=DEFAULT_REPEAT,
+    snapshot_period_in_blocks=DEFAULT_SNAPSHOT_PERIOD_IN_BLOCKS,
+) -> dict:
+    benchmark_names = list(BENCHMARKS) if benchmark_names is None else benchmark_names
+    unknown_names = set(benchmark_names) - set(BENCHMARKS)
+    if unknown_names:
+        raise ValueError(f'Unknown benchmarks: {", ".join(sorted(unknown_names))}')
+
+    results = []
+    for size in sizes:
+        file_blockchain, treasury_key_pair, primary_validator_key_pair = get_or_generate_file_blockchain_fixture(
+            os.path.join(fixtures_directory, f'blockchain-{size}'),
+            size,
+            primary_validator_signing_key,
+            snapshot_period_in_blocks=snapshot_period_in_blocks,
+        )
+
+        for blockchain_type in blockchain_types:
+            if blockchain_type == FILE_BLOCKCHAIN:
+                blockchain = file_blockchain
+            elif blockchain_type == MEMORY_BLOCKCHAIN:
+                blockchain = make_memory_blockchain(file_blockchain)
+            else:
+                raise ValueError(f'Unknown blockchain type: {blockchain_type}')
+
+            with tempfile.TemporaryDirectory(dir=fixtures_directory) as scratch_directory:
+                context = BenchmarkContext(
+                    blockchain=blockchain,
+                    treasury_key_pair=treasury_key_pair,
+                    primary_validator_key_pair=primary_validator_key_pair,
+                    repeat=repeat,
+                    scratch_directory=os.path.join(scratch_directory, 'blockchain'),
+                )
+                for name in BENCHMARKS:
+                    benchmark, is_file_blockchain_only = BENCHMARKS[name]
+                    if name not in benchmark_names or (is_file_blockchain_only and not context.is_file_blockchain()):
+                        continue
+
+                    logger.info('Running %s benchmark on %s blockchain of %s blocks', name, blockchain_type, size)
+                    result = benchmark(context)
+                    results.append(dict(result, benchmark=name, blockchain=blockchain_type, size=size))
+
+    return {
+        'created': datetime.utcnow().isoformat(),
+        'git_commit': get_git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                                       cwd=os.path.dirname(__file__),
+                                       stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_result_key(result):
+    return result['blockchain'], result['size'], result['benchmark']
+
+
+def compare_benchmark_results(baseline: dict, current: dict, threshold=DEFAULT_REGRESSION_THRESHOLD) -> list[dict]:
+    """
+    Return comparison of median timings of benchmarks present in both `baseline` and `current` results
+    (`is_regression` is set if the timing grew more than `threshold` fraction)
+    """
+    baseline_results = {get_result_key(result): result for result in baseline['results']}
+    comparison = []
+    for result in current['results']:
+        baseline_result = baseline_results.get(get_result_key(result))
+        if baseline_result is None:
+            continue
+
+        baseline_median = baseline_result['median']
+        median = result['median']
+        change = (median - baseline_median) / baseline_median if baseline_median else 0
+        comparison.append({
+            'benchmark': result['benchmark'],
+            'blockchain': result['blockchain'],
+            'size': result['size'],
+            'baseline_median': baseline_median,
+            'median': median,
+            'change': change,
+            'is_regression': change > threshold,
+        })
+
+    return comparison
@@ -199,4 +199,6 @@ def sync_minimal_to_file_blockchain(source: BlockchainBase, target: FileBlockcha
         os.rename(throw_away_blockchain_directory, target_base_directory)
         raise
 
+    # In-memory caches and indexes of `target` reflect the replaced directory content
+    target.clear_caches()
     shutil.rmtree(throw_away_blockchain_directory)
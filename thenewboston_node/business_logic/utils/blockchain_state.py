@@ -31,10 +31,10 @@ def read_account_root_file_source(source):
         return json.load(fo)
 
 
-def read_blockchain_state_file_from_source(source) -> Optional[BlockchainState]:
+def read_blockchain_state_file_from_source(source, open_url_function=urlopen) -> Optional[BlockchainState]:
     kwargs = {}
     if is_valid_url(source):
-        kwargs['open_function'] = urlopen
+        kwargs['open_function'] = open_url_function
 
     data = read_compressed_file(source, **kwargs)
     if data is None:
@@ -0,0 +1,239 @@
+import logging
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional
+from urllib.parse import urljoin
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.core.clients.node import NodeClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+# The last block chunk may get finalized (and therefore renamed) while being downloaded, so we retry
+SYNC_ROUNDS = 3
+
+
+def get_block_chunk_urls(block_chunk_meta, network_addresses, peer_index=0):
+    """
+    Return URLs to download block chunk from starting with `peer_index` peer, so downloads of different block
+    chunks are spread among peers. URLs advertised by the block chunk meta source node go last
+    """
+    url_path = block_chunk_meta['url_path']
+    urls = []
+    if url_path:
+        count = len(network_addresses)
+        for index in range(count):
+            urls.append(urljoin(network_addresses[(peer_index + index) % count], url_path))
+
+    urls.extend(block_chunk_meta['urls'] or ())
+    return list(dict.fromkeys(urls))
+
+
+def get_sync_source(node_client: NodeClient, network_addresses) -> tuple[Optional[str], Optional[dict]]:
+    for network_address in network_addresses:
+        meta = node_client.get_latest_blockchain_state_meta_by_network_address(network_address)
+        if meta is not None:
+            return network_address, meta
+
+        logger.warning('Could not get latest blockchain state meta from %s', network_address)
+
+    return None, None
+
+
+def add_first_blockchain_state(node_client: NodeClient, source_network_address, target):
+    # Target blockchain is continued from its last block, so a blockchain state is needed only to start with
+    if target.get_blockchain_state_count() == 0:
+        blockchain_state = node_client.get_first_blockchain_state_by_network_address(source_network_address)
+        if blockchain_state is None:
+            raise ConnectionError(f'Could not read first blockchain state from {source_network_address}')
+
+        target.add_blockchain_state(blockchain_state)
+
+
+def get_newer_blockchain_state(node_client: NodeClient, source_network_address, blockchain_state_meta, target):
+    """
+    Return the latest blockchain state of `source_network_address` node if it is newer than the last blockchain
+    state of `target`, otherwise return None
+    """
+    target_bs_last_block_number = target.get_last_blockchain_state_last_block_number()
+    source_bs_last_block_number = blockchain_state_meta['last_block_number']
+    logger.debug(
+        'Blockchain state last block numbers (source: %s, target: %s)', source_bs_last_block_number,
+        target_bs_last_block_number
+    )
+    if source_bs_last_block_number <= target_bs_last_block_number:
+        return None
+
+    blockchain_state = node_client.get_latest_blockchain_state_by_network_address(source_network_address)
+    if blockchain_state is None:
+        raise ConnectionError(f'Could not read latest blockchain state from {source_network_address}')
+
+    return blockchain_state
+
+
+def read_block_chunk(node_client: NodeClient, urls, start_block_number, end_block_number):
+    """
+    Download block chunk from the first of `urls` that serves it. Return blocks and URLs that were not tried yet
+    (to download the block chunk again if its blocks turn out to be invalid)
+    """
+    for index, url in enumerate(urls):
+        try:
+            blocks = node_client.read_block_chunk([url], start_block_number, end_block_number)
+        except ConnectionError:
+            continue
+
+        return blocks, urls[index + 1:]
+
+    raise ConnectionError(f'Could not read block chunk from any of {urls}')
+
+
+def add_block_chunk_blocks(
+    node_client: NodeClient, target: FileBlockchain, block_chunk_meta, blocks, urls, from_block_number
+) -> int:
+    """
+    Add `blocks` starting from `from_block_number` to `target`. If a block is invalid then download the block
+    chunk again from the next of `urls` and continue from the invalid block. Return next block number
+    """
+    while True:
+        try:
+            for block in blocks:
+                block_number = block.get_block_number()
+                if block_number < from_block_number:
+                    continue
+
+                logger.debug('Adding block %s', block_number)
+                target.add_block(block)
+                from_block_number = block_number + 1
+
+            return from_block_number
+        except ValidationError:
+            if not urls:
+                raise
+
+            logger.warning(
+                'Invalid block %s, downloading block chunk again from other nodes', from_block_number, exc_info=True
+            )
+
+        blocks, urls = read_block_chunk(
+            node_client, urls, block_chunk_meta['start_block_number'], block_chunk_meta['end_block_number']
+        )
+
+
+def add_block_chunks(
+    node_client: NodeClient, target: FileBlockchain, block_chunks_meta, network_addresses, from_block_number,
+    max_workers
+):
+    """
+    Download block chunks with a pool of `max_workers` threads and add their blocks to `target` in order.
+    Not more than `2 * max_workers` downloaded block chunks are kept in memory
+    """
+
+    def submit(index_and_block_chunk_meta):
+        index, block_chunk_meta = index_and_block_chunk_meta
+        urls = get_block_chunk_urls(block_chunk_meta, network_addresses, index)
+        future = executor.submit(
+            read_block_chunk,
+            node_client,
+            urls,
+            block_chunk_meta['start_block_number'],
+            block_chunk_meta['end_block_number'],
+        )
+        return block_chunk_meta, future
+
+    block_chunks_meta_iter = enumerate(block_chunks_meta)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque(map(submit, islice(block_chunks_meta_iter, max_workers * 2)))
+        try:
+            while futures:
+                block_chunk_meta, future = futures.popleft()
+                blocks, urls = future.result()
+                futures.extend(map(submit, islice(block_chunks_meta_iter, 1)))
+                from_block_number = add_block_chunk_blocks(
+                    node_client, target, block_chunk_meta, blocks, urls, from_block_number
+                )
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+
+def sync_block_chunks(
+    node_client: NodeClient, target: FileBlockchain, source_network_address, network_addresses, max_workers
+):
+    error = None
+    for _ in range(SYNC_ROUNDS):
+        from_block_number = target.get_last_block_number() + 1
+        try:
+            block_chunks_meta = list(
+                node_client.yield_block_chunks_meta_by_network_address(
+                    source_network_address, from_block_number=from_block_number
+                )
+            )
+            logger.debug('Syncing %s block chunk(s) from block %s', len(block_chunks_meta), from_block_number)
+            add_block_chunks(node_client, target, block_chunks_meta, network_addresses, from_block_number, max_workers)
+            return
+        except ConnectionError as ex:
+            logger.warning('Could not sync block chunks from block %s', from_block_number, exc_info=True)
+            error = ex
+
+    assert error
+    raise error
+
+
+def sync_from_network(
+    target: FileBlockchain,
+    network_addresses,
+    *,
+    max_workers=DEFAULT_MAX_WORKERS,
+    full_history=False,
+    node_client=None
+) -> str:
+    """
+    Make `target` contain the last blockchain state of the first available node of `network_addresses` (in
+    order of preference) and all blocks after it. If `full_history` is true then `target` starts with the first
+    (genesis) blockchain state instead and gets all blocks, so it can serve the entire blockchain.
+
+    Block chunks are downloaded in parallel from all `network_addresses` (failing over to other nodes), but
+    blocks are added (and validated) in order, so an interrupted synchronization resumes from the last added
+    block. Return network address of the node blockchain state and block chunks meta are taken from.
+    """
+    # TODO(dmu) CRITICAL: Take about blockchain forks: if blockchain states are on the same block number,
+    #                    but the blockchain states actually differ with their content
+    node_client = node_client or NodeClient.get_instance()
+    network_addresses = list(network_addresses)
+
+    source_network_address, blockchain_state_meta = get_sync_source(node_client, network_addresses)
+    if source_network_address is None:
+        raise ConnectionError('Could not reach any node to synchronize with')
+
+    if full_history:
+        add_first_blockchain_state(node_client, source_network_address, target)
+        sync_block_chunks(node_client, target, source_network_address, network_addresses, max_workers)
+        return source_network_address
+
+    blockchain_state = get_newer_blockchain_state(node_client, source_network_address, blockchain_state_meta, target)
+    if blockchain_state is None:
+        # Target blockchain is consistent, so it is just continued (an interrupted sync resumes from its last block)
+        sync_block_chunks(node_client, target, source_network_address, network_addresses, max_workers)
+        return source_network_address
+
+    # TODO(dmu) HIGH: Do not just replace target blockchain because we might need the entire blockchain and
+    #                 just fill the gaps later
+    # Target blockchain is replaced only after the sync into a temporary blockchain succeeds, so a failure does not
+    # leave target blockchain with a blockchain state but without blocks
+    temporary_blockchain = FileBlockchain(
+        base_directory='{}.{}'.format(target.get_base_directory(), int(time.time() * 100000))
+    )
+    try:
+        temporary_blockchain.add_blockchain_state(blockchain_state)
+        sync_block_chunks(node_client, temporary_blockchain, source_network_address, network_addresses, max_workers)
+        target.copy_from(temporary_blockchain)
+    finally:
+        temporary_blockchain.close()
+        shutil.rmtree(temporary_blockchain.get_base_directory(), ignore_errors=True)
+
+    return source_network_address
@@ -1,16 +1,22 @@
 import json
 import logging
+from functools import partial
+from threading import Lock
 from typing import Generator, Optional, Type, TypeVar
-from urllib.parse import urlencode, urljoin
-from urllib.request import urlopen
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from django.conf import settings
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from thenewboston_node.business_logic import models
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
 from thenewboston_node.business_logic.blockchain.file_blockchain.sources import URLBlockSource
 from thenewboston_node.business_logic.utils.blockchain_state import read_blockchain_state_file_from_source
 from thenewboston_node.core.constants import PRIMARY_VALIDATOR_NODE_ID, SELF_NODE_ID
+from thenewboston_node.core.utils.http_utils import open_url
 from thenewboston_node.core.utils.types import hexstr
 
 logger = logging.getLogger(__name__)
@@ -18,6 +24,40 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T', bound='NodeClient')
 
 DEFAULT_TIMEOUT = 2
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Block chunks meta are listed by pages of the maximum size allowed by the API
+BLOCK_CHUNKS_META_PAGE_SIZE = 20
+
+# Timeouts of downloading files are not resources, but they are configured the same way
+BLOCK_CHUNK_DOWNLOAD = 'block-chunk-download'
+BLOCKCHAIN_STATE_DOWNLOAD = 'blockchain-state-download'
+
+DEFAULT_TIMEOUTS = {
+    # (connect timeout, read timeout) tuples are also supported
+    'default': DEFAULT_TIMEOUT,
+    BLOCK_CHUNK_DOWNLOAD: (DEFAULT_TIMEOUT, 30),
+    BLOCKCHAIN_STATE_DOWNLOAD: (DEFAULT_TIMEOUT, 120),
+}
+
+
+def validate_block_chunk_block_numbers(blocks, start_block_number=None, end_block_number=None):
+    if not blocks:
+        raise ValueError('Block chunk is empty')
+
+    expected_block_number = blocks[0].get_block_number() if start_block_number is None else start_block_number
+    for block in blocks:
+        block_number = block.get_block_number()
+        if block_number != expected_block_number:
+            raise ValueError(f'Expected block number {expected_block_number}, got {block_number}')
+
+        expected_block_number += 1
+
+    if end_block_number is not None and expected_block_number <= end_block_number:
+        raise ValueError(f'Block chunk ends at {expected_block_number - 1} instead of {end_block_number}')
 
 
 def setdefault_if_not_none(dict_, key, value):
@@ -25,26 +65,49 @@ def setdefault_if_not_none(dict_, key, value):
         dict_.setdefault(key, value)
 
 
-def requests_get(url, *args, **kwargs):
+def requests_get(url, *args, session=None, **kwargs):
     # We need this function to mock it easier for unittests
     kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
-    return requests.get(url, *args, **kwargs)
+    return (session or requests).get(url, *args, **kwargs)
 
 
-def requests_post(url, *args, **kwargs):
+def requests_post(url, *args, session=None, **kwargs):
     # We need this function to mock it easier for unittests
     kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
-    return requests.post(url, *args, **kwargs)
+    return (session or requests).post(url, *args, **kwargs)
 
 
 class NodeClient:
+    """
+    Client keeps a `requests.Session` per network address, so requests to the same node reuse keep-alive
+    connections from the session pool (up to `pool_maxsize` connections per node). Idempotent requests are retried
+    with exponential backoff on connection errors and `RETRY_STATUS_CODES`. `timeouts` maps resource names
+    (or `BLOCK_CHUNK_DOWNLOAD` and `BLOCKCHAIN_STATE_DOWNLOAD`) to timeouts overriding `DEFAULT_TIMEOUTS`
+    """
     _instance = None
 
+    def __init__(
+        self,
+        *,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        max_retries=DEFAULT_MAX_RETRIES,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+        timeouts=None
+    ):
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+
+        self._sessions: dict[tuple[str, str], requests.Session] = {}
+        self._sessions_lock = Lock()
+
     @classmethod
     def get_instance(cls: Type[T]) -> T:
         instance = cls._instance
         if not instance:
-            instance = cls()
+            # Client must be framework agnostic, so Django settings are optional and only override the defaults
+            instance = cls(**(getattr(settings, 'NODE_CLIENT', {}) if settings.configured else {}))
             cls.set_instance_cache(instance)
 
         return instance
@@ -57,15 +120,53 @@ class NodeClient:
     def clear_instance_cache(cls):
         cls._instance = None
 
-    @staticmethod
-    def http_get(network_address, resource, *, parameters=None, should_raise=True):
+    def make_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self, url) -> requests.Session:
+        split_url = urlsplit(url)
+        key = (split_url.scheme, split_url.netloc)
+        if (session := self._sessions.get(key)) is None:
+            with self._sessions_lock:
+                if (session := self._sessions.get(key)) is None:
+                    self._sessions[key] = session = self.make_session()
+
+        return session
+
+    def close(self):
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def get_timeout(self, resource):
+        timeouts = self.timeouts
+        return timeouts.get(resource, timeouts['default'])
+
+    def open_url(self, url, resource, headers=None):
+        return open_url(url, session=self.get_session(url), timeout=self.get_timeout(resource), headers=headers)
+
+    def http_get(self, network_address, resource, *, parameters=None, should_raise=True):
         # We do not use reverse() because client must be framework agnostic
         url = urljoin(network_address, f'/api/v1/{resource}/')
         if parameters:
             url += '?' + urlencode(parameters)
 
         try:
-            response = requests_get(url)
+            response = requests_get(url, session=self.get_session(url), timeout=self.get_timeout(resource))
         except Exception:
             logger.warning('Could not GET %s', url, exc_info=True)
             if should_raise:
@@ -92,13 +193,14 @@ class NodeClient:
 
         return data
 
-    @staticmethod
-    def http_post(network_address, resource, json_data, *, should_raise=True):
+    def http_post(self, network_address, resource, json_data, *, should_raise=True):
         # TODO(dmu) HIGH: Make http_post() DRY with http_get()
         url = urljoin(network_address, f'/api/v1/{resource}/')
 
         try:
-            response = requests_post(url, json=json_data)
+            response = requests_post(
+                url, json=json_data, session=self.get_session(url), timeout=self.get_timeout(resource)
+            )
         except Exception:
             logger.warning('Could not POST %s, data: %s', url, json_data, exc_info=True)
             if should_raise:
@@ -145,9 +247,14 @@ class NodeClient:
     def list_nodes(self, network_address, offset=None, limit=None):
         return self.list_resource(network_address, 'nodes', offset=offset, limit=limit)
 
-    def get_latest_blockchain_state_meta_by_network_address(self, network_address) -> Optional[dict]:
+    def get_blockchain_state_meta_by_network_address(self, network_address, direction=-1) -> Optional[dict]:
+        assert direction in (1, -1)
         data = self.list_resource(
-            network_address, 'blockchain-states-meta', limit=1, ordering='-last_block_number', should_raise=False
+            network_address,
+            'blockchain-states-meta',
+            limit=1,
+            ordering='last_block_number' if direction == 1 else '-last_block_number',
+            should_raise=False
         )
         if not data:
             return None
@@ -158,6 +265,9 @@ class NodeClient:
 
         return results[0]
 
+    def get_latest_blockchain_state_meta_by_network_address(self, network_address) -> Optional[dict]:
+        return self.get_blockchain_state_meta_by_network_address(network_address, direction=-1)
+
     def get_latest_blockchain_state_binary_by_network_address(self, network_address) -> Optional[tuple[bytes, str]]:
         meta = self.get_latest_blockchain_state_meta_by_network_address(network_address)
         if meta is None:
@@ -166,7 +276,7 @@ class NodeClient:
         for url in meta['urls']:
             logger.debug('Trying to get blockchain state binary from %s', url)
             try:
-                with urlopen(url) as fo:
+                with self.open_url(url, BLOCKCHAIN_STATE_DOWNLOAD) as fo:
                     return fo.read(), url
             except IOError:
                 logger.warning('Unable to read blockchain state from %s', url, exc_info=True)
@@ -174,21 +284,31 @@ class NodeClient:
 
         return None
 
-    def get_latest_blockchain_state_by_network_address(self, network_address) -> Optional[models.BlockchainState]:
-        meta = self.get_latest_blockchain_state_meta_by_network_address(network_address)
+    def get_blockchain_state_by_network_address(self,
+                                                network_address,
+                                                direction=-1) -> Optional[models.BlockchainState]:
+        meta = self.get_blockchain_state_meta_by_network_address(network_address, direction=direction)
         if meta is None:
             return None
 
         for url in meta['urls']:
             try:
-                return read_blockchain_state_file_from_source(url)
+                return read_blockchain_state_file_from_source(
+                    url, open_url_function=partial(self.open_url, resource=BLOCKCHAIN_STATE_DOWNLOAD)
+                )
             except IOError:
                 logger.warning('Unable to read blockchain state from %s', url, exc_info=True)
                 continue
 
-        logger.warning('Could not read latest blockchain state from node: %s', network_address)
+        logger.warning('Could not read blockchain state from node: %s', network_address)
         return None
 
+    def get_latest_blockchain_state_by_network_address(self, network_address) -> Optional[models.BlockchainState]:
+        return self.get_blockchain_state_by_network_address(network_address, direction=-1)
+
+    def get_first_blockchain_state_by_network_address(self, network_address) -> Optional[models.BlockchainState]:
+        return self.get_blockchain_state_by_network_address(network_address, direction=1)
+
     def get_latest_blockchain_state_meta_by_network_addresses(self, network_addresses) -> Optional[dict]:
         for network_address in network_addresses:
             # TODO(dmu) CRITICAL: Try another network_address only if this one is unavailable
@@ -238,14 +358,70 @@ class NodeClient:
 
         return self.get_latest_blockchain_state_meta_by_network_addresses(network_addresses)
 
+    def yield_block_chunks_meta_by_network_address(
+        self, network_address, from_block_number=None, to_block_number=None
+    ) -> Generator[dict, None, None]:
+        offset = 0
+        while True:
+            block_chunks = self.list_block_chunks_meta_by_network_address(
+                network_address,
+                from_block_number=from_block_number,
+                to_block_number=to_block_number,
+                offset=offset,
+                limit=BLOCK_CHUNKS_META_PAGE_SIZE,
+            )
+            if block_chunks is None:
+                raise ConnectionError(f'Could not list block chunks meta at {network_address}')
+
+            yield from block_chunks
+            if len(block_chunks) < BLOCK_CHUNKS_META_PAGE_SIZE:
+                break
+
+            offset += len(block_chunks)
+
+    def list_all_block_chunks_meta_by_network_address(
+        self, network_address, from_block_number=None, to_block_number=None
+    ) -> Optional[list[dict]]:
+        try:
+            return list(
+                self.yield_block_chunks_meta_by_network_address(
+                    network_address, from_block_number=from_block_number, to_block_number=to_block_number
+                )
+            )
+        except ConnectionError:
+            logger.warning('Could not list block chunks meta', exc_info=True)
+            return None
+
+    def read_block_chunk(self, urls, start_block_number=None, end_block_number=None) -> list[models.Block]:
+        """
+        Download block chunk from the first of `urls` that serves it. Block numbers of the downloaded block chunk
+        must be consecutive and cover `start_block_number` to `end_block_number` (the last block chunk may grow
+        while being downloaded, so it may contain more blocks)
+        """
+        timeout = self.get_timeout(BLOCK_CHUNK_DOWNLOAD)
+        for url in urls:
+            logger.debug('Trying to download block chunk from %s', url)
+            source = URLBlockSource(url, session=self.get_session(url), timeout=timeout)
+            try:
+                blocks = list(source)
+                validate_block_chunk_block_numbers(blocks, start_block_number, end_block_number)
+            except Exception:
+                logger.warning('Unable to read block chunk from %s', url, exc_info=True)
+                continue
+            finally:
+                source.close()
+
+            return blocks
+
+        raise ConnectionError(f'Could not read block chunk from any of {urls}')
+
     def yield_blocks_slice(self, network_address, from_block_number: int,
                            to_block_number: int) -> Generator[models.Block, None, None]:
-        # TODO(dmu) MEDIUM: Consider improvements for network failovers
         # by the moment of downloading the last (incomplete) block chunk its name may change
         # (because of becoming complete) therefore we retry
         last_block_number = None
         for _ in range(2):
-            block_chunks = self.list_block_chunks_meta_by_network_address(
+            block_chunks = self.list_all_block_chunks_meta_by_network_address(
                 network_address, from_block_number=from_block_number, to_block_number=to_block_number
             )
             if block_chunks is None:
@@ -253,16 +429,13 @@ class NodeClient:
                 continue
 
             for block_chunk in block_chunks:
-                # TODO(dmu) HIGH: Support download from more than one URL
-                url = block_chunk['urls'][0]
-                source = URLBlockSource(url)
                 try:
-                    source.force_read()
-                except Exception:
-                    logger.warning('Error trying to download %s', url)
+                    blocks = self.read_block_chunk(block_chunk['urls'], block_chunk['start_block_number'])
+                except ConnectionError:
+                    logger.warning('Error trying to download block chunk', exc_info=True)
                     break
 
-                for block in URLBlockSource(url):
+                for block in blocks:
                     block_number = block.get_block_number()
                     if from_block_number is not None and block_number < from_block_number:
                         # TODO(dmu) LOW: This can be optimized by applying the codition only to first block chunk
@@ -334,11 +507,10 @@ class NodeClient:
         else:
             raise ConnectionError(f'Could not send block confirmation to {node}')
 
-    @staticmethod
-    def get_node_by_identifier(network_address, identifier):
+    def get_node_by_identifier(self, network_address, identifier):
         url = urljoin(network_address, f'/api/v1/nodes/{identifier}/')
         try:
-            response = requests_get(url)
+            response = requests_get(url, session=self.get_session(url), timeout=self.get_timeout('nodes'))
             response.raise_for_status()
         except requests.exceptions.RequestException:
             return None
@@ -1,5 +1,4 @@
 import copy
-from functools import partial
 
 from django_filters import FilterSet, NumberFilter
 from rest_framework.filters import OrderingFilter
@@ -55,6 +54,6 @@ class AdvanceIteratorNumberFilter(NumberFilter):
         if value is None:
             return qs
 
-        # TODO(dmu) MEDIUM: Improve filtering performance to avoid traversal of unneeded items
-        qs.add_filter(partial(self.filter_function, filter_value=value))
+        # Range filters supported by the source are passed down to it to avoid traversal of unneeded items
+        qs.add_query_filter(self.field_name, value, self.filter_function)
         return qs
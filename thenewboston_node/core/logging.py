@@ -110,6 +110,9 @@ class validates:
         self.logger.log(self.level, '%s %s valid', upper_first(target), 'are' if self.is_plural_target else 'is')
 
     def log_validation_failed(self, target, exception):
+        if isinstance(exception, ValidationError):
+            exception.targets.append(target)
+
         exc_str = str(exception) if isinstance(exception, ValidationError) else repr(exception)
         self.logger.log(
             logging.WARNING, '%s %s invalid: %s', upper_first(target), 'are' if self.is_plural_target else 'is',
@@ -0,0 +1,94 @@
+import json
+import os.path
+
+from django.core.management import BaseCommand, CommandError
+
+from thenewboston_node.business_logic.node import get_node_signing_key
+from thenewboston_node.business_logic.utils.benchmark import (
+    BENCHMARKS, DEFAULT_REGRESSION_THRESHOLD, DEFAULT_REPEAT, DEFAULT_SIZES, DEFAULT_SNAPSHOT_PERIOD_IN_BLOCKS,
+    FILE_BLOCKCHAIN, MEMORY_BLOCKCHAIN, compare_benchmark_results, run_benchmarks
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark blockchain hot paths and write results as JSON'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Numbers of blocks of benchmarked blockchains'
+        )
+        parser.add_argument(
+            '--blockchain-types',
+            nargs='+',
+            choices=(FILE_BLOCKCHAIN, MEMORY_BLOCKCHAIN),
+            default=(FILE_BLOCKCHAIN, MEMORY_BLOCKCHAIN)
+        )
+        parser.add_argument('--benchmarks', nargs='+', choices=tuple(BENCHMARKS), help='Run only these benchmarks')
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+        parser.add_argument('--snapshot-period-in-blocks', type=int, default=DEFAULT_SNAPSHOT_PERIOD_IN_BLOCKS)
+        parser.add_argument(
+            '--fixtures-directory',
+            default='local/benchmark-fixtures',
+            help='Directory to keep generated blockchains in (they are reused by later runs)'
+        )
+        parser.add_argument('--output', '-o', help='Write results JSON to the file instead of stdout')
+        parser.add_argument('--compare', help='Compare results with results JSON of a previous run')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=DEFAULT_REGRESSION_THRESHOLD,
+            help='Median timing growth fraction considered a regression'
+        )
+        parser.add_argument(
+            '--fail-on-regression', action='store_true', help='Exit with error if a regression is detected'
+        )
+
+    def handle(
+        self, sizes, blockchain_types, benchmarks, repeat, snapshot_period_in_blocks, fixtures_directory, output,
+        compare, threshold, fail_on_regression, *args, **options
+    ):
+        if repeat < 1:
+            raise CommandError('repeat must be a positive number')
+
+        baseline = None
+        if compare:
+            with open(compare) as fo:
+                baseline = json.load(fo)
+
+        fixtures_directory = os.path.abspath(fixtures_directory)
+        os.makedirs(fixtures_directory, exist_ok=True)
+        results = run_benchmarks(
+            fixtures_directory,
+            # API end-points require this node to be declared in the blockchain
+            get_node_signing_key(),
+            sizes=sizes,
+            blockchain_types=blockchain_types,
+            benchmark_names=benchmarks,
+            repeat=repeat,
+            snapshot_period_in_blocks=snapshot_period_in_blocks,
+        )
+
+        results_json = json.dumps(results, indent=4)
+        if output:
+            with open(output, 'w') as fo:
+                fo.write(results_json)
+        else:
+            self.stdout.write(results_json)
+
+        if baseline is None:
+            return
+
+        regressions = []
+        for item in compare_benchmark_results(baseline, results, threshold=threshold):
+            if item['is_regression']:
+                regressions.append(item)
+
+            # Comparison is written to stderr to keep stdout a valid JSON
+            self.stderr.write(
+                '{benchmark} ({blockchain}, {size} blocks): {baseline_median:.6f}s -> {median:.6f}s '
+                '({change:+.1%}){marker}'.format(**item, marker=' REGRESSION' if item['is_regression'] else ''),
+                style_func=None,
+            )
+
+        if regressions and fail_on_regression:
+            raise CommandError(f'Detected {len(regressions)} regression(s)')
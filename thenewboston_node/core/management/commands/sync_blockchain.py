@@ -2,12 +2,11 @@ import logging
 
 from django.core.management import BaseCommand
 
-from thenewboston_node.business_logic.blockchain.api_blockchain import APIBlockchain
 from thenewboston_node.business_logic.blockchain.base import BlockchainBase
 from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
 from thenewboston_node.business_logic.node import get_node_identifier
-from thenewboston_node.business_logic.utils.blockchain import sync_minimal_to_file_blockchain
 from thenewboston_node.business_logic.utils.network import get_ranked_nodes
+from thenewboston_node.business_logic.utils.sync import DEFAULT_MAX_WORKERS, sync_from_network
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +14,17 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Sync blockchain'  # noqa: A003
 
-    def handle(self, *args, **options):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=DEFAULT_MAX_WORKERS, help='Number of block chunks downloaded in parallel'
+        )
+        parser.add_argument(
+            '--full-history',
+            action='store_true',
+            help='Download all blocks since the genesis blockchain state instead of the last blockchain state only'
+        )
+
+    def handle(self, *args, workers, full_history, **options):
         blockchain = BlockchainBase.get_instance()
         assert isinstance(blockchain, FileBlockchain)
 
@@ -27,24 +36,18 @@ class Command(BaseCommand):
             logger.info(message)
             return
 
-        # TODO(dmu) MEDIUM: Consider an option to synchronize blockchain with all nodes on the network
-        #                   in case a chosen node is stale
-        for node in nodes:
-            for network_address in node.network_addresses:
-                source = APIBlockchain(network_address=network_address)
-                try:
-                    sync_minimal_to_file_blockchain(source, blockchain)
-                    message = f'Successfully synchronized blockchain with {network_address}'
-                    self.stdout.write(message)
-                    logger.info(message)
-                    return
-                except Exception:
-                    logger.warning(
-                        'Could not synchronize blockchain with %s at %s',
-                        node.identifier,
-                        network_address,
-                        exc_info=True
-                    )
-
-        logger.error('Could not synchronize blockchain with the network')
-        # TODO(dmu) MEDIUM: Figure out what to do if no other node is operational
+        # Block chunks are downloaded from all nodes, while the blockchain state and block chunks meta are taken
+        # from the first available node in the ranking
+        network_addresses = [network_address for node in nodes for network_address in node.network_addresses]
+        try:
+            network_address = sync_from_network(
+                blockchain, network_addresses, max_workers=workers, full_history=full_history
+            )
+        except Exception:
+            logger.error('Could not synchronize blockchain with the network', exc_info=True)
+            # TODO(dmu) MEDIUM: Figure out what to do if no other node is operational
+            return
+
+        message = f'Successfully synchronized blockchain with {network_address}'
+        self.stdout.write(message)
+        logger.info(message)
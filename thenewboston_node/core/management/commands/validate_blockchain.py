@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from tqdm import tqdm
+
+from thenewboston_node.business_logic.blockchain.base import BlockchainBase
+from thenewboston_node.business_logic.utils.audit import audit_in_parallel
+
+
+class Command(BaseCommand):
+    help = 'Validate blockchain'  # noqa: A003
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--checkpoint',
+            help='File to save the last verified blockchain state to, so an interrupted validation is resumed'
+        )
+        parser.add_argument(
+            '--jobs',
+            '-j',
+            type=int,
+            default=1,
+            help='Number of processes to validate segments between blockchain states in parallel'
+        )
+
+    def handle(self, *args, checkpoint, jobs, **options):
+        if jobs < 1:
+            raise CommandError('jobs must be a positive number')
+
+        blockchain = BlockchainBase.get_instance()
+
+        with tqdm(total=blockchain.get_next_block_number(), unit='block') as progress_bar:
+
+            def progress_callback(block_number):
+                progress_bar.update(block_number + 1 - progress_bar.n)
+
+            if jobs == 1:
+                blockchain.audit(checkpoint_file_path=checkpoint, progress_callback=progress_callback)
+            else:
+                # Blockchain kwargs are already complemented by `BlockchainBase.get_instance()`
+                blockchain_settings = settings.BLOCKCHAIN
+                audit_in_parallel(
+                    blockchain_settings['class'],
+                    blockchain_settings.get('kwargs') or {},
+                    jobs,
+                    checkpoint_file_path=checkpoint,
+                    progress_callback=progress_callback
+                )
+
+        self.stdout.write('Blockchain is valid')
@@ -8,3 +8,8 @@ import pytest
 @pytest.fixture
 def blockchain_management_command():
     return partial(call_command, 'blockchain')
+
+
+@pytest.fixture
+def benchmark_management_command():
+    return partial(call_command, 'benchmark')
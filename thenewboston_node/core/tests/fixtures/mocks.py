@@ -65,6 +65,10 @@ def client_method_wrapper(function, original_function, url, *args, **kwargs):
     else:
         return original_function(url, *args, **kwargs)
 
+    # Connection options are irrelevant for Django test client
+    kwargs.pop('session', None)
+    kwargs.pop('timeout', None)
+
     # Convert `json` to `data`
     json_ = kwargs.pop('json', None)
     if json_ is not None:
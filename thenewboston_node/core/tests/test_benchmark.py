@@ -0,0 +1,86 @@
+import json
+from io import StringIO
+
+from django.core.management import CommandError
+
+import pytest
+
+from thenewboston_node.business_logic.utils.benchmark import BENCHMARKS
+
+
+def run_benchmark(benchmark_management_command, directory, *args, **kwargs):
+    output_file_path = str(directory / 'results.json')
+    benchmark_management_command(
+        '--sizes',
+        '5',
+        '--repeat',
+        '1',
+        '--snapshot-period-in-blocks',
+        '3',
+        '--fixtures-directory',
+        str(directory / 'fixtures'),
+        '--output',
+        output_file_path,
+        *args,
+        **kwargs,
+    )
+    with open(output_file_path) as fo:
+        return json.load(fo)
+
+
+def test_benchmark(benchmark_management_command, tmp_path):
+    results = run_benchmark(benchmark_management_command, tmp_path)
+
+    assert results['repeat'] == 1
+    keys = {(result['blockchain'], result['benchmark']) for result in results['results']}
+    assert keys == ({('file', name) for name in BENCHMARKS} | {
+        ('memory', name) for name in BENCHMARKS if name not in ('block_chunks_meta_api', 'finalize_block_chunk')
+    })
+    for result in results['results']:
+        assert result['size'] == 5
+        assert len(result['timings']) == 1
+        assert result['median'] > 0
+
+
+def test_benchmark_compare(benchmark_management_command, tmp_path):
+    baseline = run_benchmark(
+        benchmark_management_command, tmp_path, '--benchmarks', 'get_primary_validator', '--blockchain-types', 'file'
+    )
+    baseline_file_path = tmp_path / 'baseline.json'
+    with open(baseline_file_path, 'w') as fo:
+        baseline['results'][0]['median'] = 1000
+        json.dump(baseline, fo)
+
+    stderr = StringIO()
+    run_benchmark(
+        benchmark_management_command,
+        tmp_path,
+        '--benchmarks',
+        'get_primary_validator',
+        '--blockchain-types',
+        'file',
+        '--compare',
+        str(baseline_file_path),
+        '--fail-on-regression',
+        stderr=stderr,
+    )
+    assert 'get_primary_validator (file, 5 blocks)' in stderr.getvalue()
+    assert 'REGRESSION' not in stderr.getvalue()
+
+    with open(baseline_file_path, 'w') as fo:
+        baseline['results'][0]['median'] = 1e-12
+        json.dump(baseline, fo)
+
+    with pytest.raises(CommandError, match='Detected 1 regression'):
+        run_benchmark(
+            benchmark_management_command,
+            tmp_path,
+            '--benchmarks',
+            'get_primary_validator',
+            '--blockchain-types',
+            'file',
+            '--compare',
+            str(baseline_file_path),
+            '--fail-on-regression',
+            stderr=StringIO(),
+        )
@@ -1,4 +1,6 @@
-from thenewboston_node.core.utils.cryptography import derive_public_key, generate_key_pair
+from thenewboston_node.core.utils.cryptography import (
+    derive_public_key, generate_key_pair, generate_signature, verify_signatures
+)
 
 
 def test_generate_key_pair():
@@ -11,3 +13,19 @@ def test_generate_key_pair():
     derived_public = derive_public_key(key_pair.private)
     assert derived_public == key_pair.public
     assert derived_public is not key_pair.public
+
+
+def test_verify_signatures():
+    key_pair = generate_key_pair()
+    items = []
+    for number in range(10):
+        message = f'message {number}'.encode()
+        signature = generate_signature(key_pair.private, message)
+        items.append((key_pair.public, message if number % 3 else b'other message', signature))
+
+    items.append(('not a hex', b'message', '00'))
+    expected = [bool(number % 3) for number in range(10)] + [False]
+    assert verify_signatures(items) == expected
+    assert verify_signatures(items, batch_size=3) == expected
+    assert verify_signatures(items, max_workers=1) == expected
+    assert verify_signatures([]) == []
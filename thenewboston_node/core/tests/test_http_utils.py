@@ -0,0 +1,23 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from thenewboston_node.core.utils.http_utils import HTTPResponseStream
+
+
+@pytest.mark.parametrize(
+    'exception', (
+        ProtocolError('Connection broken: IncompleteRead(4 bytes read, 6 more expected)'),
+        ReadTimeoutError(None, 'http://node.non-existing-domain:8555/', 'Read timed out.'),
+    )
+)
+def test_http_response_stream_raises_io_error_on_mid_body_failure(exception):
+    response = requests.Response()
+    response.raw = Mock(read=Mock(side_effect=[b'part', exception]))
+    stream = HTTPResponseStream(response)
+
+    assert stream.read(4) == b'part'
+    with pytest.raises(IOError):
+        stream.read()
@@ -1,3 +1,5 @@
+from functools import partial
+
 from thenewboston_node.core.utils.itertools import AdvancedIterator, LazyReversed
 
 ZERO_TO_NINE_TUPLE = tuple(range(10))
@@ -183,3 +185,71 @@ def test_advanced_iterator_slice_then_filter():
     sliced = iter_[:5]
     sliced.add_filter(lambda x: x % 2 == 0)
     assert tuple(sliced) == (0, 2, 4)
+
+
+def test_advanced_iterator_sliceable_source():
+    requested_slices = []
+
+    def slicer(slice_):
+        requested_slices.append(slice_)
+        return iter(ZERO_TO_NINE_TUPLE[slice_])
+
+    def reversed_slicer(slice_):
+        requested_slices.append(slice_)
+        return iter(ZERO_TO_NINE_TUPLE[::-1][slice_])
+
+    assert tuple(AdvancedIterator(slicer)) == ZERO_TO_NINE_TUPLE
+    assert requested_slices == [slice(None)]
+
+    requested_slices.clear()
+    assert tuple(AdvancedIterator(slicer, reversed_source=reversed_slicer)[2:5]) == (2, 3, 4)
+    assert requested_slices == [slice(2, 5)]
+
+    requested_slices.clear()
+    assert tuple(reversed(AdvancedIterator(slicer, reversed_source=reversed_slicer))[2:5]) == (7, 6, 5)
+    assert requested_slices == [slice(2, 5)]
+
+    requested_slices.clear()
+    assert tuple(reversed(AdvancedIterator(slicer, reversed_source=reversed_slicer)[2:5])) == (4, 3, 2)
+    assert requested_slices == [slice(2, 5)]
+
+    assert tuple(AdvancedIterator(slicer)[1:8][2:5]) == (3, 4, 5)
+
+    iter_ = AdvancedIterator(slicer)
+    iter_.add_filter(lambda x: x % 2 == 0)
+    assert tuple(iter_[1:3]) == (2, 4)
+
+
+def test_advanced_iterator_query_filters():
+    requested = []
+
+    def slicer(slice_, direction=1, greater_than=None):
+        requested.append((slice_, greater_than))
+        items = [item for item in ZERO_TO_NINE_TUPLE if greater_than is None or item > greater_than]
+        return iter(items[::direction][slice_])
+
+    def make_iterator():
+        return AdvancedIterator(slicer, reversed_source=partial(slicer, direction=-1), query_filters=('greater_than',))
+
+    def is_greater_than(item, filter_value):
+        return item > filter_value
+
+    iter_ = make_iterator()
+    iter_.add_query_filter('greater_than', 3, is_greater_than)
+    assert not iter_.filters
+    assert tuple(iter_[1:3]) == (5, 6)
+    assert requested == [(slice(1, 3), 3)]
+
+    requested.clear()
+    iter_ = reversed(make_iterator())
+    iter_.add_query_filter('greater_than', 3, is_greater_than)
+    assert tuple(iter_[1:3]) == (8, 7)
+    assert requested == [(slice(1, 3), 3)]
+
+    # Falls back to item by item filtering for unsupported filters
+    requested.clear()
+    iter_ = make_iterator()
+    iter_.add_query_filter('less_than', 3, lambda item, filter_value: item < filter_value)
+    assert len(iter_.filters) == 1
+    assert tuple(iter_) == (0, 1, 2)
+    assert requested == [(slice(None), None)]
@@ -1,8 +1,14 @@
+from unittest.mock import patch
 from urllib.parse import urljoin
 
 import pytest
+from urllib3.exceptions import ProtocolError
+from urllib3.response import HTTPResponse
 
 from thenewboston_node.business_logic.tests.base import as_primary_validator, force_blockchain, force_file_blockchain
+from thenewboston_node.core.clients.node import (
+    BLOCK_CHUNK_DOWNLOAD, DEFAULT_MAX_RETRIES, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, NodeClient
+)
 
 
 def test_get_latest_blockchain_state_meta_by_network_address(
@@ -269,3 +275,80 @@ def test_is_node_online(
     with force_blockchain(file_blockchain_with_five_block_chunks), as_primary_validator():
         is_online = node_client.is_node_online(['http://testserver/'], expected_identifier=identifier)
         assert is_online is is_online_expected
+
+
+def test_node_client_reuses_session_per_network_address():
+    node_client = NodeClient(pool_maxsize=4)
+    session = node_client.get_session('http://node1.non-existing-domain:8555/api/v1/nodes/')
+    assert node_client.get_session('http://node1.non-existing-domain:8555/blockchain/block-chunks/') is session
+    assert node_client.get_session('http://node2.non-existing-domain:8555/api/v1/nodes/') is not session
+    assert session.get_adapter('http://node1.non-existing-domain:8555/')._pool_maxsize == 4
+
+    node_client.close()
+    assert node_client.get_session('http://node1.non-existing-domain:8555/api/v1/nodes/') is not session
+
+
+def test_node_client_timeouts():
+    node_client = NodeClient(timeouts={'nodes': 5, BLOCK_CHUNK_DOWNLOAD: (1, 2)})
+    assert node_client.get_timeout('nodes') == 5
+    assert node_client.get_timeout('block-chunks-meta') == DEFAULT_TIMEOUT
+    assert node_client.get_timeout(BLOCK_CHUNK_DOWNLOAD) == (1, 2)
+
+
+def test_node_client_get_instance_settings_override_defaults(settings):
+    NodeClient.clear_instance_cache()
+    try:
+        settings.NODE_CLIENT = {'max_retries': 1}
+        node_client = NodeClient.get_instance()
+        assert node_client.max_retries == 1
+        assert node_client.pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+        NodeClient.clear_instance_cache()
+        del settings.NODE_CLIENT
+        assert NodeClient.get_instance().max_retries == DEFAULT_MAX_RETRIES
+    finally:
+        NodeClient.clear_instance_cache()
+
+
+def test_node_client_retries_unavailable_node(outer_web_mock):
+    url = 'http://node.non-existing-domain:8555/api/v1/nodes/'
+    outer_web_mock.register_uri(
+        outer_web_mock.GET,
+        url,
+        responses=[
+            outer_web_mock.Response(body='', status=503),
+            outer_web_mock.Response(body='{"count": 0, "results": []}'),
+        ]
+    )
+
+    node_client = NodeClient(backoff_factor=0)
+    assert node_client.list_nodes('http://node.non-existing-domain:8555/') == {'count': 0, 'results': []}
+    assert len(outer_web_mock.latest_requests()) == 2
+
+
+def test_node_client_tries_next_url_on_mid_body_failure(outer_web_mock):
+    urls = [
+        'http://node1.non-existing-domain:8555/blockchain/blockchain-states/0.msgpack',
+        'http://node2.non-existing-domain:8555/blockchain/blockchain-states/0.msgpack',
+    ]
+    for url in urls:
+        outer_web_mock.register_uri(outer_web_mock.GET, url, body=b'blockchain state')
+
+    original_read = HTTPResponse.read
+    reads = []
+
+    def read(self, *args, **kwargs):
+        reads.append(self)
+        if len(reads) == 1:
+            raise ProtocolError('Connection broken: IncompleteRead(0 bytes read, 16 more expected)')
+
+        return original_read(self, *args, **kwargs)
+
+    node_client = NodeClient()
+    with patch.object(node_client, 'get_latest_blockchain_state_meta_by_network_address', return_value={'urls': urls}):
+        with patch.object(HTTPResponse, 'read', autospec=True, side_effect=read):
+            binary_data = node_client.get_latest_blockchain_state_binary_by_network_address(
+                'http://node1.non-existing-domain:8555/'
+            )
+
+    assert binary_data == (b'blockchain state', urls[1])
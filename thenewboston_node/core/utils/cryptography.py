@@ -1,6 +1,9 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from hashlib import sha3_256
-from typing import NamedTuple
+from itertools import chain
+from typing import NamedTuple, Optional, Sequence
 
 from nacl.exceptions import CryptoError
 from nacl.signing import SigningKey, VerifyKey
@@ -8,6 +11,8 @@ from nacl.signing import SigningKey, VerifyKey
 from thenewboston_node.core.utils.misc import bytes_to_hex, hex_to_bytes
 from thenewboston_node.core.utils.types import hexstr
 
+SIGNATURE_VERIFICATION_BATCH_SIZE = 256
+
 
 class KeyPair(NamedTuple):
     public: hexstr
@@ -22,21 +27,47 @@ def derive_public_key(signing_key: hexstr):
     return bytes_to_hex(SigningKey(hex_to_bytes(signing_key)).verify_key)
 
 
+@lru_cache(maxsize=1024)
+def get_verify_key(verify_key: hexstr) -> VerifyKey:
+    return VerifyKey(hex_to_bytes(verify_key))
+
+
 def is_signature_valid(verify_key: hexstr, message: bytes, signature: hexstr) -> bool:
     try:
-        verify_key_bytes = hex_to_bytes(verify_key)
+        verify_key_obj = get_verify_key(verify_key)
         signature_bytes = hex_to_bytes(signature)
     except ValueError:
         return False
 
     try:
-        VerifyKey(verify_key_bytes).verify(message, signature_bytes)
+        verify_key_obj.verify(message, signature_bytes)
     except CryptoError:
         return False
 
     return True
 
 
+def _are_signatures_valid(items: Sequence[tuple[hexstr, bytes, hexstr]]) -> list[bool]:
+    return [is_signature_valid(verify_key, message, signature) for verify_key, message, signature in items]
+
+
+def verify_signatures(
+    items: Sequence[tuple[hexstr, bytes, hexstr]],
+    max_workers: Optional[int] = None,
+    batch_size: int = SIGNATURE_VERIFICATION_BATCH_SIZE
+) -> list[bool]:
+    """
+    Return signature validity flags for `(verify_key, message, signature)` items. Items are verified in batches
+    by a thread pool: libsodium calls release GIL, so verification uses every core.
+    """
+    if len(items) <= batch_size or max_workers == 1:
+        return _are_signatures_valid(items)
+
+    batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='signature-verification') as executor:
+        return list(chain.from_iterable(executor.map(_are_signatures_valid, batches)))
+
+
 def normalize_dict(dict_: dict) -> bytes:
     return json.dumps(dict_, separators=(',', ':'), sort_keys=True).encode('utf-8')
 
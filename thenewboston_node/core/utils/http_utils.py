@@ -0,0 +1,59 @@
+from urllib.request import Request, urlopen
+
+import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+
+
+class HTTPResponseStream:
+    """
+    File-like object over not decoded body of streamed `requests` response (the same way `urlopen()` returns it).
+    Connection is returned to the session pool once the body is read to the end. Errors raised while reading the
+    body are converted to `requests` exceptions (as `Response.iter_content()` does), so they are `IOError`
+    subclasses like the ones raised by `urlopen()` responses
+    """
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+
+    @property
+    def status(self):
+        return self.response.status_code
+
+    def read(self, size=-1):
+        try:
+            return self.response.raw.read(None if size is None or size < 0 else size)
+        except ProtocolError as ex:
+            raise requests.exceptions.ChunkedEncodingError(ex)
+        except DecodeError as ex:
+            raise requests.exceptions.ContentDecodingError(ex)
+        except ReadTimeoutError as ex:
+            raise requests.exceptions.ConnectionError(ex)
+        except SSLError as ex:
+            raise requests.exceptions.SSLError(ex)
+
+    def close(self):
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def open_url(url, *, session: requests.Session = None, timeout=None, headers=None):
+    """
+    Open `url` for reading with `session` (to reuse pooled connections) or with `urlopen()` if session is not
+    provided. HTTP errors are raised as `IOError` subclasses in both cases
+    """
+    if session is None:
+        return urlopen(Request(url, headers=headers or {}), **({} if timeout is None else {'timeout': timeout}))
+
+    response = session.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+
+    return HTTPResponseStream(response)
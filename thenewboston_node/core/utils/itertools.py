@@ -1,11 +1,14 @@
 import logging
 from collections.abc import Iterator, Reversible
+from functools import partial
 from itertools import islice
 
 from more_itertools import always_reversible
 
 logger = logging.getLogger(__name__)
 
+FULL_SLICE = slice(None)
+
 
 class FilteringNextMixin:
 
@@ -44,16 +47,55 @@ class LazyFiltered(FilteringNextMixin, Iterator):
         self.filters = filters
 
 
-class AdvancedIterator(FilteringNextMixin, Iterator, Reversible):
+class SliceableSource(Iterator):
+    """
+    Iterator over `slicer(slice_, **query)`, where `slicer` is a callable returning an iterator over a slice of
+    items, so the iterator can be sliced and queried (before it is started) without traversing sliced or filtered
+    out items. `query` is keyword arguments (range filters) understood by the particular `slicer`
+    """
 
-    def __init__(self, source, *, reversed_source=None, filters=None, count=None):
-        self.source = source
-        self._reversed_source = reversed_source
+    def __init__(self, slicer, slice_=FULL_SLICE, query=None):
+        self.slicer = slicer
+        self.slice_ = slice_
+        self.query = query or {}
+        self._iterator = None
+
+    def is_sliceable(self):
+        return self._iterator is None and self.slice_ == FULL_SLICE
+
+    def slice(self, slice_):  # noqa: A003
+        assert self.is_sliceable()
+        return self.__class__(self.slicer, slice_, self.query)
+
+    def filter(self, **query):  # noqa: A003
+        # Filtering must be applied before slicing to keep the meaning of the slice
+        assert self.is_sliceable()
+        return self.__class__(self.slicer, self.slice_, dict(self.query, **query))
+
+    def __next__(self):
+        if (iterator := self._iterator) is None:
+            self._iterator = iterator = iter(self.slicer(self.slice_, **self.query))
+
+        return next(iterator)
+
+
+class AdvancedIterator(FilteringNextMixin, Iterator, Reversible):
+    """
+    `source` and `reversed_source` are iterators or callables accepting `slice` object and returning an iterator
+    over the slice (see `SliceableSource`) to allow implementation specific optimizations for slicing.
+    `query_filters` are names of keyword arguments (range filters) the callables also accept, so
+    `add_query_filter()` can pass them down instead of checking items one by one
+    """
+
+    def __init__(self, source, *, reversed_source=None, filters=None, count=None, query_filters=()):
+        self.source = SliceableSource(source) if callable(source) else source
+        self._reversed_source = SliceableSource(reversed_source) if callable(reversed_source) else reversed_source
         if filters and count is not None:
             raise NotImplementedError('`filters` and `count` are not compatible')
 
         self._count = count
         self.filters = filters or []
+        self.query_filters = query_filters
 
     def count(self):
         # TODO(dmu) LOW: Implement low performance count (if count argument is not provided) that works
@@ -81,10 +123,12 @@ class AdvancedIterator(FilteringNextMixin, Iterator, Reversible):
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            # TODO(dmu) MEDIUM: Support callable `source` argument to propagate `slice` object intto, so to allow
-            #                   implementation specific optimizations for slicing
             source = self.source
             filters = self.filters
+            if not filters and isinstance(source, SliceableSource) and source.is_sliceable():
+                sliced = source.slice(item)
+                return self.clone(source=sliced, reversed_source=LazyReversed(sliced))
+
             if filters:
                 source = LazyFiltered(source, filters)
 
@@ -110,9 +154,32 @@ class AdvancedIterator(FilteringNextMixin, Iterator, Reversible):
 
         self.filters.append(filter_function)
 
+    def is_queryable(self, name):
+        if name not in self.query_filters:
+            return False
+
+        sources = (self.source, self._reversed_source)
+        return all(isinstance(source, SliceableSource) and source.is_sliceable() for source in sources)
+
+    def add_query_filter(self, name, value, filter_function):
+        """
+        Filter by `name` range filter `value` passing it to the sources if they support it, otherwise
+        `filter_function(item, filter_value=value)` is used to check items one by one
+        """
+        if self._count is not None:
+            raise NotImplementedError('Cannot add filter to an iterator with count')
+
+        if not self.is_queryable(name):
+            self.add_filter(partial(filter_function, filter_value=value))
+            return
+
+        self.source = self.source.filter(**{name: value})
+        self._reversed_source = self._reversed_source.filter(**{name: value})
+
     def clone(self, **kwargs):
         kwargs.setdefault('source', self.source)
         kwargs.setdefault('reversed_source', self.reversed_source)
         kwargs.setdefault('filters', self.filters.copy())
         kwargs.setdefault('count', self._count)
+        kwargs.setdefault('query_filters', self.query_filters)
         return self.__class__(**kwargs)
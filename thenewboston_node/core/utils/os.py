@@ -13,3 +13,25 @@ def chmod_quite(path, mode):
         os.chmod(path, mode)
     except Exception:
         pass
+
+
+def fsync_directory(directory):
+    """
+    Fsync directory, so created, renamed or removed directory entries survive a crash (power loss)
+    """
+    fd = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_durably(source, destination):
+    """
+    Replace `destination` file with `source` file, so the new content survives a crash (power loss)
+    """
+    with open(source, 'rb') as fo:
+        os.fsync(fo.fileno())
+
+    os.replace(source, destination)
+    fsync_directory(os.path.dirname(destination))
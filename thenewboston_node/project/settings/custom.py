@@ -18,6 +18,10 @@ NETWORK = {
     'kwargs': {},
 }
 
+# NodeClient keyword arguments overriding its defaults: `pool_maxsize`, `max_retries`, `backoff_factor` and
+# `timeouts` (resource name to timeout in seconds (or (connect timeout, read timeout) tuple) mapping)
+NODE_CLIENT: dict = {}
+
 MEMO_MAX_LENGTH = 64
 
 FASTER_UNITTESTS = False